@@ -178,6 +178,10 @@ Task Utilities
 
    Deck
    HashMethod
+   Compression
+   Columnar
+   Lazy
+   Offload
 
 Documentation
 =============
@@ -205,6 +209,8 @@ else:
 from flytekit.core.base_sql_task import SQLTask
 from flytekit.core.base_task import SecurityContext, TaskMetadata, kwtypes
 from flytekit.core.checkpointer import Checkpoint
+from flytekit.core.columnar import Columnar
+from flytekit.core.compression import Compression
 from flytekit.core.condition import conditional
 from flytekit.core.container_task import ContainerTask
 from flytekit.core.context_manager import ExecutionParameters, FlyteContext, FlyteContextManager
@@ -212,8 +218,10 @@ from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.gate import approve, sleep, wait_for_input
 from flytekit.core.hash import HashMethod
 from flytekit.core.launch_plan import LaunchPlan, reference_launch_plan
+from flytekit.core.lazy import Lazy
 from flytekit.core.map_task import map_task
 from flytekit.core.notification import Email, PagerDuty, Slack
+from flytekit.core.offloading import Offload
 from flytekit.core.pod_template import PodTemplate
 from flytekit.core.python_function_task import PythonFunctionTask, PythonInstanceTask
 from flytekit.core.reference import get_reference_entity
@@ -158,6 +158,11 @@ def _dispatch_execute(
 
     ctx.file_access.put_data(ctx.execution_state.engine_dir, output_prefix, is_multipart=True)
     logger.info(f"Engine folder written successfully to the output prefix {output_prefix}")
+
+    # The summary is written once the engine folder is uploaded, so that it covers the upload of the outputs too
+    summary_path = os.path.join(ctx.execution_state.engine_dir, _constants.TRANSFER_METRICS_FILE_NAME)
+    ctx.file_access.transfer_metrics.write_summary(summary_path)
+    ctx.file_access.put_data(summary_path, os.path.join(output_prefix, _constants.TRANSFER_METRICS_FILE_NAME))
     logger.debug("Finished _dispatch_execute")
 
     if os.environ.get("FLYTE_FAIL_ON_ERROR", "").lower() == "true" and _constants.ERROR_FILE_NAME in output_file_dict:
@@ -293,7 +298,9 @@ def _handle_annotated_task(
     """
     Entrypoint for all PythonTask extensions
     """
-    _dispatch_execute(ctx, task_def, inputs, output_prefix)
+    # The summary of the transfer metrics also covers the download of the inputs and the upload of the outputs
+    with ctx.file_access.transfer_metrics.scope():
+        _dispatch_execute(ctx, task_def, inputs, output_prefix)
 
 
 @_scopes.system_entry_point
@@ -546,17 +546,73 @@ class DataConfig(object):
     Any data storage specific configuration. Please do not use this to store secrets, in S3 case, as it is used in
     Flyte sandbox environment we store the access key id and secret.
     All DataPersistence plugins are passed all DataConfig and the plugin should correctly use the right config
+
+    Args:
+        transfer_concurrency: The number of files transferred in parallel when uploading or downloading a directory.
+        transfer_retries: The number of times the transfer of a single file within a directory is retried.
+        download_cache_dir: Optional node-local directory used to cache downloaded remote files across tasks and
+          processes. Caching is disabled when this is not set.
+        download_cache_max_bytes: Size cap of the download cache, least recently used entries are evicted beyond it.
+        stream_block_size: Block size of the streaming file handles returned by ``FileAccessProvider.open``. The
+          filesystem's default is used if not set.
+        stream_cache_type: fsspec read buffering strategy used by streaming file handles.
+        multipart_chunk_size: Part size used when uploading a single large file to S3 or GCS.
+        multipart_concurrency: Number of parts of a single file uploaded in parallel, for S3 compatible stores.
+        transfer_metrics_deck: Render a deck with the metrics of every data transfer made by a task.
+        content_addressed_outputs: Upload raw outputs under a key derived from their content, skipping uploads of
+            content that already exists in the raw output prefix.
+        compression_codec: Compress the blobs written by the pickle, numpy and file transformers with this codec, one
+            of gzip, zstd or lz4. Blobs are decompressed transparently when read. Files uploaded to a remote_path
+            given by the user are never compressed.
+        local_hardlinks: Hardlink files moved between local paths, for example between the sandbox and a local raw
+            output prefix, instead of cloning or copying them. Linked files share their storage, so a file that is
+            modified in place after it was written or read also changes the other copy.
+        pickle_out_of_band: Store the large buffers of pickled objects, such as NumPy arrays and Arrow tables, next to
+            the pickle stream instead of inside it, so they are memory mapped instead of copied when read. Pickles
+            written this way can only be read by versions of flytekit that support it.
     """
 
     s3: S3Config = S3Config()
     gcs: GCSConfig = GCSConfig()
+    transfer_concurrency: int = 8
+    transfer_retries: int = 2
+    download_cache_dir: typing.Optional[str] = None
+    download_cache_max_bytes: int = 10 * 2**30
+    stream_block_size: typing.Optional[int] = None
+    stream_cache_type: str = "readahead"
+    multipart_chunk_size: int = 50 * 2**20
+    multipart_concurrency: int = 4
+    transfer_metrics_deck: bool = False
+    content_addressed_outputs: bool = False
+    compression_codec: Optional[str] = None
+    local_hardlinks: bool = False
+    pickle_out_of_band: bool = False
 
     @classmethod
     def auto(cls, config_file: typing.Union[str, ConfigFile] = None) -> DataConfig:
         config_file = get_config_file(config_file)
+        kwargs = {}
+        kwargs = set_if_exists(kwargs, "transfer_concurrency", _internal.Data.TRANSFER_CONCURRENCY.read(config_file))
+        kwargs = set_if_exists(kwargs, "transfer_retries", _internal.Data.TRANSFER_RETRIES.read(config_file))
+        kwargs = set_if_exists(kwargs, "download_cache_dir", _internal.Data.DOWNLOAD_CACHE_DIR.read(config_file))
+        kwargs = set_if_exists(
+            kwargs, "download_cache_max_bytes", _internal.Data.DOWNLOAD_CACHE_MAX_BYTES.read(config_file)
+        )
+        kwargs = set_if_exists(kwargs, "stream_block_size", _internal.Data.STREAM_BLOCK_SIZE.read(config_file))
+        kwargs = set_if_exists(kwargs, "stream_cache_type", _internal.Data.STREAM_CACHE_TYPE.read(config_file))
+        kwargs = set_if_exists(kwargs, "multipart_chunk_size", _internal.Data.MULTIPART_CHUNK_SIZE.read(config_file))
+        kwargs = set_if_exists(kwargs, "multipart_concurrency", _internal.Data.MULTIPART_CONCURRENCY.read(config_file))
+        kwargs = set_if_exists(kwargs, "transfer_metrics_deck", _internal.Data.TRANSFER_METRICS_DECK.read(config_file))
+        kwargs = set_if_exists(
+            kwargs, "content_addressed_outputs", _internal.Data.CONTENT_ADDRESSED_OUTPUTS.read(config_file)
+        )
+        kwargs = set_if_exists(kwargs, "compression_codec", _internal.Data.COMPRESSION_CODEC.read(config_file))
+        kwargs = set_if_exists(kwargs, "local_hardlinks", _internal.Data.LOCAL_HARDLINKS.read(config_file))
+        kwargs = set_if_exists(kwargs, "pickle_out_of_band", _internal.Data.PICKLE_OUT_OF_BAND.read(config_file))
         return DataConfig(
             s3=S3Config.auto(config_file),
             gcs=GCSConfig.auto(config_file),
+            **kwargs,
         )
 
 
@@ -57,6 +57,75 @@ class GCP(object):
     GSUTIL_PARALLELISM = ConfigEntry(LegacyConfigEntry(SECTION, "gsutil_parallelism", bool))
 
 
+class Data(object):
+    SECTION = "data"
+    TRANSFER_CONCURRENCY = ConfigEntry(LegacyConfigEntry(SECTION, "transfer_concurrency", int))
+    """
+    The number of files that are transferred concurrently when uploading or downloading a directory.
+    """
+
+    TRANSFER_RETRIES = ConfigEntry(LegacyConfigEntry(SECTION, "transfer_retries", int))
+    """
+    The number of times the transfer of an individual file in a directory is retried before giving up.
+    """
+
+    DOWNLOAD_CACHE_DIR = ConfigEntry(LegacyConfigEntry(SECTION, "download_cache_dir"))
+    """
+    If set, remote files fetched through ``get_data`` are cached in this node-local directory, keyed on the remote URI
+    and the object's ETag/generation, so that other tasks on the same node can read them from local disk.
+    """
+
+    DOWNLOAD_CACHE_MAX_BYTES = ConfigEntry(LegacyConfigEntry(SECTION, "download_cache_max_bytes", int))
+    """
+    The maximum size of the download cache. Least recently used entries are evicted once it is exceeded.
+    """
+
+    STREAM_BLOCK_SIZE = ConfigEntry(LegacyConfigEntry(SECTION, "stream_block_size", int))
+    """
+    The block size, in bytes, of the streaming file handles returned by ``FileAccessProvider.open``.
+    """
+
+    STREAM_CACHE_TYPE = ConfigEntry(LegacyConfigEntry(SECTION, "stream_cache_type"))
+    """
+    The fsspec read buffering strategy used by streaming file handles, e.g. ``readahead``, ``blockcache`` or ``none``.
+    """
+
+    MULTIPART_CHUNK_SIZE = ConfigEntry(LegacyConfigEntry(SECTION, "multipart_chunk_size", int))
+    """
+    The part size, in bytes, used when uploading a single large file to an object store.
+    """
+
+    MULTIPART_CONCURRENCY = ConfigEntry(LegacyConfigEntry(SECTION, "multipart_concurrency", int))
+    """
+    The number of parts of a single large file that are uploaded in parallel, where the object store supports it.
+    """
+
+    TRANSFER_METRICS_DECK = ConfigEntry(LegacyConfigEntry(SECTION, "transfer_metrics_deck", bool))
+    """
+    If enabled, tasks render a deck with the metrics of every data transfer they made.
+    """
+
+    CONTENT_ADDRESSED_OUTPUTS = ConfigEntry(LegacyConfigEntry(SECTION, "content_addressed_outputs", bool))
+    """
+    If enabled, raw outputs are uploaded under a digest of their content and identical content is only uploaded once.
+    """
+
+    COMPRESSION_CODEC = ConfigEntry(LegacyConfigEntry(SECTION, "compression_codec"))
+    """
+    The codec (gzip, zstd or lz4) used to compress the blobs written by the pickle, numpy and file transformers.
+    """
+
+    LOCAL_HARDLINKS = ConfigEntry(LegacyConfigEntry(SECTION, "local_hardlinks", bool))
+    """
+    If enabled, files moved between local paths are hardlinked instead of cloned or copied.
+    """
+
+    PICKLE_OUT_OF_BAND = ConfigEntry(LegacyConfigEntry(SECTION, "pickle_out_of_band", bool))
+    """
+    If enabled, large buffers of pickled objects are stored next to the pickle stream and memory mapped when read.
+    """
+
+
 class Credentials(object):
     SECTION = "credentials"
     COMMAND = ConfigEntry(LegacyConfigEntry(SECTION, "command", list), YamlConfigEntry("admin.command", list))
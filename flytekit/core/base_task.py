@@ -32,6 +32,7 @@ from flytekit.core.context_manager import (
     FlyteEntities,
 )
 from flytekit.core.interface import Interface, transform_interface_to_typed_interface
+from flytekit.core.lazy import is_materialized, materialize
 from flytekit.core.local_cache import LocalTaskCache
 from flytekit.core.promise import (
     Promise,
@@ -399,6 +400,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         interface: Optional[Interface] = None,
         environment: Optional[Dict[str, str]] = None,
         disable_deck: bool = True,
+        lazy_inputs: bool = False,
         **kwargs,
     ):
         """
@@ -413,6 +415,8 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             environment (Optional[Dict[str, str]]): Any environment variables that should be supplied during the
                 execution of the task. Supplied as a dictionary of key/value pairs
             disable_deck (bool): If true, this task will not output deck html file
+            lazy_inputs (bool): If true, the non primitive inputs of this task are converted on first access instead of
+                before the task runs
         """
         super().__init__(
             task_type=task_type,
@@ -424,6 +428,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         self._environment = environment if environment else {}
         self._task_config = task_config
         self._disable_deck = disable_deck
+        self._lazy_inputs = lazy_inputs
         if self._python_interface.docstring:
             if self.docs is None:
                 self._docs = Documentation(
@@ -507,6 +512,13 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         * ``DynamicJobSpec`` is returned when a dynamic workflow is executed
         """
 
+        # The transfer metrics, and the transfer deck, describe this execution only
+        with ctx.file_access.transfer_metrics.scope():
+            return self._dispatch_execute(ctx, input_literal_map)
+
+    def _dispatch_execute(
+        self, ctx: FlyteContext, input_literal_map: _literal_models.LiteralMap
+    ) -> Union[_literal_models.LiteralMap, _dynamic_job.DynamicJobSpec]:
         # Invoked before the task is executed
         new_user_params = self.pre_execute(ctx.user_space_params)
         from flytekit.deck.deck import _output_deck
@@ -522,7 +534,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             # Translate the input literals to Python native
             try:
                 native_inputs = TypeEngine.literal_map_to_kwargs(
-                    exec_ctx, input_literal_map, self.python_interface.inputs
+                    exec_ctx, input_literal_map, self.python_interface.inputs, lazy=self._lazy_inputs
                 )
             except Exception as exc:
                 msg = f"Failed to convert inputs of task '{self.name}':\n  {exc}"
@@ -572,6 +584,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             # built into the IDL that all the values of a literal map are of the same type.
             literals = {}
             for i, (k, v) in enumerate(native_outputs_as_map.items()):
+                v = materialize(v)
                 literal_type = self._outputs_interface[k].type
                 py_type = self.get_type_for_output_var(k, v)
 
@@ -592,12 +605,19 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
 
                 input_deck = Deck(INPUT)
                 for k, v in native_inputs.items():
+                    # Rendering an input that was never read would download it just for the deck
+                    if not is_materialized(v):
+                        continue
+                    v = materialize(v)
                     input_deck.append(TypeEngine.to_html(ctx, v, self.get_type_for_input_var(k, v)))
 
                 output_deck = Deck(OUTPUT)
                 for k, v in native_outputs_as_map.items():
                     output_deck.append(TypeEngine.to_html(ctx, v, self.get_type_for_output_var(k, v)))
 
+                if ctx.file_access.data_config.transfer_metrics_deck and ctx.file_access.transfer_metrics.records:
+                    Deck("transfer", ctx.file_access.transfer_metrics.to_html())
+
                 _output_deck(self.name.split(".")[-1], new_user_params)
 
             outputs_literal_map = _literal_models.LiteralMap(literals=literals)
@@ -647,6 +667,13 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         """
         return self._disable_deck
 
+    @property
+    def lazy_inputs(self) -> bool:
+        """
+        If true, the non primitive inputs of this task are converted on first access
+        """
+        return self._lazy_inputs
+
 
 class TaskResolverMixin(object):
     """
@@ -0,0 +1,145 @@
+"""
+Columnar encoding of lists of primitives. A list annotated with :py:class:`Columnar` is written as a single Arrow
+column in a blob instead of one literal per element, and its literal type is a blob of that column format, so only
+tasks that declare the same columnar list can consume it.
+"""
+import typing
+
+from typing_extensions import Annotated, get_args, get_origin
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.models.core.types import BlobType
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+from flytekit.models.types import LiteralType
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+# Prefix of the format of the blobs columns are stored in, followed by the Arrow type of the column
+COLUMNAR_FORMAT = "ArrowColumn"
+
+# Python element type -> name of the pyarrow type factory used to store it
+ARROW_TYPES: typing.Dict[type, str] = {
+    int: "int64",
+    float: "float64",
+    bool: "bool_",
+    str: "string",
+}
+
+
+class Columnar(object):
+    """
+    Flyte-specific object used to store a list of primitives as a single Arrow column instead of one literal per
+    element, for example ``Annotated[typing.List[int], Columnar()]``. The column is uploaded to a blob and memory mapped
+    when read back, as a list, or as a NumPy array when the type is annotated with ``Columnar(as_array=True)``.
+    The literal type is a blob, so the tasks that consume the column have to declare a columnar list too.
+    """
+
+    def __init__(self, as_array: bool = False):
+        self._as_array = as_array
+
+    @property
+    def as_array(self) -> bool:
+        return self._as_array
+
+    def __eq__(self, other):
+        return isinstance(other, Columnar) and self.as_array == other.as_array
+
+    def __hash__(self):
+        return hash(self.as_array)
+
+    def __repr__(self):
+        return f"Columnar(as_array={self.as_array})"
+
+
+def resolve(t: typing.Any) -> typing.Optional[Columnar]:
+    """
+    Returns the :py:class:`Columnar` in the Annotated metadata of a list type, if any.
+    """
+    if get_origin(t) is Annotated:
+        for arg in get_args(t)[1:]:
+            if isinstance(arg, Columnar):
+                return arg
+    return None
+
+
+def column_format(element_type: type) -> str:
+    """
+    Returns the blob format of a column of ``element_type`` values.
+    """
+    if element_type not in ARROW_TYPES:
+        raise TypeError(f"Columnar lists only support elements of type {list(ARROW_TYPES.keys())}, got {element_type}")
+    return f"{COLUMNAR_FORMAT}:{ARROW_TYPES[element_type]}"
+
+
+def literal_type(element_type: type) -> LiteralType:
+    """
+    Returns the literal type of a column of ``element_type`` values.
+    """
+    return LiteralType(
+        blob=BlobType(format=column_format(element_type), dimensionality=BlobType.BlobDimensionality.SINGLE)
+    )
+
+
+def element_type_of(lt: LiteralType) -> typing.Optional[type]:
+    """
+    Returns the element type of the column a literal type describes, if it describes one.
+    """
+    if lt.blob is None or lt.blob.dimensionality != BlobType.BlobDimensionality.SINGLE:
+        return None
+    for element_type in ARROW_TYPES:
+        if lt.blob.format == column_format(element_type):
+            return element_type
+    return None
+
+
+def is_columnar(lv: Literal) -> bool:
+    """
+    Returns whether a literal holds a column written by :py:func:`encode`.
+    """
+    if lv.scalar is None or lv.scalar.blob is None:
+        return False
+    return lv.scalar.blob.metadata.type.format.startswith(f"{COLUMNAR_FORMAT}:")
+
+
+def encode(ctx: FlyteContext, values: typing.Any, element_type: type) -> Literal:
+    """
+    Converts a list, or a NumPy array, of ``element_type`` values to a column literal.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if not isinstance(values, (list, np.ndarray)):
+        raise TypeError(f"Expected a list or a NumPy array, got {type(values)}")
+    lt = literal_type(element_type)
+    try:
+        array = pa.array(values, type=getattr(pa, ARROW_TYPES[element_type])())
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        raise TypeError(f"Cannot store {element_type} list as a column: {e}") from e
+    if array.null_count:
+        raise TypeError(f"Cannot store a list with None values as a column of {element_type}")
+
+    batch = pa.record_batch([array], names=["values"])
+    local_path = ctx.file_access.get_random_local_path()
+    with pa.OSFile(local_path, "wb") as sink, pa.ipc.new_file(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    remote_path = ctx.file_access.put_raw_data(local_path, preserve_name=False)
+    return Literal(scalar=Scalar(blob=Blob(metadata=BlobMetadata(type=lt.blob), uri=remote_path)))
+
+
+def decode(
+    ctx: FlyteContext, lv: Literal, as_array: bool = False
+) -> typing.Union[typing.List[typing.Any], "np.ndarray"]:
+    """
+    Converts a column literal back to a list, or to a NumPy array if as_array is set. Columns are memory mapped, so
+    numeric columns are read without copying them.
+    """
+    import pyarrow as pa
+
+    local_path = ctx.file_access.get_random_local_path()
+    ctx.file_access.get_data(lv.scalar.blob.uri, local_path)
+    table = pa.ipc.open_file(pa.memory_map(local_path)).read_all()
+
+    array = table.column(0).to_numpy()
+    # Converting through NumPy is much faster than building the python objects one by one with to_pylist
+    return array if as_array else array.tolist()
@@ -0,0 +1,170 @@
+import importlib
+import io
+import os
+import shutil
+import typing
+
+from typing_extensions import Annotated, get_args, get_origin
+
+from flytekit.configuration import DataConfig
+
+# Codec name -> (file extension, magic bytes at the start of a compressed stream)
+CODECS: typing.Dict[str, typing.Tuple[str, bytes]] = {
+    "gzip": (".gz", b"\x1f\x8b"),
+    "zstd": (".zst", b"\x28\xb5\x2f\xfd"),
+    "lz4": (".lz4", b"\x04\x22\x4d\x18"),
+}
+
+# Separates the codec flytekit compressed a blob with from its original format, e.g. ``csv+gzip``
+FORMAT_SEPARATOR = "+"
+
+
+class Compression(object):
+    """
+    Flyte-specific object used to compress the blob a value is offloaded to, for example
+    ``Annotated[FlyteFile, Compression("zstd")]``. Blobs are decompressed transparently when read back.
+    """
+
+    def __init__(self, codec: str, level: typing.Optional[int] = None):
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported compression codec {codec}, expected one of {list(CODECS.keys())}")
+        self._codec = codec
+        self._level = level
+
+    @property
+    def codec(self) -> str:
+        return self._codec
+
+    @property
+    def level(self) -> typing.Optional[int]:
+        return self._level
+
+    @property
+    def extension(self) -> str:
+        return CODECS[self._codec][0]
+
+    def __eq__(self, other):
+        return isinstance(other, Compression) and self.codec == other.codec and self.level == other.level
+
+    def __hash__(self):
+        return hash((self.codec, self.level))
+
+    def __repr__(self):
+        return f"Compression(codec={self.codec}, level={self.level})"
+
+    def format(self, fmt: str) -> str:
+        """
+        Returns the blob format recorded for a blob of format fmt that flytekit compressed with this codec.
+        """
+        return f"{fmt}{FORMAT_SEPARATOR}{self._codec}"
+
+    def _open(self, path: str, mode: str) -> typing.BinaryIO:
+        if self._codec == "gzip":
+            import gzip
+
+            if "w" in mode:
+                # Neither the modification time nor the file name go into the header, so the same content always
+                # compresses to the same bytes and is deduplicated by content addressed uploads
+                raw = io.FileIO(path, mode)
+                gz = gzip.GzipFile(
+                    filename="",
+                    mode=mode,
+                    compresslevel=6 if self._level is None else self._level,
+                    fileobj=raw,
+                    mtime=0,
+                )
+                # GzipFile only closes the file objects it opened itself
+                gz.myfileobj = raw
+                return typing.cast(typing.BinaryIO, gz)
+            return typing.cast(typing.BinaryIO, gzip.open(path, mode))
+        if self._codec == "zstd":
+            zstd = _import("zstandard", self._codec)
+            if "w" in mode:
+                cctx = zstd.ZstdCompressor(level=3 if self._level is None else self._level)
+                return zstd.open(path, mode, cctx=cctx)
+            return zstd.open(path, mode)
+        lz4_frame = _import("lz4.frame", self._codec)
+        if "w" in mode:
+            return lz4_frame.open(path, mode, compression_level=self._level or 0)
+        return lz4_frame.open(path, mode)
+
+    def compress(self, from_path: str, to_path: str) -> str:
+        """
+        Writes the compressed content of from_path to to_path and returns to_path.
+        """
+        with open(from_path, "rb") as src, self._open(to_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        return to_path
+
+    def decompress(self, from_path: str, to_path: str) -> str:
+        """
+        Writes the decompressed content of from_path to to_path and returns to_path.
+        """
+        with self._open(from_path, "rb") as src, open(to_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        return to_path
+
+
+def _import(module: str, codec: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"The {codec} compression codec requires the {module.split('.')[0]} package, please install it."
+        ) from e
+
+
+def resolve(t: typing.Any = None, data_config: typing.Optional[DataConfig] = None) -> typing.Optional[Compression]:
+    """
+    Returns the compression requested for a value, either through a :py:class:`Compression` in the Annotated
+    metadata of its type (or a ``compression`` entry of the kwtypes metadata) or through
+    ``DataConfig.compression_codec``.
+    """
+    if get_origin(t) is Annotated:
+        for arg in get_args(t)[1:]:
+            if isinstance(arg, dict):
+                arg = arg.get("compression")
+                if isinstance(arg, str):
+                    arg = Compression(arg)
+            if isinstance(arg, Compression):
+                return arg
+    if data_config is not None and data_config.compression_codec:
+        return Compression(data_config.compression_codec)
+    return None
+
+
+def from_format(fmt: str) -> typing.Tuple[str, typing.Optional[Compression]]:
+    """
+    Splits the format recorded in the metadata of a blob into its original format and the compression flytekit wrote
+    it with. Blobs flytekit did not compress, e.g. a user provided ``logs.gz``, are returned as is.
+    """
+    base, sep, codec = fmt.rpartition(FORMAT_SEPARATOR)
+    if sep and codec in CODECS:
+        return base, Compression(codec)
+    return fmt, None
+
+
+def from_header(path: str) -> typing.Optional[Compression]:
+    """
+    Returns the compression a local file was written with, based on the magic bytes it starts with.
+    """
+    with open(path, "rb") as f:
+        header = f.read(4)
+    for codec, (_, magic) in CODECS.items():
+        if header.startswith(magic):
+            return Compression(codec)
+    return None
+
+
+def decompress_in_place(path: str) -> str:
+    """
+    Decompresses a local file that starts with a known magic header, leaving other files untouched.
+    """
+    compression = from_header(path)
+    if compression is None:
+        return path
+    compressed = path + compression.extension
+    os.replace(path, compressed)
+    compression.decompress(compressed, path)
+    os.remove(compressed)
+    return path
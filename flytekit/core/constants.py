@@ -2,6 +2,7 @@ INPUT_FILE_NAME = "inputs.pb"
 OUTPUT_FILE_NAME = "outputs.pb"
 FUTURES_FILE_NAME = "futures.pb"
 ERROR_FILE_NAME = "error.pb"
+TRANSFER_METRICS_FILE_NAME = "transfer_metrics.json"
 
 
 class SdkTaskType(object):
@@ -18,22 +18,39 @@ simple implementation that ships with the core.
    DataPersistencePlugins
    DiskPersistence
    FileAccessProvider
+   FileSystemPool
+   AccessModeCache
+   DownloadCache
+   TransferRecord
+   TransferMetrics
    UnsupportedPersistenceOp
 
 """
+import asyncio
+import functools
+import hashlib
+import json
 import os
 import pathlib
+import shutil
+import sys
 import tempfile
+import threading
+import time
 import typing
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, Union, cast
 from uuid import UUID
 
 import fsspec
-from fsspec.utils import get_protocol
+from diskcache import Cache, Lock
+from fsspec.asyn import get_loop, sync
+from fsspec.utils import get_protocol, tokenize
 
 from flytekit import configuration
 from flytekit.configuration import DataConfig
-from flytekit.core.utils import PerformanceTimer
 from flytekit.exceptions.user import FlyteAssertion
 from flytekit.interfaces.random import random
 from flytekit.loggers import logger
@@ -44,6 +61,13 @@ _FSSPEC_S3_KEY_ID = "key"
 _FSSPEC_S3_SECRET = "secret"
 _ANON = "anon"
 
+# S3 rejects multipart uploads with parts smaller than 5MiB (except for the last one) or more than 10000 parts
+_S3_MIN_PART_SIZE = 5 * 2**20
+_S3_MAX_PARTS = 10000
+
+# ioctl request that clones a file into another one as a copy-on-write reflink (Linux btrfs, XFS, overlayfs, ...)
+_FICLONE = 0x40049409
+
 
 def s3_setup_args(s3_cfg: configuration.S3Config, anonymous: bool = False):
     kwargs: Dict[str, Any] = {
@@ -65,6 +89,448 @@ def s3_setup_args(s3_cfg: configuration.S3Config, anonymous: bool = False):
     return kwargs
 
 
+def _local_copy(from_path: str, to_path: str, hardlink: bool = False) -> str:
+    """
+    Copies a local file, avoiding copying its bytes where the filesystem allows it. In order, this tries a hardlink
+    (only if ``hardlink`` is set), a copy-on-write reflink, an in-kernel ``copy_file_range`` and finally a regular copy.
+    Returns the method that was used.
+    """
+    if os.path.exists(to_path):
+        if os.path.samefile(from_path, to_path):
+            return "noop"
+        os.remove(to_path)
+    if hardlink:
+        try:
+            os.link(from_path, to_path)
+            return "hardlink"
+        except OSError as e:
+            # Different devices, or a filesystem without hardlink support
+            logger.debug(f"Could not hardlink {from_path} to {to_path}: {e}")
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(from_path, "rb") as src, open(to_path, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return "reflink"
+        except OSError:
+            pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(from_path, "rb") as src, open(to_path, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return "copy_file_range"
+        except OSError:
+            pass
+    shutil.copyfile(from_path, to_path)
+    return "copy"
+
+
+async def _s3_put_multipart(
+    file_system: fsspec.AbstractFileSystem, lpath: str, rpath: str, size: int, chunksize: int, concurrency: int
+):
+    """
+    Uploads a local file to S3 as a multipart upload, with up to ``concurrency`` parts in flight at a time. Parts are
+    read from disk only once a slot frees up, so memory use is bounded by ``concurrency * chunksize``.
+    """
+    chunksize = max(chunksize, _S3_MIN_PART_SIZE, -(-size // _S3_MAX_PARTS))
+    bucket, key, _ = file_system.split_path(rpath)
+    mpu = await file_system._call_s3("create_multipart_upload", Bucket=bucket, Key=key)
+    upload_id = mpu["UploadId"]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _upload_part(part_number: int, offset: int) -> Dict[str, Any]:
+        async with semaphore:
+            with open(lpath, "rb") as f:
+                f.seek(offset)
+                data = f.read(chunksize)
+            out = await file_system._call_s3(
+                "upload_part", Bucket=bucket, Key=key, PartNumber=part_number, UploadId=upload_id, Body=data
+            )
+            return {"PartNumber": part_number, "ETag": out["ETag"]}
+
+    try:
+        parts = await asyncio.gather(
+            *[_upload_part(i + 1, offset) for i, offset in enumerate(range(0, size, chunksize))]
+        )
+        await file_system._call_s3(
+            "complete_multipart_upload",
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        await file_system._call_s3("abort_multipart_upload", Bucket=bucket, Key=key, UploadId=upload_id)
+        raise
+    finally:
+        file_system.invalidate_cache(rpath)
+
+
+@dataclass
+class TransferRecord(object):
+    """
+    Describes a single ``get_data``/``put_data`` call. ``duration`` is in seconds.
+    """
+
+    direction: str
+    protocol: str
+    source: str
+    destination: str
+    files: int = 0
+    bytes: int = 0
+    duration: float = 0.0
+    retries: int = 0
+    succeeded: bool = True
+
+    @property
+    def throughput(self) -> float:
+        """
+        Bytes per second
+        """
+        return self.bytes / self.duration if self.duration > 0 else 0.0
+
+
+def _local_usage(path: str) -> typing.Tuple[int, int]:
+    """
+    Returns the number of files and the total number of bytes under a local path, which can be a file or a directory.
+    """
+    path = FileAccessProvider.strip_file_header(path)
+    if os.path.isfile(path):
+        return 1, os.path.getsize(path)
+    files, size = 0, 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            files += 1
+            size += os.path.getsize(os.path.join(root, name))
+    return files, size
+
+
+class TransferMetrics(object):
+    """
+    Collects a :py:class:`TransferRecord` for every transfer made through a :py:class:`FileAccessProvider`. Task
+    executions run in a :py:meth:`scope`, so the aggregated summary describes how I/O-bound a single task was, also
+    when the provider outlives the task, like the default provider of local executions does.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: typing.List[TransferRecord] = []
+        self._depth = 0
+        self._active = threading.local()
+
+    @property
+    def records(self) -> typing.List[TransferRecord]:
+        with self._lock:
+            return list(self._records)
+
+    @property
+    def active(self) -> typing.Optional[TransferRecord]:
+        """
+        The record of the transfer running on the current thread, if any.
+        """
+        return getattr(self._active, "record", None)
+
+    def add_retry(self, record: typing.Optional[TransferRecord]):
+        if record is None:
+            return
+        with self._lock:
+            record.retries += 1
+
+    @contextmanager
+    def record(self, direction: str, source: str, destination: str) -> typing.Iterator[TransferRecord]:
+        """
+        Times the transfer run inside the context and stores its record, also when the transfer fails. The caller is
+        expected to fill in the file and byte counts.
+        """
+        remote = source if direction == "get" else destination
+        r = TransferRecord(direction=direction, protocol=get_protocol(remote), source=source, destination=destination)
+        previous = self.active
+        self._active.record = r
+        start = time.perf_counter()
+        try:
+            yield r
+        except Exception:
+            r.succeeded = False
+            raise
+        finally:
+            r.duration = time.perf_counter() - start
+            self._active.record = previous
+            with self._lock:
+                self._records.append(r)
+            logger.info(
+                f"Transfer {direction} ({source} -> {destination}): {r.files} files, {r.bytes} bytes in "
+                f"{r.duration:.3f}s [{r.throughput / 2**20:.2f} MiB/s, {r.retries} retries, succeeded={r.succeeded}]"
+            )
+
+    @staticmethod
+    def _aggregate(records: typing.List[TransferRecord]) -> Dict[str, Any]:
+        total_bytes = sum(r.bytes for r in records)
+        duration = sum(r.duration for r in records)
+        return {
+            "transfers": len(records),
+            "failed": sum(1 for r in records if not r.succeeded),
+            "files": sum(r.files for r in records),
+            "bytes": total_bytes,
+            "duration": duration,
+            "retries": sum(r.retries for r in records),
+            "throughput": total_bytes / duration if duration > 0 else 0.0,
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns the totals over all transfers, broken down by direction and by protocol, plus the individual records.
+        """
+        records = self.records
+        summary = self._aggregate(records)
+        for group in ("direction", "protocol"):
+            keys = sorted({getattr(r, group) for r in records})
+            summary[f"by_{group}"] = {k: self._aggregate([r for r in records if getattr(r, group) == k]) for k in keys}
+        summary["records"] = [dict(asdict(r), throughput=r.throughput) for r in records]
+        return summary
+
+    def write_summary(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def to_html(self) -> str:
+        rows = "".join(
+            f"<tr><td>{r.direction}</td><td>{r.protocol}</td><td>{r.source}</td><td>{r.destination}</td>"
+            f"<td>{r.files}</td><td>{r.bytes}</td><td>{r.duration:.3f}</td><td>{r.throughput / 2**20:.2f}</td>"
+            f"<td>{r.retries}</td><td>{r.succeeded}</td></tr>"
+            for r in self.records
+        )
+        return (
+            "<table><tr><th>Direction</th><th>Protocol</th><th>Source</th><th>Destination</th><th>Files</th>"
+            "<th>Bytes</th><th>Duration (s)</th><th>Throughput (MiB/s)</th><th>Retries</th><th>Succeeded</th></tr>"
+            f"{rows}</table>"
+        )
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    @contextmanager
+    def scope(self) -> typing.Iterator["TransferMetrics"]:
+        """
+        Collects the records of the transfers made inside the context, like a task execution, apart from the ones made
+        before. Nested scopes hand their records over to the enclosing scope. The records of the outermost scope are
+        kept until the next scope starts, so they can still be summarized once it exited, but earlier records are
+        dropped and do not pile up.
+        """
+        with self._lock:
+            outer = self._records
+            self._records = []
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth > 0:
+                    outer.extend(self._records)
+                    self._records = outer
+
+
+def _file_digest(path: str, chunk_size: int = 2**20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _content_digest(path: str) -> str:
+    """
+    Returns the sha256 digest of a file, or of the relative paths and file digests of a directory.
+    """
+    if not os.path.isdir(path):
+        return _file_digest(path)
+    entries = []
+    for root, _, files in os.walk(path):
+        for f in files:
+            file_path = os.path.join(root, f)
+            rel = pathlib.PurePath(os.path.relpath(file_path, path)).as_posix()
+            entries.append(f"{rel}\0{_file_digest(file_path)}\n")
+    return hashlib.sha256("".join(sorted(entries)).encode("utf-8")).hexdigest()
+
+
+class FileSystemPool(object):
+    """
+    A thread-safe pool of fsspec filesystem instances, keyed on the protocol, the anonymous flag and the keyword
+    arguments used to construct them. Constructing a filesystem can be expensive (client creation, credential and
+    region discovery), so the :py:class:`FileAccessProvider` reuses instances across calls instead of building one per
+    transfer. Entries stay in the pool until they are explicitly invalidated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filesystems: Dict[typing.Tuple[str, bool, str], fsspec.AbstractFileSystem] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._filesystems)
+
+    def get_or_create(
+        self,
+        protocol: str,
+        anonymous: bool,
+        kwargs: Dict[str, Any],
+        factory: typing.Callable[[], fsspec.AbstractFileSystem],
+    ) -> fsspec.AbstractFileSystem:
+        """
+        Returns the pooled filesystem for the given key, calling ``factory`` to construct it on a miss.
+        """
+        key = (protocol, anonymous, tokenize(kwargs))
+        with self._lock:
+            fs = self._filesystems.get(key)
+            if fs is not None:
+                self._hits += 1
+                return fs
+            self._misses += 1
+            fs = factory()
+            self._filesystems[key] = fs
+            return fs
+
+    def invalidate(self, protocol: typing.Optional[str] = None):
+        """
+        Drops pooled filesystems so that the next request constructs a fresh instance, for example after credentials
+        have been rotated. If a protocol is given, only the filesystems for that protocol are dropped.
+        """
+        with self._lock:
+            if protocol is None:
+                self._filesystems.clear()
+                return
+            for key in [k for k in self._filesystems if k[0] == protocol]:
+                del self._filesystems[key]
+
+
+class AccessModeCache(object):
+    """
+    A thread-safe memo of the buckets that could only be accessed anonymously. Public buckets reject signed requests
+    when no credentials are available, so without this memo every call would pay for a failed authenticated round
+    trip before falling back to anonymous access. Buckets are keyed on the protocol and the bucket name, local paths
+    are never memoized.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._anonymous: typing.Set[typing.Tuple[str, str]] = set()
+
+    @staticmethod
+    def _key(path: str) -> typing.Optional[typing.Tuple[str, str]]:
+        protocol = get_protocol(path)
+        if protocol == "file":
+            return None
+        bucket = path.split("://", 1)[-1].split("/", 1)[0]
+        return (protocol, bucket) if bucket else None
+
+    def is_anonymous(self, path: str) -> bool:
+        key = self._key(path)
+        return key is not None and key in self._anonymous
+
+    def mark_anonymous(self, path: str):
+        key = self._key(path)
+        if key is not None:
+            with self._lock:
+                self._anonymous.add(key)
+
+    def mark_authenticated(self, path: str):
+        key = self._key(path)
+        if key is not None:
+            with self._lock:
+                self._anonymous.discard(key)
+
+    def clear(self, protocol: typing.Optional[str] = None):
+        with self._lock:
+            if protocol is None:
+                self._anonymous.clear()
+                return
+            self._anonymous = {k for k in self._anonymous if k[0] != protocol}
+
+
+class DownloadCache(object):
+    """
+    A node-local, size capped cache of downloaded remote files. Entries are keyed on the remote URI plus the version of
+    the object (ETag, generation, ...) so a changed object is never served stale. The cache is backed by
+    :py:class:`diskcache.Cache`, which makes it safe to share between processes, and evicts the least recently used
+    entries once ``max_bytes`` is exceeded.
+    """
+
+    # Keys in the fsspec info dict, in order of preference, that identify a specific version of an object
+    VERSION_KEYS = ("ETag", "etag", "generation", "version_id", "md5Hash")
+
+    def __init__(self, directory: str, max_bytes: int):
+        self._cache = Cache(directory, size_limit=max_bytes, eviction_policy="least-recently-used")
+
+    @property
+    def directory(self) -> str:
+        return self._cache.directory
+
+    @classmethod
+    def key(cls, remote_path: str, info: Dict[str, Any]) -> typing.Optional[str]:
+        """
+        Returns the cache key for the remote object described by the fsspec ``info`` dict, or None if the object does
+        not carry any version information and thus cannot be cached safely.
+        """
+        for k in cls.VERSION_KEYS:
+            v = info.get(k)
+            if v:
+                return f"{remote_path}@{v}"
+        return None
+
+    def lock(self, key: str) -> Lock:
+        """
+        Returns a lock, shared across processes, that serializes the population of a single entry.
+        """
+        return Lock(self._cache, f"lock:{key}", expire=600)
+
+    def fetch(self, key: str, local_path: str, hardlink: bool = False) -> bool:
+        """
+        Places the cached object at ``local_path``, cloning the file of the entry where the filesystem allows it so a
+        hit does not take up disk space twice, see :py:func:`_local_copy`. With ``hardlink`` the file is hardlinked
+        instead, which shares its storage with the cache entry. Returns False on a cache miss.
+        """
+        handle = self._cache.get(key, read=True)
+        if handle is None:
+            return False
+        with handle:
+            name = getattr(handle, "name", None)
+            if isinstance(name, str) and os.path.isfile(name):
+                try:
+                    method = _local_copy(name, local_path, hardlink=hardlink)
+                    logger.debug(f"Fetched {key} from the download cache using {method}")
+                    return True
+                except OSError as e:
+                    # The entry was evicted in the meantime, the open handle can still be read
+                    logger.debug(f"Could not link the download cache entry for {key}: {e}")
+            with open(local_path, "wb") as f:
+                shutil.copyfileobj(handle, f)
+        return True
+
+    def store(self, key: str, local_path: str):
+        with open(local_path, "rb") as f:
+            self._cache.set(key, f, read=True)
+
+    def clear(self):
+        self._cache.clear()
+
+
 class FileAccessProvider(object):
     """
     This is the class that is available through the FlyteContext and can be used for persisting data to the remote
@@ -88,8 +554,16 @@ class FileAccessProvider(object):
         self._local_sandbox_dir = pathlib.Path(local_sandbox_dir_appended)
         self._local_sandbox_dir.mkdir(parents=True, exist_ok=True)
         self._local = fsspec.filesystem(None)
+        self._filesystem_pool = FileSystemPool()
+        self._access_modes = AccessModeCache()
+        self._transfer_metrics = TransferMetrics()
 
         self._data_config = data_config if data_config else DataConfig.auto()
+        self._download_cache = (
+            DownloadCache(self._data_config.download_cache_dir, self._data_config.download_cache_max_bytes)
+            if self._data_config.download_cache_dir
+            else None
+        )
         self._default_protocol = get_protocol(raw_output_prefix)
         self._default_remote = cast(fsspec.AbstractFileSystem, self.get_filesystem(self._default_protocol))
         if os.name == "nt" and raw_output_prefix.startswith("file://"):
@@ -108,27 +582,54 @@ class FileAccessProvider(object):
     def data_config(self) -> DataConfig:
         return self._data_config
 
+    @property
+    def download_cache(self) -> typing.Optional[DownloadCache]:
+        return self._download_cache
+
+    @property
+    def transfer_metrics(self) -> TransferMetrics:
+        return self._transfer_metrics
+
+    @property
+    def filesystem_pool(self) -> FileSystemPool:
+        return self._filesystem_pool
+
+    @property
+    def access_modes(self) -> AccessModeCache:
+        return self._access_modes
+
+    def invalidate_filesystems(self, protocol: typing.Optional[str] = None):
+        """
+        Drops the pooled filesystem instances (optionally only those for the given protocol), together with the
+        memoized access modes, since new credentials may grant access to buckets that were read anonymously. The
+        default remote filesystem is rebuilt right away.
+        """
+        self._filesystem_pool.invalidate(protocol)
+        self._access_modes.clear(protocol)
+        if protocol is None or protocol == self._default_protocol:
+            self._default_remote = cast(fsspec.AbstractFileSystem, self.get_filesystem(self._default_protocol))
+
     def get_filesystem(
         self, protocol: typing.Optional[str] = None, anonymous: bool = False, **kwargs
     ) -> typing.Optional[fsspec.AbstractFileSystem]:
         if not protocol:
             return self._default_remote
-        if protocol == "file":
-            kwargs["auto_mkdir"] = True
-        elif protocol == "s3":
+        if protocol == "s3":
             s3kwargs = s3_setup_args(self._data_config.s3, anonymous=anonymous)
             s3kwargs.update(kwargs)
-            return fsspec.filesystem(protocol, **s3kwargs)  # type: ignore
+            kwargs = s3kwargs
         elif protocol == "gs":
             if anonymous:
                 kwargs["token"] = _ANON
-            return fsspec.filesystem(protocol, **kwargs)  # type: ignore
-
-        # Preserve old behavior of returning None for file systems that don't have an explicit anonymous option.
-        if anonymous:
+        elif anonymous:
+            # Preserve old behavior of returning None for file systems that don't have an explicit anonymous option.
             return None
+        elif protocol == "file":
+            kwargs["auto_mkdir"] = True
 
-        return fsspec.filesystem(protocol, **kwargs)  # type: ignore
+        return self._filesystem_pool.get_or_create(
+            protocol, anonymous, kwargs, lambda: fsspec.filesystem(protocol, **kwargs)  # type: ignore
+        )
 
     def get_filesystem_for_path(self, path: str = "", anonymous: bool = False, **kwargs) -> fsspec.AbstractFileSystem:
         protocol = get_protocol(path)
@@ -175,37 +676,199 @@ class FileAccessProvider(object):
             return os.sep
         return file_system.sep
 
-    def exists(self, path: str) -> bool:
+    def _with_access_fallback(
+        self, path: str, fn: typing.Callable[[fsspec.AbstractFileSystem], Any], operation: str
+    ) -> Any:
+        """
+        Runs ``fn`` against the filesystem for ``path``, falling back to anonymous access when the authenticated call
+        raises an ``OSError``. Buckets that only worked anonymously are remembered in :py:attr:`access_modes`, so later
+        calls go straight to the anonymous filesystem.
+        """
+        protocol = get_protocol(path)
+        if self._access_modes.is_anonymous(path):
+            anon_fs = self.get_filesystem(protocol, anonymous=True)
+            if anon_fs is not None:
+                try:
+                    return fn(anon_fs)
+                except OSError as oe:
+                    # Not every object in a bucket has to be public
+                    logger.debug(f"Anonymous {operation} of {path} failed, retrying with credentials {oe}")
+                    self._access_modes.mark_authenticated(path)
         try:
-            file_system = self.get_filesystem_for_path(path)
-            return file_system.exists(path)
+            return fn(self.get_filesystem(protocol))
         except OSError as oe:
-            logger.debug(f"Error in exists checking {path} {oe}")
-            anon_fs = self.get_filesystem(get_protocol(path), anonymous=True)
-            if anon_fs is not None:
-                logger.debug(f"Attempting anonymous exists with {anon_fs}")
-                return anon_fs.exists(path)
-            raise oe
+            logger.debug(f"Error in {operation} {path} {oe}")
+            anon_fs = self.get_filesystem(protocol, anonymous=True)
+            if anon_fs is None:
+                raise oe
+            logger.debug(f"Attempting anonymous {operation} with {anon_fs}")
+            result = fn(anon_fs)
+            self._access_modes.mark_anonymous(path)
+            return result
+
+    def exists(self, path: str) -> bool:
+        return self._with_access_fallback(path, lambda fs: fs.exists(path), "exists")
+
+    def _transfer_files(
+        self, transfers: typing.List[typing.Tuple[str, str, int]], fn: typing.Callable[[str, str], Any]
+    ):
+        """
+        Runs ``fn(from_path, to_path)`` for every (from_path, to_path, size) tuple on a bounded thread pool. Each file
+        is retried individually up to ``DataConfig.transfer_retries`` times, and the first file that still fails
+        cancels all pending transfers and is re-raised.
+        """
+        retries = max(0, self._data_config.transfer_retries)
+        record = self._transfer_metrics.active
+
+        def _transfer_one(from_path: str, to_path: str):
+            for attempt in range(retries + 1):
+                try:
+                    return fn(from_path, to_path)
+                except FileNotFoundError:
+                    raise
+                except Exception as e:
+                    if attempt == retries:
+                        raise
+                    self._transfer_metrics.add_retry(record)
+                    logger.debug(f"Retrying transfer of {from_path} to {to_path} after attempt {attempt + 1}: {e}")
+
+        start = time.perf_counter()
+        workers = max(1, min(self._data_config.transfer_concurrency, len(transfers)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flytekit-transfer") as executor:
+            futures = [executor.submit(_transfer_one, f, t) for f, t, _ in transfers]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        duration = time.perf_counter() - start
+        total_bytes = sum(size for _, _, size in transfers)
+        throughput = total_bytes / duration / 2**20 if duration > 0 else 0.0
+        logger.debug(
+            f"Transferred {len(transfers)} files ({total_bytes} bytes) in {duration:.3f}s "
+            f"[{throughput:.2f} MiB/s, {workers} workers]"
+        )
+
+    def _local_transfer(self, from_path: str, to_path: str):
+        """
+        Copies a single file between two local paths, linking or cloning it instead of copying its bytes where
+        possible, see ``DataConfig.local_hardlinks``.
+        """
+        from_path, to_path = self.strip_file_header(from_path), self.strip_file_header(to_path)
+        if to_path.endswith(os.sep) or os.path.isdir(to_path):
+            to_path = os.path.join(to_path, os.path.basename(from_path))
+        pathlib.Path(to_path).parent.mkdir(parents=True, exist_ok=True)
+        method = _local_copy(from_path, to_path, hardlink=self._data_config.local_hardlinks)
+        logger.debug(f"Copied {from_path} to {to_path} using {method}")
+
+    def _get_directory(self, file_system: fsspec.AbstractFileSystem, from_path: str, to_path: str):
+        """
+        Lists the remote directory once and downloads its files concurrently, preserving the relative layout.
+        """
+        to_path = self.strip_file_header(to_path)
+        base = file_system._strip_protocol(from_path).rstrip("/")
+        transfers = []
+        for path, info in file_system.find(from_path, detail=True).items():
+            rel = path[len(base) :].lstrip("/") or os.path.basename(path)
+            transfers.append((path, os.path.join(to_path, *rel.split("/")), info.get("size") or 0))
+        pathlib.Path(to_path).mkdir(parents=True, exist_ok=True)
+        for _, local_path, _ in transfers:
+            pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+        get_file = self._local_transfer if file_system.protocol == "file" else file_system.get_file
+        self._transfer_files(transfers, get_file)
+
+    def _put_directory(self, file_system: fsspec.AbstractFileSystem, from_path: str, to_path: str):
+        """
+        Walks the local directory once and uploads its files concurrently, preserving the relative layout.
+        """
+        if not os.path.isdir(from_path):
+            raise FileNotFoundError(f"Source path {from_path} is not a directory")
+        sep = self.sep(file_system)
+        to_path = to_path.rstrip(sep)
+        transfers = []
+        for root, _, files in os.walk(from_path):
+            for f in files:
+                local_path = os.path.join(root, f)
+                rel = os.path.relpath(local_path, from_path)
+                transfers.append((local_path, to_path + sep + rel.replace(os.sep, sep), os.path.getsize(local_path)))
+        if file_system.protocol == "file":
+            file_system.makedirs(self.strip_file_header(to_path), exist_ok=True)
+        self._transfer_files(transfers, functools.partial(self._put_file, file_system))
+
+    def open(
+        self,
+        path: str,
+        mode: str = "rb",
+        block_size: typing.Optional[int] = None,
+        cache_type: typing.Optional[str] = None,
+        cache_options: typing.Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> typing.IO:
+        """
+        Returns a buffered, streaming file handle for the given path, so callers can start reading (or writing) without
+        spilling the whole object to local disk first. Unless overridden, the block size and read-ahead strategy are
+        taken from ``DataConfig.stream_block_size`` and ``DataConfig.stream_cache_type``.
+
+        :param path: Local or remote path to open
+        :param mode: Open mode like 'rb', 'rt', 'wb', ...
+        :param block_size: Size of the blocks fetched from (or buffered before being sent to) the remote store
+        :param cache_type: fsspec read buffering strategy, see
+            https://filesystem-spec.readthedocs.io/en/latest/api.html#readbuffering
+        :param cache_options: Options for the chosen ``cache_type``
+        """
+        block_size = block_size or self._data_config.stream_block_size
+        if block_size:
+            kwargs["block_size"] = block_size
+        if "r" in mode:
+            kwargs["cache_type"] = cache_type or self._data_config.stream_cache_type
+            if cache_options:
+                kwargs["cache_options"] = cache_options
+        if get_protocol(path) == "file":
+            # Block sizes and read buffering do not apply to local files
+            local_fs = cast(fsspec.AbstractFileSystem, self.get_filesystem("file"))
+            return local_fs.open(self.strip_file_header(path), mode)
+        if "r" not in mode:
+            # Writes always need credentials, and must not change the access mode memoized for reads
+            return self.get_filesystem_for_path(path).open(path, mode, **kwargs)
+        return self._with_access_fallback(path, lambda fs: fs.open(path, mode, **kwargs), "open")
+
+    def read_range(self, path: str, start: int, length: typing.Optional[int] = None) -> bytes:
+        """
+        Reads a byte range of a local or remote file, using range requests for remote stores so only the requested
+        bytes are transferred.
+
+        :param path: Local or remote path of the file
+        :param start: Offset of the first byte to read, a negative offset counts from the end of the file
+        :param length: Number of bytes to read, or None to read until the end of the file
+        """
+        end = None if length is None else start + length
+        if start < 0 and end is not None and end >= 0:
+            end = None
+        if get_protocol(path) == "file":
+            path = self.strip_file_header(path)
+        with self._transfer_metrics.record("get", path, "<memory>") as record:
+            data = self._with_access_fallback(path, lambda fs: fs.cat_file(path, start=start, end=end), "range read")
+            record.files, record.bytes = 1, len(data)
+        return data
 
     def get(self, from_path: str, to_path: str, recursive: bool = False):
-        file_system = self.get_filesystem_for_path(from_path)
         if recursive:
             from_path, to_path = self.recursive_paths(from_path, to_path)
-        try:
-            if os.name == "nt" and file_system.protocol == "file" and recursive:
-                import shutil
 
+        def _get(file_system: fsspec.AbstractFileSystem):
+            if os.name == "nt" and file_system.protocol == "file" and recursive:
                 return shutil.copytree(
                     self.strip_file_header(from_path), self.strip_file_header(to_path), dirs_exist_ok=True
                 )
+            if recursive:
+                return self._get_directory(file_system, from_path, to_path)
+            if file_system.protocol == "file" and os.path.isfile(self.strip_file_header(from_path)):
+                return self._local_transfer(from_path, to_path)
             return file_system.get(from_path, to_path, recursive=recursive)
-        except OSError as oe:
-            logger.debug(f"Error in getting {from_path} to {to_path} rec {recursive} {oe}")
-            file_system = self.get_filesystem(get_protocol(from_path), anonymous=True)
-            if file_system is not None:
-                logger.debug(f"Attempting anonymous get with {file_system}")
-                return file_system.get(from_path, to_path, recursive=recursive)
-            raise oe
+
+        return self._with_access_fallback(from_path, _get, "get")
 
     def put(self, from_path: str, to_path: str, recursive: bool = False):
         file_system = self.get_filesystem_for_path(to_path)
@@ -215,14 +878,158 @@ class FileAccessProvider(object):
             if file_system.protocol == "file" and not file_system.isdir(from_path):
                 raise FlyteAssertion(f"Source path {from_path} is not a directory")
             if os.name == "nt" and file_system.protocol == "file":
-                import shutil
-
                 return shutil.copytree(
                     self.strip_file_header(from_path), self.strip_file_header(to_path), dirs_exist_ok=True
                 )
             from_path, to_path = self.recursive_paths(from_path, to_path)
+            return self._put_directory(file_system, from_path, to_path)
+        if get_protocol(to_path) in ("s3", "gs") and os.path.isfile(from_path):
+            # Same as fsspec, a file put into an existing "directory" keeps its name
+            if to_path.endswith(file_system.sep) or file_system.isdir(to_path):
+                to_path = to_path.rstrip(file_system.sep) + file_system.sep + os.path.basename(from_path)
+            return self._put_file(file_system, from_path, to_path)
+        if file_system.protocol == "file" and os.path.isfile(from_path):
+            return self._local_transfer(from_path, to_path)
         return file_system.put(from_path, to_path, recursive=recursive)
 
+    def _put_file(self, file_system: fsspec.AbstractFileSystem, from_path: str, to_path: str):
+        """
+        Uploads a single local file. Object stores get the configured multipart chunk size, and large files going to
+        S3 (or an S3 compatible store) have their parts uploaded concurrently.
+        """
+        protocol = get_protocol(to_path)
+        if protocol == "file":
+            return self._local_transfer(from_path, to_path)
+        if protocol not in ("s3", "gs"):
+            return file_system.put_file(from_path, to_path)
+        chunksize = self._data_config.multipart_chunk_size
+        concurrency = self._data_config.multipart_concurrency
+        size = os.path.getsize(from_path)
+        if protocol == "s3" and concurrency > 1 and size >= 2 * max(chunksize, _S3_MIN_PART_SIZE):
+            return sync(
+                file_system.loop, _s3_put_multipart, file_system, from_path, to_path, size, chunksize, concurrency
+            )
+        return file_system.put_file(from_path, to_path, chunksize=chunksize)
+
+    async def _run_async(
+        self,
+        path: str,
+        coro_fn: typing.Callable[[fsspec.AbstractFileSystem], typing.Awaitable],
+        sync_fn: typing.Callable,
+        anonymous_fallback: bool = True,
+    ) -> Any:
+        """
+        Runs an operation against the filesystem that handles ``path``. Filesystems with an async implementation
+        (s3fs, gcsfs, ...) are awaited natively via ``coro_fn`` on the shared fsspec event loop, retrying anonymously on
+        ``OSError`` and memoizing the access mode like the synchronous methods do. All other filesystems run
+        ``sync_fn`` on an executor thread. Writes pass ``anonymous_fallback=False`` and always use credentials.
+        """
+        file_system = self.get_filesystem_for_path(path)
+        if not file_system.async_impl:
+            return await asyncio.get_running_loop().run_in_executor(None, sync_fn)
+        if not anonymous_fallback:
+            return await coro_fn(file_system)
+        if self._access_modes.is_anonymous(path):
+            anon_fs = self.get_filesystem(get_protocol(path), anonymous=True)
+            if anon_fs is not None:
+                try:
+                    return await coro_fn(anon_fs)
+                except OSError as oe:
+                    logger.debug(f"Anonymous async operation on {path} failed, retrying with credentials {oe}")
+                    self._access_modes.mark_authenticated(path)
+        try:
+            return await coro_fn(file_system)
+        except OSError as oe:
+            logger.debug(f"Error in async operation on {path} {oe}")
+            anon_fs = self.get_filesystem(get_protocol(path), anonymous=True)
+            if anon_fs is not None:
+                logger.debug(f"Attempting anonymous async operation with {anon_fs}")
+                result = await coro_fn(anon_fs)
+                self._access_modes.mark_anonymous(path)
+                return result
+            raise oe
+
+    async def _exists(self, path: str) -> bool:
+        return await self._run_async(path, lambda fs: fs._exists(path), functools.partial(self.exists, path))
+
+    async def _get(self, from_path: str, to_path: str, recursive: bool = False):
+        if recursive:
+            # Directories go through the concurrent transfer engine
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self.get, from_path, to_path, recursive=True)
+            )
+        return await self._run_async(
+            from_path, lambda fs: fs._get(from_path, to_path), functools.partial(self.get, from_path, to_path)
+        )
+
+    async def _put(self, from_path: str, to_path: str, recursive: bool = False):
+        if recursive:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self.put, from_path, to_path, recursive=True)
+            )
+        local_path = self.strip_file_header(from_path)
+        return await self._run_async(
+            to_path,
+            lambda fs: fs._put(local_path, to_path),
+            functools.partial(self.put, from_path, to_path),
+            anonymous_fallback=False,
+        )
+
+    async def _gather(self, coros: typing.List[typing.Awaitable]) -> typing.List[Any]:
+        """
+        Awaits the given coroutines with at most ``DataConfig.transfer_concurrency`` of them in flight at a time,
+        returning their results in order.
+        """
+        semaphore = asyncio.Semaphore(max(1, self._data_config.transfer_concurrency))
+
+        async def _bounded(coro: typing.Awaitable) -> Any:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*[_bounded(c) for c in coros])
+
+    @staticmethod
+    async def _on_shared_loop(coro: typing.Coroutine) -> Any:
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, get_loop()))
+
+    async def async_exists(self, path: str) -> bool:
+        """
+        Async counterpart of :py:meth:`exists`.
+        """
+        return await self._on_shared_loop(self._exists(path))
+
+    async def async_get(self, from_path: str, to_path: str, recursive: bool = False):
+        """
+        Async counterpart of :py:meth:`get`. The transfer runs on the shared fsspec event loop, so it can be awaited
+        from any event loop.
+        """
+        return await self._on_shared_loop(self._get(from_path, to_path, recursive=recursive))
+
+    async def async_put(self, from_path: str, to_path: str, recursive: bool = False):
+        """
+        Async counterpart of :py:meth:`put`. The transfer runs on the shared fsspec event loop, so it can be awaited
+        from any event loop.
+        """
+        return await self._on_shared_loop(self._put(from_path, to_path, recursive=recursive))
+
+    def exists_many(self, paths: typing.List[str]) -> typing.List[bool]:
+        """
+        Checks the existence of all the given paths concurrently, returning the results in the same order.
+        """
+        return sync(get_loop(), self._gather, [self._exists(p) for p in paths])
+
+    def get_many(self, transfers: typing.List[typing.Tuple[str, str]], recursive: bool = False):
+        """
+        Downloads all the given (from_path, to_path) pairs concurrently. The first failure is raised.
+        """
+        sync(get_loop(), self._gather, [self._get(f, t, recursive) for f, t in transfers])
+
+    def put_many(self, transfers: typing.List[typing.Tuple[str, str]], recursive: bool = False):
+        """
+        Uploads all the given (from_path, to_path) pairs concurrently. The first failure is raised.
+        """
+        sync(get_loop(), self._gather, [self._put(f, t, recursive) for f, t in transfers])
+
     def get_random_remote_path(self, file_path_or_file_name: typing.Optional[str] = None) -> str:
         """
         Constructs a randomized path on the configured raw_output_prefix (persistence layer). the random bit is a UUID
@@ -230,10 +1037,13 @@ class FileAccessProvider(object):
 
         Use file_path_or_file_name, when you want a random directory, but want to preserve the leaf file name
         """
+        key = UUID(int=random.getrandbits(128)).hex
+        return self._remote_path_for_key(key, file_path_or_file_name)
+
+    def _remote_path_for_key(self, key: str, file_path_or_file_name: typing.Optional[str] = None) -> str:
         default_protocol = self._default_remote.protocol
         if type(default_protocol) == list:
             default_protocol = default_protocol[0]
-        key = UUID(int=random.getrandbits(128)).hex
         tail = ""
         if file_path_or_file_name:
             _, tail = os.path.split(file_path_or_file_name)
@@ -248,6 +1058,73 @@ class FileAccessProvider(object):
     def get_random_remote_directory(self):
         return self.get_random_remote_path(None)
 
+    def get_content_addressed_remote_path(self, local_path: Union[str, os.PathLike], preserve_name: bool = True) -> str:
+        """
+        Constructs a path on the configured raw_output_prefix that is derived from the content of local_path (a file
+        or a directory), so identical content always maps to the same remote location.
+
+        :param local_path: The local file or directory that will be uploaded.
+        :param preserve_name: Keep the leaf name of local_path in the remote path. Turn this off for temporary files
+            with random names, which would otherwise defeat deduplication.
+        """
+        local_path = str(local_path)
+        key = "cas" + self.sep(self._default_remote) + _content_digest(local_path)
+        if preserve_name and not os.path.isdir(local_path):
+            return self._remote_path_for_key(key, local_path)
+        return self._remote_path_for_key(key)
+
+    def _is_uploaded(self, local_path: str, remote_path: str) -> bool:
+        """
+        Checks that every file under local_path already exists at remote_path with the same size. Object stores write
+        single objects atomically, so a partially uploaded directory is detected and uploaded again.
+        """
+        file_system = self.get_filesystem_for_path(remote_path)
+        try:
+            if not os.path.isdir(local_path):
+                return file_system.info(remote_path).get("size") == os.path.getsize(local_path)
+            root = self.strip_file_header(remote_path, trim_trailing_sep=True)
+            if get_protocol(root) != "file":
+                root = file_system._strip_protocol(root)
+            remote_sizes = {
+                os.path.relpath(path, root).replace(file_system.sep, os.sep): info.get("size")
+                for path, info in file_system.find(root, detail=True).items()
+            }
+        except (FileNotFoundError, OSError):
+            return False
+        local_sizes = {}
+        for root_dir, _, files in os.walk(local_path):
+            for f in files:
+                path = os.path.join(root_dir, f)
+                local_sizes[os.path.relpath(path, local_path)] = os.path.getsize(path)
+        return local_sizes == remote_sizes
+
+    def put_raw_data(
+        self, local_path: Union[str, os.PathLike], is_multipart: bool = False, preserve_name: bool = True
+    ) -> str:
+        """
+        Uploads a raw output to the raw_output_prefix and returns the remote path it was written to. The path is
+        random, unless content addressed outputs are enabled in the data config, in which case it is derived from the
+        content and the upload is skipped if that content was uploaded before.
+
+        :param local_path: The local file, or directory if is_multipart is set, to upload.
+        :param is_multipart: Whether local_path is a directory.
+        :param preserve_name: Keep the leaf name of a file in the remote path.
+        """
+        local_path = str(local_path)
+        if not self.data_config.content_addressed_outputs:
+            remote_path = (
+                self.get_random_remote_directory() if is_multipart else self.get_random_remote_path(local_path)
+            )
+            self.put_data(local_path, remote_path, is_multipart=is_multipart)
+            return remote_path
+
+        remote_path = self.get_content_addressed_remote_path(local_path, preserve_name=preserve_name)
+        if self._is_uploaded(local_path, remote_path):
+            logger.debug(f"Skipping upload of {local_path}, its content already exists at {remote_path}")
+            return remote_path
+        self.put_data(local_path, remote_path, is_multipart=is_multipart)
+        return remote_path
+
     def get_random_local_path(self, file_path_or_file_name: typing.Optional[str] = None) -> str:
         """
         Use file_path_or_file_name, when you want a random directory, but want to preserve the leaf file name
@@ -298,15 +1175,65 @@ class FileAccessProvider(object):
         :param is_multipart:
         """
         try:
-            with PerformanceTimer(f"Copying ({remote_path} -> {local_path})"):
-                pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-                self.get(remote_path, to_path=local_path, recursive=is_multipart)
+            with self._transfer_metrics.record("get", remote_path, local_path) as record:
+                # A file:// destination would otherwise be created relative to the working directory
+                pathlib.Path(self.strip_file_header(local_path)).parent.mkdir(parents=True, exist_ok=True)
+                if self._download_cache is not None and not is_multipart and self.is_remote(remote_path):
+                    self._get_cached(remote_path, local_path)
+                else:
+                    self.get(remote_path, to_path=local_path, recursive=is_multipart)
+                record.files, record.bytes = _local_usage(local_path)
         except Exception as ex:
             raise FlyteAssertion(
                 f"Failed to get data from {remote_path} to {local_path} (recursive={is_multipart}).\n\n"
                 f"Original exception: {str(ex)}"
             )
 
+    def get_data_range(self, remote_path: str, local_path: str, start: int, length: typing.Optional[int] = None):
+        """
+        Downloads a byte range of a single file to local_path, see :py:meth:`read_range`.
+
+        :param remote_path:
+        :param local_path:
+        :param start:
+        :param length:
+        """
+        try:
+            data = self.read_range(remote_path, start, length)
+            local_path = self.strip_file_header(local_path)
+            pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(local_path, "wb") as f:
+                f.write(data)
+        except Exception as ex:
+            raise FlyteAssertion(
+                f"Failed to get range (start={start}, length={length}) of {remote_path} to {local_path}.\n\n"
+                f"Original exception: {str(ex)}"
+            )
+
+    def _get_cached(self, remote_path: str, local_path: str):
+        """
+        Downloads a single remote file through the node-local download cache.
+        """
+        cache = cast(DownloadCache, self._download_cache)
+        try:
+            info = self._with_access_fallback(remote_path, lambda fs: fs.info(remote_path), "info")
+            key = cache.key(remote_path, info)
+        except OSError as oe:
+            logger.debug(f"Could not determine the version of {remote_path}, bypassing the download cache: {oe}")
+            key = None
+        if key is None:
+            return self.get(remote_path, to_path=local_path)
+        hardlink = self._data_config.local_hardlinks
+        if cache.fetch(key, local_path, hardlink=hardlink):
+            logger.debug(f"Download cache hit for {remote_path}")
+            return
+        with cache.lock(key):
+            # Another process may have populated the entry while we were waiting on the lock
+            if cache.fetch(key, local_path, hardlink=hardlink):
+                return
+            self.get(remote_path, to_path=local_path)
+            cache.store(key, local_path)
+
     def put_data(self, local_path: Union[str, os.PathLike], remote_path: str, is_multipart: bool = False):
         """
         The implication here is that we're always going to put data to the remote location, so we .remote to ensure
@@ -318,7 +1245,8 @@ class FileAccessProvider(object):
         """
         try:
             local_path = str(local_path)
-            with PerformanceTimer(f"Writing ({local_path} -> {remote_path})"):
+            with self._transfer_metrics.record("put", local_path, remote_path) as record:
+                record.files, record.bytes = _local_usage(local_path)
                 self.put(cast(str, local_path), remote_path, recursive=is_multipart)
         except Exception as ex:
             raise FlyteAssertion(
@@ -373,6 +373,8 @@ def transform_variable_map(
                     sub_type = getattr(v, "__args__")[1]
             if hasattr(sub_type, "__origin__") and getattr(sub_type, "__origin__") is FlytePickle:
                 original_type = cast(FlytePickle, sub_type).python_type()
+                # Literal types returned by the TypeEngine are shared, so set the metadata on a copy
+                res[k]._type = copy.copy(res[k].type)
                 if hasattr(original_type, "__name__"):
                     res[k].type.metadata = {"python_class_name": original_type.__name__}
                 elif hasattr(original_type, "_name"):
@@ -0,0 +1,141 @@
+"""
+Lazy materialization of task inputs. Inputs annotated with :py:class:`Lazy`, or the non primitive inputs of a task
+declared with ``lazy_inputs=True``, are passed to the task as a :py:class:`LazyInput` proxy that converts the literal
+to the python value the first time the value is used, so inputs that are never read are never downloaded.
+"""
+import copy
+import os
+import threading
+import typing
+
+from typing_extensions import Annotated, get_args, get_origin
+from wrapt.wrappers import ObjectProxy
+
+from flytekit.core.utils import PerformanceTimer
+from flytekit.models.literals import Literal
+
+
+class Lazy(object):
+    """
+    Flyte-specific object used to mark a task input to be materialized on first access instead of before the task
+    runs, for example ``Annotated[pd.DataFrame, Lazy()]``.
+    """
+
+    def __eq__(self, other):
+        return isinstance(other, Lazy)
+
+    def __hash__(self):
+        return hash(Lazy)
+
+    def __repr__(self):
+        return "Lazy()"
+
+
+def resolve(t: typing.Any) -> typing.Optional[Lazy]:
+    """
+    Returns the :py:class:`Lazy` in the Annotated metadata of a type, if any.
+    """
+    if get_origin(t) is Annotated:
+        for arg in get_args(t)[1:]:
+            if isinstance(arg, Lazy):
+                return arg
+    return None
+
+
+def is_heavy(lv: Literal) -> bool:
+    """
+    Returns whether converting a literal may be expensive, which is the case for everything but primitives and None.
+    Only those inputs are made lazy by ``lazy_inputs=True``.
+    """
+    return lv.scalar is None or (lv.scalar.primitive is None and lv.scalar.none_type is None)
+
+
+class LazyInput(ObjectProxy):
+    """
+    Proxy to the python value of a task input, which is converted the first time the proxy is used. The proxy forwards
+    attribute access, operators and ``isinstance`` checks to the value, but ``type()`` of the proxy is still
+    ``LazyInput``; use :py:func:`materialize` to get the value itself.
+    """
+
+    # This is the pure python implementation of wrapt's ObjectProxy, the C one reads the value from a slot that has to
+    # be filled up front instead of going through __wrapped__
+    def __init__(self, name: str, load: typing.Callable[[], typing.Any]):
+        super().__init__(None)
+        self._self_name = name
+        self._self_load: typing.Optional[typing.Callable[[], typing.Any]] = load
+        self._self_loaded = False
+        self._self_lock = threading.Lock()
+
+    @property
+    def __wrapped__(self) -> typing.Any:
+        if not self._self_loaded:
+            with self._self_lock:
+                if not self._self_loaded:
+                    with PerformanceTimer(f"Materializing input '{self._self_name}'"):
+                        self._self_value = self._self_load()  # type: ignore
+                    self._self_loaded = True
+                    self._self_load = None
+        return self._self_value
+
+    @__wrapped__.setter
+    def __wrapped__(self, value: typing.Any):
+        # Only set by ObjectProxy.__init__, the value is loaded on first access instead
+        pass
+
+    def __repr__(self):
+        # Logging the inputs of a task must not materialize them
+        if not self._self_loaded:
+            return f"<lazy input '{self._self_name}'>"
+        return repr(self._self_value)
+
+    def __format__(self, format_spec):
+        return format(self.__wrapped__, format_spec)
+
+    def __call__(self, *args, **kwargs):
+        return self.__wrapped__(*args, **kwargs)
+
+    def __fspath__(self):
+        return os.fspath(self.__wrapped__)
+
+    def __matmul__(self, other):
+        return self.__wrapped__ @ other
+
+    def __rmatmul__(self, other):
+        return other @ self.__wrapped__
+
+    def __imatmul__(self, other):
+        return self.__wrapped__.__imatmul__(other)
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+
+        if copy is None:
+            return np.asarray(self.__wrapped__, dtype=dtype)
+        return np.array(self.__wrapped__, dtype=dtype, copy=copy)
+
+    def __copy__(self):
+        return copy.copy(self.__wrapped__)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.__wrapped__, memo)
+
+    def __reduce__(self):
+        # Pickles of the proxy are pickles of the value
+        return self.__wrapped__.__reduce__()
+
+    def __reduce_ex__(self, protocol):
+        return self.__wrapped__.__reduce_ex__(protocol)
+
+
+def is_materialized(v: typing.Any) -> bool:
+    """
+    Returns whether v is a python value, or a :py:class:`LazyInput` that was already converted.
+    """
+    return type(v) is not LazyInput or v._self_loaded
+
+
+def materialize(v: typing.Any) -> typing.Any:
+    """
+    Returns the python value behind a :py:class:`LazyInput`, converting it if needed, and v itself otherwise.
+    """
+    return v.__wrapped__ if type(v) is LazyInput else v
@@ -0,0 +1,124 @@
+"""
+Offloading of large literals. A value whose type is annotated with :py:class:`Offload` is written to the raw output
+prefix and replaced by a reference, a blob literal with the ``FlyteLiteral`` format, that
+``TypeEngine.to_python_value`` loads back the first time the value is read. The literal type of an offloaded value is
+that blob type too, so only inputs annotated with :py:class:`Offload` can consume it.
+"""
+import typing
+
+from flyteidl.core import literals_pb2, types_pb2
+from google.protobuf.json_format import MessageToDict, ParseDict
+from typing_extensions import Annotated, get_args, get_origin
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.loggers import logger
+from flytekit.models.core.types import BlobType
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+from flytekit.models.types import LiteralType
+
+OFFLOADED_FORMAT = "FlyteLiteral"
+
+# Key of the literal type metadata holding the literal type of the offloaded value
+_OFFLOADED_TYPE_KEY = "offloaded_type"
+
+
+class Offload(object):
+    """
+    Flyte-specific object used to offload a value to the raw output prefix instead of storing it in the task outputs,
+    for example ``Annotated[typing.Dict[str, str], Offload()]``. Use it for values that are too large to be passed
+    around inline; the tasks that consume them have to annotate their inputs with it as well. To map over a large list,
+    offload its elements, as in ``typing.List[Annotated[typing.Dict[str, str], Offload()]]``.
+    """
+
+    def __eq__(self, other):
+        return isinstance(other, Offload)
+
+    def __hash__(self):
+        return hash(OFFLOADED_FORMAT)
+
+    def __repr__(self):
+        return "Offload()"
+
+
+def resolve(t: typing.Any) -> typing.Optional[Offload]:
+    """
+    Returns the :py:class:`Offload` in the Annotated metadata of a type, if any.
+    """
+    if get_origin(t) is Annotated:
+        for arg in get_args(t)[1:]:
+            if isinstance(arg, Offload):
+                return arg
+    return None
+
+
+def strip(t: typing.Any) -> typing.Any:
+    """
+    Returns the type of an offloaded value, t without its :py:class:`Offload` annotation.
+    """
+    base, *metadata = get_args(t)
+    metadata = [m for m in metadata if not isinstance(m, Offload)]
+    return Annotated[(base, *metadata)] if metadata else base
+
+
+def literal_type(offloaded_type: LiteralType) -> LiteralType:
+    """
+    Returns the literal type of a reference to a literal of offloaded_type.
+    """
+    return LiteralType(
+        blob=BlobType(format=OFFLOADED_FORMAT, dimensionality=BlobType.BlobDimensionality.SINGLE),
+        metadata={_OFFLOADED_TYPE_KEY: MessageToDict(offloaded_type.to_flyte_idl())},
+    )
+
+
+def offloaded_type(lt: LiteralType) -> typing.Optional[LiteralType]:
+    """
+    Returns the literal type of the offloaded value a reference type written by :py:func:`literal_type` describes.
+    """
+    if lt.blob is None or lt.blob.format != OFFLOADED_FORMAT or not lt.metadata:
+        return None
+    if _OFFLOADED_TYPE_KEY not in lt.metadata:
+        return None
+    return LiteralType.from_flyte_idl(ParseDict(lt.metadata[_OFFLOADED_TYPE_KEY], types_pb2.LiteralType()))
+
+
+def is_offloaded(lv: Literal) -> bool:
+    """
+    Returns whether a literal is a reference to an offloaded literal.
+    """
+    scalar = lv.scalar
+    return scalar is not None and scalar.blob is not None and scalar.blob.metadata.type.format == OFFLOADED_FORMAT
+
+
+def offload_literal(ctx: FlyteContext, lv: Literal) -> Literal:
+    """
+    Writes lv to the raw output prefix and returns a reference to it.
+    """
+    pb = lv.to_flyte_idl()
+    local_path = ctx.file_access.get_random_local_path()
+    with open(local_path, "wb") as f:
+        f.write(pb.SerializeToString())
+    remote_path = ctx.file_access.put_raw_data(local_path, preserve_name=False)
+    logger.debug(f"Offloaded literal of {pb.ByteSize()} bytes to {remote_path}")
+    return Literal(
+        scalar=Scalar(
+            blob=Blob(
+                metadata=BlobMetadata(
+                    type=BlobType(format=OFFLOADED_FORMAT, dimensionality=BlobType.BlobDimensionality.SINGLE)
+                ),
+                uri=remote_path,
+            )
+        ),
+        hash=lv.hash,
+    )
+
+
+def load_offloaded(ctx: FlyteContext, lv: Literal) -> Literal:
+    """
+    Downloads and returns the literal a reference written by :py:func:`offload_literal` points to.
+    """
+    local_path = ctx.file_access.get_random_local_path()
+    ctx.file_access.get_data(lv.scalar.blob.uri, local_path)
+    pb = literals_pb2.Literal()
+    with open(local_path, "rb") as f:
+        pb.ParseFromString(f.read())
+    return Literal.from_flyte_idl(pb)
@@ -94,6 +94,7 @@ def task(
     task_resolver: Optional[TaskResolverMixin] = None,
     docs: Optional[Documentation] = None,
     disable_deck: bool = True,
+    lazy_inputs: bool = False,
     pod_template: Optional[PodTemplate] = None,
     pod_template_name: Optional[str] = None,
 ) -> Union[Callable, PythonFunctionTask]:
@@ -185,6 +186,9 @@ def task(
     :param execution_mode: This is mainly for internal use. Please ignore. It is filled in automatically.
     :param task_resolver: Provide a custom task resolver.
     :param disable_deck: If true, this task will not output deck html file
+    :param lazy_inputs: If true, the non primitive inputs of this task are passed as proxies that are converted on
+        first access, so inputs that are never read are never downloaded. Single inputs can be made lazy with
+        ``Annotated[..., Lazy()]`` instead.
     :param docs: Documentation about this task
     :param pod_template: Custom PodTemplate for this task.
     :param pod_template_name: The name of the existing PodTemplate resource which will be used in this task.
@@ -213,6 +217,7 @@ def task(
             execution_mode=execution_mode,
             task_resolver=task_resolver,
             disable_deck=disable_deck,
+            lazy_inputs=lazy_inputs,
             docs=docs,
             pod_template=pod_template,
             pod_template_name=pod_template_name,
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import collections
+import contextvars
 import copy
 import dataclasses
 import datetime as _datetime
 import enum
+import functools
 import inspect
 import json as _json
 import mimetypes
 import textwrap
 import typing
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 from typing import Dict, NamedTuple, Optional, Type, cast
 
@@ -25,8 +28,10 @@ from marshmallow_enum import EnumField, LoadDumpOptions
 from marshmallow_jsonschema import JSONSchema
 from typing_extensions import Annotated, get_args, get_origin
 
+from flytekit.core import lazy as _lazy
+from flytekit.core import offloading as _offloading
 from flytekit.core.annotation import FlyteAnnotation
-from flytekit.core.context_manager import FlyteContext
+from flytekit.core.context_manager import FlyteContext, flyte_context_Var
 from flytekit.core.hash import HashMethod
 from flytekit.core.type_helpers import load_type_from_tag
 from flytekit.exceptions import user as user_exceptions
@@ -50,7 +55,11 @@ from flytekit.models.literals import (
 )
 from flytekit.models.types import LiteralType, SimpleType, StructuredDatasetType, TypeStructure, UnionType
 
+if typing.TYPE_CHECKING:
+    import numpy as np
+
 T = typing.TypeVar("T")
+R = typing.TypeVar("R")
 DEFINITIONS = "definitions"
 
 
@@ -58,6 +67,33 @@ class TypeTransformerFailedError(TypeError, AssertionError, ValueError):
     ...
 
 
+def literal_type_shapes(literal_type: LiteralType) -> typing.List[typing.Tuple]:
+    """
+    Returns the shapes of a ``LiteralType``, from the most to the least specific, that the TypeEngine uses to find the
+    transformers that can reverse it. A shape is the kind of the literal type followed by the details that narrow it
+    down, for example ``("simple", SimpleType.INTEGER)``, ``("blob", BlobType.BlobDimensionality.SINGLE, "csv")`` or
+    ``("union",)``.
+    """
+    if literal_type.simple is not None:
+        return [("simple", literal_type.simple)]
+    if literal_type.blob is not None:
+        dimensionality = literal_type.blob.dimensionality
+        return [("blob", dimensionality, literal_type.blob.format), ("blob", dimensionality)]
+    if literal_type.structured_dataset_type is not None:
+        return [("structured_dataset", literal_type.structured_dataset_type.format), ("structured_dataset",)]
+    if literal_type.collection_type is not None:
+        return [("collection",)]
+    if literal_type.map_value_type is not None:
+        return [("map",)]
+    if literal_type.union_type is not None:
+        return [("union",)]
+    if literal_type.schema is not None:
+        return [("schema",)]
+    if literal_type.enum_type is not None:
+        return [("enum",)]
+    return []
+
+
 class TypeTransformer(typing.Generic[T]):
     """
     Base transformer type that should be implemented for every python native type that can be handled by flytekit
@@ -103,6 +139,14 @@ class TypeTransformer(typing.Generic[T]):
         """
         raise ValueError("By default, transformers do not translate from Flyte types back to Python types")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        r"""
+        Returns the shapes (see :py:func:`literal_type_shapes`) of the ``LiteralType``\s that
+        :py:meth:`guess_python_type` can reverse, so that the TypeEngine only tries this transformer for matching
+        literal types. None means the transformer is tried for every literal type.
+        """
+        return None
+
     @abstractmethod
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         """
@@ -194,6 +238,9 @@ class SimpleTransformer(TypeTransformer[T]):
             return self.python_type
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [] if self._lt.simple is None else [("simple", self._lt.simple)]
+
 
 class RestrictedTypeError(Exception):
     pass
@@ -218,6 +265,37 @@ class RestrictedTypeTransformer(TypeTransformer[T], ABC):
         raise RestrictedTypeError(f"Transformer for type {self.python_type} is restricted currently")
 
 
+class _DataclassPlan(NamedTuple):
+    """
+    The fields of a dataclass that the DataclassTransformer has to visit, as (name, type) pairs, so that the fields
+    that can never need a fix are skipped.
+    """
+
+    # Fields holding a FlyteFile, FlyteDirectory, FlyteSchema or StructuredDataset, which are offloaded
+    flyte_fields: typing.Tuple[typing.Tuple[str, typing.Any], ...]
+    # Fields holding an int, which the Struct representation turns into a float
+    int_fields: typing.Tuple[typing.Tuple[str, typing.Any], ...]
+    # Fields holding a StructuredDataset, which dataclass_json may decode as a dict
+    sd_fields: typing.Tuple[typing.Tuple[str, typing.Any], ...]
+
+
+def _type_contains(t: typing.Any, predicate: typing.Callable[[typing.Any], bool], seen=None) -> bool:
+    """
+    Returns whether a type, any of its type arguments or, for dataclasses, any of its fields matches predicate.
+    """
+    if predicate(t):
+        return True
+    seen = seen or set()
+    if id(t) in seen:
+        return False
+    seen.add(id(t))
+    if any(_type_contains(arg, predicate, seen) for arg in get_args(t)):
+        return True
+    if dataclasses.is_dataclass(t) and inspect.isclass(t):
+        return any(_type_contains(f.type, predicate, seen) for f in dataclasses.fields(t))
+    return False
+
+
 class DataclassTransformer(TypeTransformer[object]):
     """
     The Dataclass Transformer, provides a type transformer for arbitrary Python dataclasses, that have
@@ -264,6 +342,30 @@ class DataclassTransformer(TypeTransformer[object]):
 
     def __init__(self):
         super().__init__("Object-Dataclass-Transformer", object)
+        self._plans: typing.Dict[type, _DataclassPlan] = {}
+
+    def _plan(self, dc_type: type) -> _DataclassPlan:
+        """
+        Returns the plan of a dataclass, compiled the first time the dataclass is seen.
+        """
+        plan = self._plans.get(dc_type)
+        if plan is None:
+            from flytekit.types.directory.types import FlyteDirectory
+            from flytekit.types.file import FlyteFile
+            from flytekit.types.schema.types import FlyteSchema
+            from flytekit.types.structured.structured_dataset import StructuredDataset
+
+            def is_flyte_type(t: typing.Any) -> bool:
+                return inspect.isclass(t) and issubclass(t, (FlyteSchema, FlyteFile, FlyteDirectory, StructuredDataset))
+
+            fields = [(f.name, f.type) for f in dataclasses.fields(dc_type)]
+            plan = _DataclassPlan(
+                flyte_fields=tuple(f for f in fields if _type_contains(f[1], is_flyte_type)),
+                int_fields=tuple(f for f in fields if _type_contains(f[1], lambda t: t is int)),
+                sd_fields=tuple(f for f in fields if _type_contains(f[1], lambda t: t == StructuredDataset)),
+            )
+            self._plans[dc_type] = plan
+        return plan
 
     def assert_type(self, expected_type: Type[DataClassJsonMixin], v: T):
         # Skip iterating all attributes in the dataclass if the type of v already matches the expected_type
@@ -389,9 +491,9 @@ class DataclassTransformer(TypeTransformer[object]):
                 for k, v in python_val.items()
             }
         elif dataclasses.is_dataclass(python_type):
-            for field in dataclasses.fields(python_type):
-                val = python_val.__getattribute__(field.name)
-                python_val.__setattr__(field.name, self._fix_structured_dataset_type(field.type, val))
+            for name, field_type in self._plan(python_type).sd_fields:
+                val = python_val.__getattribute__(name)
+                python_val.__setattr__(name, self._fix_structured_dataset_type(field_type, val))
         return python_val
 
     def _serialize_flyte_type(self, python_val: T, python_type: Type[T]) -> typing.Any:
@@ -444,10 +546,9 @@ class DataclassTransformer(TypeTransformer[object]):
             else:
                 return python_val
         else:
-            for v in dataclasses.fields(python_type):
-                val = python_val.__getattribute__(v.name)
-                field_type = v.type
-                python_val.__setattr__(v.name, self._serialize_flyte_type(val, field_type))
+            for name, field_type in self._plan(python_type).flyte_fields:
+                val = python_val.__getattribute__(name)
+                python_val.__setattr__(name, self._serialize_flyte_type(val, field_type))
             return python_val
 
     def _deserialize_flyte_type(self, python_val: T, expected_python_type: Type) -> Optional[T]:
@@ -536,15 +637,15 @@ class DataclassTransformer(TypeTransformer[object]):
                 expected_python_type,
             )
         else:
-            for f in dataclasses.fields(expected_python_type):
-                value = python_val.__getattribute__(f.name)
-                if hasattr(f.type, "__origin__") and f.type.__origin__ is list:
-                    value = [self._deserialize_flyte_type(v, f.type.__args__[0]) for v in value]
-                elif hasattr(f.type, "__origin__") and f.type.__origin__ is dict:
-                    value = {k: self._deserialize_flyte_type(v, f.type.__args__[1]) for k, v in value.items()}
+            for name, field_type in self._plan(expected_python_type).flyte_fields:
+                value = python_val.__getattribute__(name)
+                if hasattr(field_type, "__origin__") and field_type.__origin__ is list:
+                    value = [self._deserialize_flyte_type(v, field_type.__args__[0]) for v in value]
+                elif hasattr(field_type, "__origin__") and field_type.__origin__ is dict:
+                    value = {k: self._deserialize_flyte_type(v, field_type.__args__[1]) for k, v in value.items()}
                 else:
-                    value = self._deserialize_flyte_type(value, f.type)
-                python_val.__setattr__(f.name, value)
+                    value = self._deserialize_flyte_type(value, field_type)
+                python_val.__setattr__(name, value)
             return python_val
 
     def _fix_val_int(self, t: typing.Type, val: typing.Any) -> typing.Any:
@@ -585,9 +686,9 @@ class DataclassTransformer(TypeTransformer[object]):
         # NOTE: Protobuf Struct does not support explicit int types, int types are upconverted to a double value
         # https://developers.google.com/protocol-buffers/docs/reference/google.protobuf#google.protobuf.Value
         # Thus we will have to walk the given dataclass and typecast values to int, where expected.
-        for f in dataclasses.fields(dc_type):
-            val = dc.__getattribute__(f.name)
-            dc.__setattr__(f.name, self._fix_val_int(f.type, val))
+        for name, field_type in self._plan(dc_type).int_fields:
+            val = dc.__getattribute__(name)
+            dc.__setattr__(name, self._fix_val_int(field_type, val))
         return dc
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
@@ -601,8 +702,8 @@ class DataclassTransformer(TypeTransformer[object]):
                 f"Dataclass {expected_python_type} should be decorated with @dataclass_json to be "
                 f"serialized correctly"
             )
-        json_str = _json_format.MessageToJson(lv.scalar.generic)
-        dc = cast(DataClassJsonMixin, expected_python_type).from_json(json_str)
+        # Equivalent to from_json(MessageToJson(...)), without encoding and parsing the intermediate JSON string
+        dc = cast(DataClassJsonMixin, expected_python_type).from_dict(_MessageToDict(lv.scalar.generic))
         dc = self._fix_structured_dataset_type(expected_python_type, dc)
         return self._fix_dataclass_int(expected_python_type, self._deserialize_flyte_type(dc, expected_python_type))
 
@@ -619,6 +720,9 @@ class DataclassTransformer(TypeTransformer[object]):
 
         raise ValueError(f"Dataclass transformer cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("simple", SimpleType.STRUCT)]
+
 
 class ProtobufTransformer(TypeTransformer[Message]):
     PB_FIELD_KEY = "pb_type"
@@ -660,6 +764,9 @@ class ProtobufTransformer(TypeTransformer[Message]):
             return load_type_from_tag(tag)
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("simple", SimpleType.STRUCT)]
+
 
 class TypeEngine(typing.Generic[T]):
     """
@@ -671,6 +778,13 @@ class TypeEngine(typing.Generic[T]):
     _REGISTRY: typing.Dict[type, TypeTransformer[T]] = {}
     _RESTRICTED_TYPES: typing.List[type] = []
     _DATACLASS_TRANSFORMER: TypeTransformer = DataclassTransformer()  # type: ignore
+    # python type -> (registry key the transformer was found under, transformer)
+    _TRANSFORMER_CACHE: typing.Dict[Type, typing.Tuple[typing.Any, TypeTransformer]] = {}
+    _TRANSFORMER_CACHE_SIZE = 4096
+    _DATACLASS_KEY = object()
+    # (registry size, literal type shape -> [(position, transformer)] that can reverse it, [(position, transformer)]
+    # that did not declare any shapes). Rebuilt when the size of the registry changes.
+    _GUESS_INDEX: typing.Optional[typing.Tuple[int, typing.Dict, typing.List]] = None
 
     @classmethod
     def register(
@@ -690,6 +804,7 @@ class TypeEngine(typing.Generic[T]):
                     f" Cannot override with {transformer.name}"
                 )
             cls._REGISTRY[t] = transformer
+        cls._clear_caches()
 
     @classmethod
     def register_restricted_type(
@@ -704,6 +819,13 @@ class TypeEngine(typing.Generic[T]):
     def register_additional_type(cls, transformer: TypeTransformer, additional_type: Type, override=False):
         if additional_type not in cls._REGISTRY or override:
             cls._REGISTRY[additional_type] = transformer
+            cls._clear_caches()
+
+    @classmethod
+    def _clear_caches(cls):
+        cls._TRANSFORMER_CACHE.clear()
+        cls._GUESS_INDEX = None
+        cls._cached_literal_type.cache_clear()
 
     @classmethod
     def get_transformer(cls, python_type: Type) -> TypeTransformer[T]:
@@ -720,37 +842,67 @@ class TypeEngine(typing.Generic[T]):
             find a transformer that matches the generic type of v. e.g List[int], Dict[str, int] etc
 
         Step 3:
-            Walk the inheritance hierarchy of v and find a transformer that matches the first base class.
-            This is potentially non-deterministic - will depend on the registration pattern.
-
-            TODO lets make this deterministic by using an ordered dict
+            Walk the method resolution order of v and find a transformer that matches the most specific base class.
+            Types that only match through ``isinstance``/``issubclass`` hooks (abstract base classes for example) fall
+            back to the first matching registered type.
 
         Step 4:
             if v is of type data class, use the dataclass transformer
+
+        Resolved transformers are cached per python type. The cache is cleared whenever a transformer is registered.
         """
+        if get_origin(python_type) is Annotated:
+            python_type = get_args(python_type)[0]
+
+        try:
+            cached = cls._TRANSFORMER_CACHE.get(python_type)
+        except TypeError:
+            # Unhashable types, e.g. generics with unhashable Annotated metadata, are resolved every time
+            return cls._resolve_transformer(python_type)[1]
+        if cached is not None:
+            key, transformer = cached
+            # Entries are re-validated, so transformers removed from the registry are never returned
+            if key is cls._DATACLASS_KEY or cls._REGISTRY.get(key) is transformer:
+                return transformer
+
+        key, transformer = cls._resolve_transformer(python_type)
+        if len(cls._TRANSFORMER_CACHE) >= cls._TRANSFORMER_CACHE_SIZE:
+            cls._TRANSFORMER_CACHE.clear()
+        cls._TRANSFORMER_CACHE[python_type] = (key, transformer)
+        return transformer
 
+    @classmethod
+    def _resolve_transformer(cls, python_type: Type) -> typing.Tuple[typing.Any, TypeTransformer[T]]:
+        """
+        Runs the lookup described in :py:meth:`get_transformer` and returns the transformer, together with the registry
+        key it was found under.
+        """
         # Step 1
         if get_origin(python_type) is Annotated:
             python_type = get_args(python_type)[0]
 
         if python_type in cls._REGISTRY:
-            return cls._REGISTRY[python_type]
+            return python_type, cls._REGISTRY[python_type]
 
         # Step 2
         if hasattr(python_type, "__origin__"):
             # Handling of annotated generics, eg:
             # Annotated[typing.List[int], 'foo']
             if get_origin(python_type) is Annotated:
-                return cls.get_transformer(get_args(python_type)[0])
+                return cls._resolve_transformer(get_args(python_type)[0])
 
             if python_type.__origin__ in cls._REGISTRY:
-                return cls._REGISTRY[python_type.__origin__]
+                return python_type.__origin__, cls._REGISTRY[python_type.__origin__]
 
             raise ValueError(f"Generic Type {python_type.__origin__} not supported currently in Flytekit.")
 
         # Step 3
         # To facilitate cases where users may specify one transformer for multiple types that all inherit from one
         # parent.
+        if inspect.isclass(python_type):
+            for base_type in inspect.getmro(python_type)[1:]:
+                if base_type in cls._REGISTRY:
+                    return base_type, cls._REGISTRY[base_type]
         for base_type in cls._REGISTRY.keys():
             if base_type is None:
                 continue  # None is actually one of the keys, but isinstance/issubclass doesn't work on it
@@ -758,7 +910,7 @@ class TypeEngine(typing.Generic[T]):
                 if isinstance(python_type, base_type) or (
                     inspect.isclass(python_type) and issubclass(python_type, base_type)
                 ):
-                    return cls._REGISTRY[base_type]
+                    return base_type, cls._REGISTRY[base_type]
             except TypeError:
                 # As of python 3.9, calls to isinstance raise a TypeError if the base type is not a valid type, which
                 # is the case for one of the restricted types, namely NamedTuple.
@@ -766,15 +918,44 @@ class TypeEngine(typing.Generic[T]):
 
         # Step 4
         if dataclasses.is_dataclass(python_type):
-            return cls._DATACLASS_TRANSFORMER
+            return cls._DATACLASS_KEY, cls._DATACLASS_TRANSFORMER
 
         raise ValueError(f"Type {python_type} not supported currently in Flytekit. Please register a new transformer")
 
     @classmethod
     def to_literal_type(cls, python_type: Type) -> LiteralType:
         """
-        Converts a python type into a flyte specific ``LiteralType``
+        Converts a python type into a flyte specific ``LiteralType``. Results are memoized per python type, so the
+        returned ``LiteralType`` is shared and must not be modified. Types that are not hashable, such as those
+        annotated with ``kwtypes``, are converted every time.
         """
+        try:
+            hash(python_type)
+        except TypeError:
+            return cls._to_literal_type(python_type)[1]
+        # Unions compare equal regardless of the order of their variants, but the order is part of the literal type,
+        # so generic types are keyed on their repr as well
+        order = None if isinstance(python_type, type) else repr(python_type)
+        key = typing.cast(typing.Hashable, python_type)
+        transformer, res = cls._cached_literal_type(key, order)
+        if cls.get_transformer(python_type) is not transformer:
+            # The registry was modified behind our back
+            cls._cached_literal_type.cache_clear()
+            transformer, res = cls._cached_literal_type(key, order)
+        return res
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _cached_literal_type(
+        python_type: Type, order: Optional[str] = None
+    ) -> typing.Tuple[TypeTransformer[T], LiteralType]:
+        return TypeEngine._to_literal_type(python_type)
+
+    @classmethod
+    def _to_literal_type(cls, python_type: Type) -> typing.Tuple[TypeTransformer[T], LiteralType]:
+        if _offloading.resolve(python_type) is not None:
+            transformer, res = cls._to_literal_type(_offloading.strip(python_type))
+            return transformer, _offloading.literal_type(res)
         transformer = cls.get_transformer(python_type)
         res = transformer.get_literal_type(python_type)
         data = None
@@ -791,13 +972,18 @@ class TypeEngine(typing.Generic[T]):
             idl_type_annotation = TypeAnnotationModel(annotations=data)
             res = LiteralType.from_flyte_idl(res.to_flyte_idl())
             res._annotation = idl_type_annotation
-        return res
+        return transformer, res
 
     @classmethod
     def to_literal(cls, ctx: FlyteContext, python_val: typing.Any, python_type: Type, expected: LiteralType) -> Literal:
         """
         Converts a python value of a given type and expected ``LiteralType`` into a resolved ``Literal`` value.
         """
+        if _offloading.resolve(python_type) is not None:
+            # The value is converted as usual, and written to the raw output prefix afterwards
+            python_type = _offloading.strip(python_type)
+            lv = cls.to_literal(ctx, python_val, python_type, cls.to_literal_type(python_type))
+            return _offloading.offload_literal(ctx, lv)
         if python_val is None and expected.union_type is None:
             raise TypeTransformerFailedError(f"Python value cannot be None, expected {python_type}/{expected}")
         transformer = cls.get_transformer(python_type)
@@ -829,6 +1015,11 @@ class TypeEngine(typing.Generic[T]):
         """
         Converts a Literal value with an expected python type into a python value.
         """
+        if _offloading.resolve(expected_python_type) is not None:
+            if not _offloading.is_offloaded(lv):
+                raise TypeTransformerFailedError(f"Expected an offloaded literal for {expected_python_type}, got {lv}")
+            lv = _offloading.load_offloaded(ctx, lv)
+            expected_python_type = _offloading.strip(expected_python_type)
         transformer = cls.get_transformer(expected_python_type)
         return transformer.to_python_value(ctx, lv, expected_python_type)
 
@@ -857,10 +1048,12 @@ class TypeEngine(typing.Generic[T]):
 
     @classmethod
     def literal_map_to_kwargs(
-        cls, ctx: FlyteContext, lm: LiteralMap, python_types: typing.Dict[str, type]
+        cls, ctx: FlyteContext, lm: LiteralMap, python_types: typing.Dict[str, type], lazy: bool = False
     ) -> typing.Dict[str, typing.Any]:
         """
-        Given a ``LiteralMap`` (usually an input into a task - intermediate), convert to kwargs for the task
+        Given a ``LiteralMap`` (usually an input into a task - intermediate), convert to kwargs for the task. Inputs
+        annotated with :py:class:`flytekit.Lazy`, and all the non primitive inputs if lazy is set, are returned as
+        :py:class:`flytekit.core.lazy.LazyInput` proxies that are converted on first access.
         """
         if len(lm.literals) > len(python_types):
             raise ValueError(
@@ -868,12 +1061,23 @@ class TypeEngine(typing.Generic[T]):
             )
         kwargs = {}
         for i, k in enumerate(lm.literals):
-            try:
-                kwargs[k] = TypeEngine.to_python_value(ctx, lm.literals[k], python_types[k])
-            except TypeTransformerFailedError as exc:
-                raise TypeTransformerFailedError(f"Error converting input '{k}' at position {i}:\n  {exc}") from exc
+            convert = functools.partial(cls._input_to_python_value, ctx, lm.literals[k], python_types[k], k, i)
+            if _lazy.resolve(python_types[k]) is not None or (lazy and _lazy.is_heavy(lm.literals[k])):
+                kwargs[k] = _lazy.LazyInput(k, convert)
+            else:
+                kwargs[k] = convert()
         return kwargs
 
+    @classmethod
+    def _input_to_python_value(
+        cls, ctx: FlyteContext, lv: Literal, python_type: type, name: str, position: int
+    ) -> typing.Any:
+        try:
+            return cls.to_python_value(ctx, lv, python_type)
+        except TypeTransformerFailedError as exc:
+            msg = f"Error converting input '{name}' at position {position}:\n  {exc}"
+            raise TypeTransformerFailedError(msg) from exc
+
     @classmethod
     def dict_to_literal_map(
         cls,
@@ -925,22 +1129,51 @@ class TypeEngine(typing.Generic[T]):
     @classmethod
     def guess_python_type(cls, flyte_type: LiteralType) -> type:
         """
-        Transforms a flyte-specific ``LiteralType`` to a regular python value.
+        Transforms a flyte-specific ``LiteralType`` to a regular python value. Only the transformers that declared
+        the shape of the literal type (see :py:meth:`TypeTransformer.reversible_literal_types`) are tried, in the
+        order they were registered.
         """
-        for _, transformer in cls._REGISTRY.items():
+        offloaded_type = _offloading.offloaded_type(flyte_type)
+        if offloaded_type is not None:
+            return Annotated[cls.guess_python_type(offloaded_type), _offloading.Offload()]  # type: ignore
+        for transformer in cls._guess_candidates(flyte_type):
             try:
                 return transformer.guess_python_type(flyte_type)
             except ValueError:
                 logger.debug(f"Skipping transformer {transformer.name} for {flyte_type}")
-
-        # Because the dataclass transformer is handled explicitly in the get_transformer code, we have to handle it
-        # separately here too.
-        try:
-            return cls._DATACLASS_TRANSFORMER.guess_python_type(literal_type=flyte_type)
-        except ValueError:
-            logger.debug(f"Skipping transformer {cls._DATACLASS_TRANSFORMER.name} for {flyte_type}")
         raise ValueError(f"No transformers could reverse Flyte literal type {flyte_type}")
 
+    @classmethod
+    def _guess_index(
+        cls,
+    ) -> typing.Tuple[typing.Dict[typing.Tuple, typing.List[typing.Tuple[int, TypeTransformer]]], typing.List]:
+        if cls._GUESS_INDEX is None or cls._GUESS_INDEX[0] != len(cls._REGISTRY):
+            index: typing.Dict[typing.Tuple, typing.List[typing.Tuple[int, TypeTransformer]]] = {}
+            undeclared: typing.List[typing.Tuple[int, TypeTransformer]] = []
+            # Because the dataclass transformer is handled explicitly in the get_transformer code, it is not in the
+            # registry and goes last.
+            transformers = {id(t): t for t in [*cls._REGISTRY.values(), cls._DATACLASS_TRANSFORMER]}.values()
+            for position, transformer in enumerate(transformers):
+                if type(transformer).guess_python_type is TypeTransformer.guess_python_type:
+                    continue
+                shapes = transformer.reversible_literal_types()
+                if shapes is None:
+                    undeclared.append((position, transformer))
+                    continue
+                for shape in shapes:
+                    index.setdefault(shape, []).append((position, transformer))
+            cls._GUESS_INDEX = (len(cls._REGISTRY), index, undeclared)
+        return cls._GUESS_INDEX[1], cls._GUESS_INDEX[2]
+
+    @classmethod
+    def _guess_candidates(cls, flyte_type: LiteralType) -> typing.List[TypeTransformer]:
+        index, undeclared = cls._guess_index()
+        candidates = dict(undeclared)
+        for shape in literal_type_shapes(flyte_type):
+            candidates.update(index.get(shape, []))
+        # Keep the registration order, so the first transformer that was registered wins like it always did
+        return [candidates[position] for position in sorted(candidates)]
+
 
 class ListTransformer(TypeTransformer[T]):
     """
@@ -970,7 +1203,11 @@ class ListTransformer(TypeTransformer[T]):
         """
         Only univariate Lists are supported in Flyte
         """
+        from flytekit.core import columnar
+
         try:
+            if columnar.resolve(t) is not None:
+                return columnar.literal_type(self.get_sub_type(t))
             sub_type = TypeEngine.to_literal_type(self.get_sub_type(t))
             return _type_models.LiteralType(collection_type=sub_type)
         except Exception as e:
@@ -993,6 +1230,14 @@ class ListTransformer(TypeTransformer[T]):
         return False
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
+        from flytekit.core import columnar
+
+        if columnar.resolve(python_type) is not None:
+            try:
+                return columnar.encode(ctx, python_val, self.get_sub_type(python_type))
+            except TypeError as e:
+                raise TypeTransformerFailedError(str(e)) from e
+
         if type(python_val) != list:
             raise TypeTransformerFailedError("Expected a list")
 
@@ -1007,15 +1252,36 @@ class ListTransformer(TypeTransformer[T]):
                         batch_size = annotation.val
                         break
             if batch_size > 0:
-                lit_list = [TypeEngine.to_literal(ctx, python_val[i : i + batch_size], FlytePickle, expected.collection_type) for i in range(0, len(python_val), batch_size)]  # type: ignore
+                # Batches are pickled and uploaded concurrently
+                lit_list = _convert_elements(
+                    ctx,
+                    lambda batch: TypeEngine.to_literal(ctx, batch, FlytePickle, expected.collection_type),
+                    [python_val[i : i + batch_size] for i in range(0, len(python_val), batch_size)],  # type: ignore
+                    expected.collection_type,
+                )
             else:
                 lit_list = []
         else:
             t = self.get_sub_type(python_type)
-            lit_list = [TypeEngine.to_literal(ctx, x, t, expected.collection_type) for x in python_val]  # type: ignore
+            lit_list = _convert_elements(
+                ctx,
+                lambda x: TypeEngine.to_literal(ctx, x, t, expected.collection_type),  # type: ignore
+                python_val,  # type: ignore
+                expected.collection_type,
+            )
         return Literal(collection=LiteralCollection(literals=lit_list))
 
-    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> typing.List[typing.Any]:  # type: ignore
+    def to_python_value(  # type: ignore
+        self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]
+    ) -> typing.Union[typing.List[typing.Any], np.ndarray]:
+        from flytekit.core import columnar
+
+        columnar_config = columnar.resolve(expected_python_type)
+        if columnar_config is not None:
+            if not columnar.is_columnar(lv):
+                raise TypeTransformerFailedError(f"Expected a column for {expected_python_type}, got {lv}")
+            return columnar.decode(ctx, lv, as_array=columnar_config.as_array)
+
         try:
             lits = lv.collection.literals
         except AttributeError:
@@ -1023,7 +1289,12 @@ class ListTransformer(TypeTransformer[T]):
         if self.is_batchable(expected_python_type):
             from flytekit.types.pickle import FlytePickle
 
-            batch_list = [TypeEngine.to_python_value(ctx, batch, FlytePickle) for batch in lits]
+            batch_list = _convert_elements(
+                ctx,
+                lambda batch: TypeEngine.to_python_value(ctx, batch, FlytePickle),
+                lits,
+                _element_literal_type(FlytePickle),
+            )
             if len(batch_list) > 0 and type(batch_list[0]) is list:
                 # Make it have backward compatibility. The upstream task may use old version of Flytekit that
                 # won't merge the elements in the list. Therefore, we should check if the batch_list[0] is the list first.
@@ -1031,16 +1302,96 @@ class ListTransformer(TypeTransformer[T]):
             return batch_list
         else:
             st = self.get_sub_type(expected_python_type)
-            return [TypeEngine.to_python_value(ctx, x, st) for x in lits]
+            return _convert_elements(
+                ctx, lambda x: TypeEngine.to_python_value(ctx, x, st), lits, _element_literal_type(st)
+            )
 
     def guess_python_type(self, literal_type: LiteralType) -> list:  # type: ignore
         if literal_type.collection_type:
             ct: Type = TypeEngine.guess_python_type(literal_type.collection_type)
             return typing.List[ct]  # type: ignore
+        from flytekit.core import columnar
+
+        element_type = columnar.element_type_of(literal_type)
+        if element_type is not None:
+            return Annotated[typing.List[element_type], columnar.Columnar()]  # type: ignore
         raise ValueError(f"List transformer cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        from flytekit.core import columnar
+
+        return [("collection",)] + [
+            ("blob", _core_types.BlobType.BlobDimensionality.SINGLE, columnar.column_format(t))
+            for t in columnar.ARROW_TYPES
+        ]
+
+
+# Set in the threads that convert the elements of a collection, so nested collections are converted sequentially
+_converting_elements: contextvars.ContextVar[bool] = contextvars.ContextVar("converting_elements", default=False)
+
+
+def _references_blobs(lt: typing.Optional[LiteralType]) -> bool:
+    """
+    Returns whether literals of this type reference blobs, so converting them uploads or downloads data.
+    """
+    if lt is None:
+        return False
+    if lt.blob is not None or lt.structured_dataset_type is not None or lt.schema is not None:
+        return True
+    if lt.collection_type is not None:
+        return _references_blobs(lt.collection_type)
+    if lt.map_value_type is not None:
+        return _references_blobs(lt.map_value_type)
+    if lt.union_type is not None:
+        return any(_references_blobs(v) for v in lt.union_type.variants)
+    return False
+
+
+def _element_literal_type(t: typing.Optional[Type]) -> typing.Optional[LiteralType]:
+    try:
+        return TypeEngine.to_literal_type(t)  # type: ignore
+    except Exception:
+        return None
+
+
+def _convert_elements(
+    ctx: FlyteContext,
+    fn: typing.Callable[[typing.Any], R],
+    items: typing.List[typing.Any],
+    element_type: typing.Optional[LiteralType],
+) -> typing.List[R]:
+    """
+    Applies fn to every element of a collection, returning the results in order. Elements whose literal type
+    references blobs are converted concurrently on up to ``DataConfig.transfer_concurrency`` threads, so that their
+    uploads and downloads overlap. The first conversion that fails cancels the pending ones and is re-raised.
+    """
+    workers = min(ctx.file_access.data_config.transfer_concurrency, len(items))
+    if workers <= 1 or _converting_elements.get() or not _references_blobs(element_type):
+        return [fn(x) for x in items]
+
+    # Worker threads start with an empty context stack, give each of them a copy of the caller's
+    stack = flyte_context_Var.get()
+
+    def _convert_one(x: typing.Any) -> R:
+        flyte_context_Var.set(list(stack))
+        _converting_elements.set(True)
+        return fn(x)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flytekit-convert") as executor:
+        futures = [executor.submit(contextvars.copy_context().run, _convert_one, x) for x in items]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return [future.result() for future in futures]
+
 
 def _add_tag_to_type(x: LiteralType, tag: str) -> LiteralType:
+    # Literal types returned by the TypeEngine are shared, so tag a copy
+    x = copy.copy(x)
     x._structure = TypeStructure(tag=tag)
     return x
 
@@ -1055,74 +1406,94 @@ def _type_essence(x: LiteralType) -> LiteralType:
     return x
 
 
+def _type_fingerprint(x: LiteralType) -> typing.Tuple:
+    """
+    Returns a hashable summary of the parts of a literal type that castability depends on. The metadata, structure and
+    annotation of the type, at any depth, never make a difference and are left out.
+    """
+    if x.collection_type is not None:
+        return ("collection", _type_fingerprint(x.collection_type))
+    if x.map_value_type is not None:
+        return ("map", _type_fingerprint(x.map_value_type))
+    if x.structured_dataset_type is not None:
+        sdt = x.structured_dataset_type
+        columns = tuple((c.name, _type_fingerprint(c.literal_type)) for c in sdt.columns)
+        return ("structured_dataset", sdt.format, sdt.external_schema_type, sdt.external_schema_bytes, columns)
+    if x.union_type is not None:
+        return ("union", tuple(_type_fingerprint(v) for v in x.union_type.variants))
+    if x.enum_type is not None:
+        return ("enum", tuple(x.enum_type.values))
+    if x.simple is not None:
+        return ("simple", x.simple)
+    if x.blob is not None:
+        return ("blob", x.blob.format, x.blob.dimensionality)
+    if x.schema is not None:
+        return ("schema", tuple((c.name, c.type) for c in x.schema.columns))
+    return ("other", _type_essence(x).to_flyte_idl().SerializeToString(deterministic=True))
+
+
 def _are_types_castable(upstream: LiteralType, downstream: LiteralType) -> bool:
-    if upstream.collection_type is not None:
-        if downstream.collection_type is None:
-            return False
+    """
+    Returns whether values of the upstream literal type can be passed where the downstream literal type is expected.
+    Checks are memoized by the fingerprints of the two types, so workflows that bind the same types over and over only
+    compare each pair of types once.
+    """
+    return _are_fingerprints_castable(_type_fingerprint(upstream), _type_fingerprint(downstream))
 
-        return _are_types_castable(upstream.collection_type, downstream.collection_type)
 
-    if upstream.map_value_type is not None:
-        if downstream.map_value_type is None:
+@lru_cache(maxsize=4096)
+def _are_fingerprints_castable(upstream: typing.Tuple, downstream: typing.Tuple) -> bool:
+    kind = upstream[0]
+    if kind in ("collection", "map"):
+        if downstream[0] != kind:
             return False
 
-        return _are_types_castable(upstream.map_value_type, downstream.map_value_type)
+        return _are_fingerprints_castable(upstream[1], downstream[1])
 
     # TODO: Structured dataset type matching requires that downstream structured datasets
     # are a strict sub-set of the upstream structured dataset.
-    if upstream.structured_dataset_type is not None:
-        if downstream.structured_dataset_type is None:
+    if kind == "structured_dataset":
+        if downstream[0] != kind:
             return False
 
-        usdt = upstream.structured_dataset_type
-        dsdt = downstream.structured_dataset_type
-
-        if usdt.format != dsdt.format:
+        # format, external schema type and external schema bytes
+        if upstream[1:4] != downstream[1:4]:
             return False
 
-        if usdt.external_schema_type != dsdt.external_schema_type:
-            return False
-
-        if usdt.external_schema_bytes != dsdt.external_schema_bytes:
-            return False
-
-        ucols = usdt.columns
-        dcols = dsdt.columns
+        ucols = upstream[4]
+        dcols = downstream[4]
 
         if len(ucols) != len(dcols):
             return False
 
-        for u, d in zip(ucols, dcols):
-            if u.name != d.name:
+        for (u_name, u_type), (d_name, d_type) in zip(ucols, dcols):
+            if u_name != d_name:
                 return False
 
-            if not _are_types_castable(u.literal_type, d.literal_type):
+            if not _are_fingerprints_castable(u_type, d_type):
                 return False
 
         return True
 
-    if upstream.union_type is not None:
+    if kind == "union":
         # for each upstream variant, there must be a compatible type downstream
-        for v in upstream.union_type.variants:
-            if not _are_types_castable(v, downstream):
+        for v in upstream[1]:
+            if not _are_fingerprints_castable(v, downstream):
                 return False
         return True
 
-    if downstream.union_type is not None:
+    if downstream[0] == "union":
         # there must be a compatible downstream type
-        for v in downstream.union_type.variants:
-            if _are_types_castable(upstream, v):
+        for v in downstream[1]:
+            if _are_fingerprints_castable(upstream, v):
                 return True
 
-    if upstream.enum_type is not None:
+    if kind == "enum":
         # enums are castable to string
-        if downstream.simple == SimpleType.STRING:
+        if downstream == ("simple", SimpleType.STRING):
             return True
 
-    if _type_essence(upstream) == _type_essence(downstream):
-        return True
-
-    return False
+    return upstream == downstream
 
 
 class UnionTransformer(TypeTransformer[T]):
@@ -1132,6 +1503,40 @@ class UnionTransformer(TypeTransformer[T]):
 
     def __init__(self):
         super().__init__("Typed Union", typing.Union)
+        # Size of the TypeEngine registry the caches below were filled with
+        self._registry_size = -1
+        # (union type, python type of the value) -> (variant, stored type) that converted the last such value
+        self._variants: typing.Dict[typing.Tuple[typing.Any, type], typing.Tuple[typing.Any, LiteralType]] = {}
+        # union type -> transformer name -> variants converted by that transformer
+        self._tagged: typing.Dict[typing.Any, typing.Dict[str, typing.List[typing.Any]]] = {}
+
+    def _check_caches(self):
+        # Registering a transformer may change the variant a value converts to
+        if self._registry_size != len(TypeEngine._REGISTRY):
+            self._variants.clear()
+            self._tagged.clear()
+            self._registry_size = len(TypeEngine._REGISTRY)
+
+    def _tagged_variants(self, t: Type[T]) -> typing.Dict[str, typing.List[typing.Any]]:
+        """
+        Returns the variants of a union grouped by the name of their transformer, which is the tag of the stored type
+        of the literals they produce.
+        """
+        self._check_caches()
+        try:
+            tagged = self._tagged.get(t)
+            hashable = True
+        except TypeError:
+            # Unions with unhashable Annotated metadata are grouped every time
+            tagged, hashable = None, False
+
+        if tagged is None:
+            tagged = {}
+            for v in get_args(t):
+                tagged.setdefault(TypeEngine.get_transformer(v).name, []).append(v)
+            if hashable:
+                self._tagged[t] = tagged
+        return tagged
 
     @staticmethod
     def is_optional_type(t: Type[T]) -> bool:
@@ -1163,9 +1568,31 @@ class UnionTransformer(TypeTransformer[T]):
         if get_origin(python_type) is Annotated:
             python_type = get_args(python_type)[0]
 
+        # Values of the same python type almost always convert to the same variant, so the variant that converted the
+        # last such value is tried first, instead of trying, and failing, to convert the value to every other variant.
+        # The variant of a container depends on its elements, and an empty one may match several variants, so those
+        # always go through the ambiguity check below.
+        self._check_caches()
+        key: typing.Optional[typing.Tuple[typing.Any, type]] = (python_type, type(python_val))
+        if isinstance(python_val, (list, tuple, dict, set, frozenset)):
+            key = None
+        try:
+            cached = self._variants.get(key) if key is not None else None  # type: ignore
+        except TypeError:
+            key, cached = None, None
+        if cached is not None:
+            variant, stored_type = cached
+            try:
+                variant_transformer: TypeTransformer[T] = TypeEngine.get_transformer(variant)
+                res = variant_transformer.to_literal(ctx, python_val, variant, expected)
+                return Literal(scalar=Scalar(union=Union(value=res, stored_type=stored_type)))
+            except (TypeTransformerFailedError, AttributeError, ValueError, AssertionError) as e:
+                logger.debug(f"Failed to convert from {python_val} to {variant}", e)
+
         found_res = False
         res = None
         res_type = None
+        res_variant = None
         for t in get_args(python_type):
             try:
                 trans: TypeTransformer[T] = TypeEngine.get_transformer(t)
@@ -1176,11 +1603,14 @@ class UnionTransformer(TypeTransformer[T]):
                     # Should really never happen, sanity check
                     raise TypeError("Ambiguous choice of variant for union type")
                 found_res = True
+                res_variant = t
             except (TypeTransformerFailedError, AttributeError, ValueError, AssertionError) as e:
                 logger.debug(f"Failed to convert from {python_val} to {t}", e)
                 continue
 
         if found_res:
+            if key is not None:
+                self._variants[key] = (res_variant, typing.cast(LiteralType, res_type))
             return Literal(scalar=Scalar(union=Union(value=res, stored_type=res_type)))
 
         raise TypeTransformerFailedError(f"Cannot convert from {python_val} to {python_type}")
@@ -1196,16 +1626,20 @@ class UnionTransformer(TypeTransformer[T]):
             if union_type.structure is not None:
                 union_tag = union_type.structure.tag
 
+        # Tagged literals are only decoded by the variants whose transformer produced the tag
+        variants = (
+            self._tagged_variants(expected_python_type).get(union_tag, [])
+            if union_tag is not None
+            else get_args(expected_python_type)
+        )
+
         found_res = False
         res = None
         res_tag = None
-        for v in get_args(expected_python_type):
+        for v in variants:
             try:
                 trans: TypeTransformer[T] = TypeEngine.get_transformer(v)
                 if union_tag is not None:
-                    if trans.name != union_tag:
-                        continue
-
                     expected_literal_type = TypeEngine.to_literal_type(v)
                     if not _are_types_castable(union_type, expected_literal_type):
                         continue
@@ -1244,6 +1678,9 @@ class UnionTransformer(TypeTransformer[T]):
 
         raise ValueError(f"Union transformer cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("union",)]
+
 
 class DictTransformer(TypeTransformer[dict]):
     """
@@ -1302,14 +1739,18 @@ class DictTransformer(TypeTransformer[dict]):
         if expected and expected.simple and expected.simple == SimpleType.STRUCT:
             return self.dict_to_generic_literal(python_val)
 
-        lit_map = {}
-        for k, v in python_val.items():
+        for k in python_val.keys():
             if type(k) != str:
                 raise ValueError("Flyte MapType expects all keys to be strings")
-            # TODO: log a warning for Annotated objects that contain HashMethod
-            k_type, v_type = self.get_dict_types(python_type)
-            lit_map[k] = TypeEngine.to_literal(ctx, v, cast(type, v_type), expected.map_value_type)
-        return Literal(map=LiteralMap(literals=lit_map))
+        # TODO: log a warning for Annotated objects that contain HashMethod
+        k_type, v_type = self.get_dict_types(python_type)
+        values = _convert_elements(
+            ctx,
+            lambda v: TypeEngine.to_literal(ctx, v, cast(type, v_type), expected.map_value_type),
+            list(python_val.values()),
+            expected.map_value_type,
+        )
+        return Literal(map=LiteralMap(literals=dict(zip(python_val.keys(), values))))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[dict]) -> dict:
         if lv and lv.map and lv.map.literals is not None:
@@ -1322,10 +1763,13 @@ class DictTransformer(TypeTransformer[dict]):
                 )
             if tp[0] != str:
                 raise TypeError("TypeMismatch. Destination dictionary does not accept 'str' key")
-            py_map = {}
-            for k, v in lv.map.literals.items():
-                py_map[k] = TypeEngine.to_python_value(ctx, v, cast(Type, tp[1]))
-            return py_map
+            values = _convert_elements(
+                ctx,
+                lambda v: TypeEngine.to_python_value(ctx, v, cast(Type, tp[1])),  # type: ignore
+                list(lv.map.literals.values()),
+                _element_literal_type(tp[1]),
+            )
+            return dict(zip(lv.map.literals.keys(), values))
 
         # for empty generic we have to explicitly test for lv.scalar.generic is not None as empty dict
         # evaluates to false
@@ -1347,6 +1791,9 @@ class DictTransformer(TypeTransformer[dict]):
 
         raise ValueError(f"Dictionary transformer cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("map",), ("simple", SimpleType.STRUCT)]
+
 
 class TextIOTransformer(TypeTransformer[typing.TextIO]):
     """
@@ -9,6 +9,8 @@
     PyTorchCheckpointTransformer
     PyTorchModuleTransformer
     PyTorchTensorTransformer
+    StateDict
+    StateDictTransformer
 """
 from flytekit.loggers import logger
 
@@ -26,7 +28,8 @@ except (ImportError, OSError):
 if _torch_installed:
     from .checkpoint import PyTorchCheckpoint, PyTorchCheckpointTransformer
     from .native import PyTorchModuleTransformer, PyTorchTensorTransformer
+    from .tensorfile import StateDict, StateDictTransformer
 else:
     logger.info(
-        "We won't register PyTorchCheckpointTransformer, PyTorchTensorTransformer, and PyTorchModuleTransformer because torch is not installed."
+        "We won't register PyTorchCheckpointTransformer, PyTorchTensorTransformer, PyTorchModuleTransformer, and StateDictTransformer because torch is not installed."
     )
@@ -133,5 +133,8 @@ class PyTorchCheckpointTransformer(TypeTransformer[PyTorchCheckpoint]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.PYTORCH_CHECKPOINT_FORMAT)]
+
 
 TypeEngine.register(PyTorchCheckpointTransformer())
@@ -1,18 +1,39 @@
 import pathlib
-from typing import Type, TypeVar
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
 
 import torch
+from typing_extensions import Annotated, get_args, get_origin
 
 from flytekit.core.context_manager import FlyteContext
+from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
 from flytekit.models.core import types as _core_types
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
 
+from . import tensorfile
+
 T = TypeVar("T")
 
 
+def extract_metadata(t: Type[T]) -> Tuple[Type[T], Dict[str, bool]]:
+    metadata = {}
+    if get_origin(t) is Annotated:
+        base_type, metadata = get_args(t)
+        if isinstance(metadata, dict):
+            return base_type, metadata
+        else:
+            raise TypeTransformerFailedError(f"{t}'s metadata needs to be of type kwtypes.")
+    return t, metadata
+
+
 class PyTorchTypeTransformer(TypeTransformer[T]):
+    """
+    Base TypeTransformer of tensors and modules, which are stored with ``torch.save`` by default. With
+    ``Annotated[torch.Tensor, kwtypes(safetensors=True)]`` they are stored as tensor files in the safetensors layout
+    instead, which are memory mapped when they are loaded. Both kinds of files are read whatever the annotation.
+    """
+
     def get_literal_type(self, t: Type[T]) -> LiteralType:
         return LiteralType(
             blob=_core_types.BlobType(
@@ -35,6 +56,20 @@ class PyTorchTypeTransformer(TypeTransformer[T]):
             )
         )
 
+        _, metadata = extract_metadata(python_type)
+        if metadata.get("safetensors", False):
+            local_path = ctx.file_access.get_random_local_path() + ".safetensors"
+            pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+            try:
+                if isinstance(python_val, torch.nn.Module):
+                    tensorfile.write_module(python_val, local_path)
+                else:
+                    tensorfile.write_tensor(python_val, local_path)
+            except TypeError as e:
+                raise TypeTransformerFailedError(str(e)) from e
+            remote_path = ctx.file_access.put_raw_data(local_path, is_multipart=False, preserve_name=False)
+            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+
         local_path = ctx.file_access.get_random_local_path() + ".pt"
         pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -51,8 +86,15 @@ class PyTorchTypeTransformer(TypeTransformer[T]):
         except AttributeError:
             TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
 
-        local_path = ctx.file_access.get_random_local_path()
-        ctx.file_access.get_data(uri, local_path, is_multipart=False)
+        if not ctx.file_access.is_remote(uri):
+            # Tensor files on the local file system are memory mapped in place
+            local_path = FileAccessProvider.strip_file_header(uri)
+            if not _is_tensor_file(local_path):
+                local_path = ctx.file_access.get_random_local_path()
+                ctx.file_access.get_data(uri, local_path, is_multipart=False)
+        else:
+            local_path = ctx.file_access.get_random_local_path()
+            ctx.file_access.get_data(uri, local_path, is_multipart=False)
 
         # cpu <-> gpu conversion
         if torch.cuda.is_available():
@@ -60,10 +102,20 @@ class PyTorchTypeTransformer(TypeTransformer[T]):
         else:
             map_location = torch.device("cpu")
 
+        if _is_tensor_file(local_path):
+            # Tensors over the memory mapped file are only copied when they are moved to the gpu
+            value = tensorfile.load(local_path)
+            return value.to(map_location) if map_location != torch.device("cpu") else value
+
         # load pytorch tensor/module from a file
         return torch.load(local_path, map_location=map_location)
 
 
+def _is_tensor_file(path: str) -> bool:
+    with open(path, "rb") as f:
+        return tensorfile.is_tensor_file(f.read(tensorfile.HEADER_SIZE.size + 1))
+
+
 class PyTorchTensorTransformer(PyTorchTypeTransformer[torch.Tensor]):
     PYTORCH_FORMAT = "PyTorchTensor"
 
@@ -80,6 +132,9 @@ class PyTorchTensorTransformer(PyTorchTypeTransformer[torch.Tensor]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.PYTORCH_FORMAT)]
+
 
 class PyTorchModuleTransformer(PyTorchTypeTransformer[torch.nn.Module]):
     PYTORCH_FORMAT = "PyTorchModule"
@@ -97,6 +152,9 @@ class PyTorchModuleTransformer(PyTorchTypeTransformer[torch.nn.Module]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.PYTORCH_FORMAT)]
+
 
 TypeEngine.register(PyTorchTensorTransformer())
 TypeEngine.register(PyTorchModuleTransformer())
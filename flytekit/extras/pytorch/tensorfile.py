@@ -0,0 +1,341 @@
+"""
+Flat tensor files in the `safetensors <https://github.com/huggingface/safetensors>`__ layout: an 8 byte little endian
+header size, a JSON header giving the dtype, shape and byte range of every tensor, and the bytes of the tensors one
+after the other. Unlike ``torch.save``, loading such a file memory maps it and creates the tensors over the mapping,
+so loading multi gigabyte weights does not hold a second copy of them in memory, and single tensors can be read from
+a remote file with range requests. Files written here can be read by the ``safetensors`` library, and the other way
+around, but the library is not required.
+"""
+import base64
+import io
+import json
+import mmap
+import pickle
+import struct
+import typing
+from collections import OrderedDict
+from typing import Type
+
+import torch
+
+from flytekit.core.context_manager import FlyteContext, FlyteContextManager
+from flytekit.core.data_persistence import FileAccessProvider
+from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
+from flytekit.models.core import types as _core_types
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+from flytekit.models.types import LiteralType
+
+HEADER_SIZE = struct.Struct("<Q")
+# The safetensors library refuses headers larger than this
+MAX_HEADER_SIZE = 100 * 2**20
+METADATA_KEY = "__metadata__"
+# Keys of the header metadata used to rebuild modules and tensors
+MODULE_KEY = "flytekit.module"
+REQUIRES_GRAD_KEY = "flytekit.requires_grad"
+
+_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "C64": torch.complex64,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+for _name, _attr in [("F8_E4M3", "float8_e4m3fn"), ("F8_E5M2", "float8_e5m2")]:
+    if hasattr(torch, _attr):
+        _DTYPES[_name] = getattr(torch, _attr)
+_DTYPE_NAMES = {v: k for k, v in _DTYPES.items()}
+
+
+def is_tensor_file(prefix: bytes) -> bool:
+    """
+    Returns whether the first bytes of a file, at least 9 of them, are those of a tensor file. Files written by
+    ``torch.save`` start with a zip or pickle header instead.
+    """
+    if len(prefix) < HEADER_SIZE.size + 1:
+        return False
+    (size,) = HEADER_SIZE.unpack_from(prefix)
+    return 0 < size <= MAX_HEADER_SIZE and prefix[HEADER_SIZE.size : HEADER_SIZE.size + 1] == b"{"
+
+
+def write_tensors(
+    tensors: typing.Mapping[str, torch.Tensor], path: str, metadata: typing.Optional[typing.Dict[str, str]] = None
+):
+    """
+    Writes tensors to a tensor file. Tensors on other devices are copied to the cpu one at a time, tensors on the cpu
+    are written without copies.
+    """
+    tensors = {name: t.detach() for name, t in tensors.items()}
+    # Larger elements first, so that every tensor is aligned to its element size in the file
+    names = sorted(tensors, key=lambda n: -tensors[n].element_size())
+
+    header: typing.Dict[str, typing.Any] = {}
+    if metadata:
+        header[METADATA_KEY] = metadata
+    offset = 0
+    for name in names:
+        t = tensors[name]
+        if t.dtype not in _DTYPE_NAMES:
+            raise TypeError(f"Tensor {name} has dtype {t.dtype}, which cannot be written to a tensor file")
+        nbytes = t.numel() * t.element_size()
+        header[name] = {
+            "dtype": _DTYPE_NAMES[t.dtype],
+            "shape": list(t.shape),
+            "data_offsets": [offset, offset + nbytes],
+        }
+        offset += nbytes
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Pad the header with spaces so the tensors start at an offset that is a multiple of 8
+    encoded += b" " * (-(HEADER_SIZE.size + len(encoded)) % 8)
+
+    with open(path, "wb") as f:
+        f.write(HEADER_SIZE.pack(len(encoded)))
+        f.write(encoded)
+        for name in names:
+            t = tensors[name]
+            if t.numel() == 0:
+                continue
+            t = t.to("cpu").contiguous().resolve_conj().resolve_neg()
+            f.write(t.reshape(-1).view(torch.uint8).numpy().data)
+
+
+def _parse_header(encoded: bytes) -> typing.Tuple[typing.Dict[str, typing.Dict], typing.Dict[str, str]]:
+    header = json.loads(encoded)
+    metadata = header.pop(METADATA_KEY, None) or {}
+    return header, metadata
+
+
+def _to_tensor(buffer: typing.Any, info: typing.Dict[str, typing.Any], offset: int) -> torch.Tensor:
+    dtype = _DTYPES.get(info["dtype"])
+    if dtype is None:
+        raise TypeError(f"Tensor files with dtype {info['dtype']} are not supported")
+    begin, end = info["data_offsets"]
+    if begin == end:
+        return torch.empty(info["shape"], dtype=dtype)
+    count = (end - begin) // (torch.empty((), dtype=dtype).element_size())
+    return torch.frombuffer(buffer, dtype=dtype, count=count, offset=offset + begin).reshape(info["shape"])
+
+
+def load_tensors(path: str) -> typing.Tuple["OrderedDict[str, torch.Tensor]", typing.Dict[str, str]]:
+    """
+    Memory maps a tensor file and returns its tensors, in the order they were written, and its metadata. The mapping
+    is copy on write, so changing the tensors does not change the file.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    (size,) = HEADER_SIZE.unpack_from(buffer)
+    header, metadata = _parse_header(buffer[HEADER_SIZE.size : HEADER_SIZE.size + size])
+    offset = HEADER_SIZE.size + size
+    tensors = OrderedDict(
+        (name, _to_tensor(buffer, info, offset))
+        for name, info in sorted(header.items(), key=lambda item: item[1]["data_offsets"][0])
+    )
+    return tensors, metadata
+
+
+class _ModulePickler(pickle.Pickler):
+    """
+    Pickles a module without the tensors of its state dict, which are replaced by references to their names.
+    """
+
+    def __init__(self, file: typing.IO, names: typing.Dict[int, str]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._names = names
+
+    def persistent_id(self, obj):
+        if isinstance(obj, torch.Tensor) and id(obj) in self._names:
+            return self._names[id(obj)], isinstance(obj, torch.nn.Parameter), obj.requires_grad
+        return None
+
+
+class _ModuleUnpickler(pickle.Unpickler):
+    def __init__(self, file: typing.IO, tensors: typing.Mapping[str, torch.Tensor]):
+        super().__init__(file)
+        self._tensors = tensors
+        # Tied weights are the same tensor, and must stay so
+        self._loaded: typing.Dict[str, torch.Tensor] = {}
+
+    def persistent_load(self, pid):
+        name, is_parameter, requires_grad = pid
+        if name not in self._loaded:
+            t = self._tensors[name]
+            if is_parameter:
+                self._loaded[name] = torch.nn.Parameter(t, requires_grad)
+            else:
+                self._loaded[name] = t.requires_grad_(requires_grad)
+        return self._loaded[name]
+
+
+def write_module(module: torch.nn.Module, path: str):
+    """
+    Writes the state dict of a module to a tensor file, and the module itself, pickled without its state dict, to the
+    metadata of the file.
+    """
+    names: typing.Dict[int, str] = {}
+    tensors: typing.Dict[str, torch.Tensor] = {}
+    for name, t in module.state_dict(keep_vars=True).items():
+        if isinstance(t, torch.Tensor) and id(t) not in names:
+            names[id(t)] = name
+            tensors[name] = t
+    skeleton = io.BytesIO()
+    _ModulePickler(skeleton, names).dump(module)
+    write_tensors(tensors, path, {"format": "pt", MODULE_KEY: base64.b64encode(skeleton.getvalue()).decode("ascii")})
+
+
+def write_tensor(tensor: torch.Tensor, path: str):
+    """
+    Writes a single tensor to a tensor file.
+    """
+    write_tensors({"tensor": tensor}, path, {"format": "pt", REQUIRES_GRAD_KEY: str(tensor.requires_grad).lower()})
+
+
+def load(path: str) -> typing.Union[torch.Tensor, torch.nn.Module]:
+    """
+    Loads a tensor written by :py:func:`write_tensor` or a module written by :py:func:`write_module`.
+    """
+    tensors, metadata = load_tensors(path)
+    if MODULE_KEY in metadata:
+        return _ModuleUnpickler(io.BytesIO(base64.b64decode(metadata[MODULE_KEY])), tensors).load()
+    if "tensor" not in tensors:
+        raise ValueError(f"{path} is a tensor file, but neither a module nor a single tensor")
+    return tensors["tensor"].requires_grad_(metadata.get(REQUIRES_GRAD_KEY) == "true")
+
+
+class StateDict(typing.Mapping[str, torch.Tensor]):
+    """
+    A state dict stored as a tensor file. Tensors are read when they are accessed: local files are memory mapped, and
+    only the bytes of the accessed tensors are read from remote files, so a task can load a few layers of a large
+    model without downloading all of it:
+
+    .. code-block:: python
+
+        @task
+        def train() -> StateDict:
+            return model.state_dict()
+
+        @task
+        def embeddings(weights: StateDict) -> torch.Tensor:
+            return weights["embed.weight"]
+
+    ``model.load_state_dict(weights)`` reads all the tensors.
+    """
+
+    def __init__(self, uri: str):
+        self._uri = uri
+        self._header: typing.Optional[typing.Dict[str, typing.Dict]] = None
+        self._metadata: typing.Dict[str, str] = {}
+        self._offset = 0
+        self._tensors: typing.Optional[typing.Mapping[str, torch.Tensor]] = None
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @property
+    def metadata(self) -> typing.Dict[str, str]:
+        self._read_header()
+        return self._metadata
+
+    def _read_header(self) -> typing.Dict[str, typing.Dict]:
+        if self._header is None:
+            file_access = FlyteContextManager.current_context().file_access
+            if not file_access.is_remote(self._uri):
+                self._tensors, self._metadata = load_tensors(FileAccessProvider.strip_file_header(self._uri))
+                self._header = {name: {} for name in self._tensors}
+            else:
+                prefix = file_access.read_range(self._uri, 0, HEADER_SIZE.size + 1)
+                if not is_tensor_file(prefix):
+                    raise ValueError(f"{self._uri} is not a tensor file")
+                (size,) = HEADER_SIZE.unpack_from(prefix)
+                self._header, self._metadata = _parse_header(file_access.read_range(self._uri, HEADER_SIZE.size, size))
+                self._offset = HEADER_SIZE.size + size
+        return self._header
+
+    def __getitem__(self, name: str) -> torch.Tensor:
+        info = self._read_header()[name]
+        if self._tensors is not None:
+            return self._tensors[name]
+        begin, end = info["data_offsets"]
+        file_access = FlyteContextManager.current_context().file_access
+        data = bytearray(file_access.read_range(self._uri, self._offset + begin, end - begin)) if end > begin else b""
+        return _to_tensor(data, {**info, "data_offsets": [0, end - begin]}, 0)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._read_header())
+
+    def __len__(self) -> int:
+        return len(self._read_header())
+
+    def __repr__(self):
+        return f"StateDict(uri={self._uri})"
+
+
+class StateDictTransformer(TypeTransformer[StateDict]):
+    """
+    TypeTransformer that stores state dicts, mappings of names to tensors, as tensor files, and passes them to tasks
+    as a :py:class:`StateDict`.
+    """
+
+    STATE_DICT_FORMAT = "PyTorchStateDict"
+
+    def __init__(self):
+        super().__init__(name="PyTorch State Dict", t=StateDict)
+
+    def get_literal_type(self, t: Type[StateDict]) -> LiteralType:
+        return LiteralType(
+            blob=_core_types.BlobType(
+                format=self.STATE_DICT_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
+            )
+        )
+
+    def assert_type(self, t: Type[StateDict], v: typing.Any):
+        if not isinstance(v, typing.Mapping) or not all(isinstance(x, torch.Tensor) for x in v.values()):
+            raise TypeTransformerFailedError(f"Expected a mapping of names to tensors, got {type(v)}")
+
+    def to_literal(
+        self,
+        ctx: FlyteContext,
+        python_val: typing.Mapping[str, torch.Tensor],
+        python_type: Type[StateDict],
+        expected: LiteralType,
+    ) -> Literal:
+        meta = BlobMetadata(type=self.get_literal_type(python_type).blob)
+        if isinstance(python_val, StateDict):
+            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=python_val.uri)))
+        self.assert_type(python_type, python_val)
+
+        local_path = ctx.file_access.get_random_local_path() + ".safetensors"
+        try:
+            write_tensors(python_val, local_path, {"format": "pt"})
+        except TypeError as e:
+            raise TypeTransformerFailedError(str(e)) from e
+        remote_path = ctx.file_access.put_raw_data(local_path, is_multipart=False, preserve_name=False)
+        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[StateDict]) -> StateDict:
+        try:
+            uri = lv.scalar.blob.uri
+        except AttributeError:
+            raise TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
+        return StateDict(uri)
+
+    def guess_python_type(self, literal_type: LiteralType) -> Type[StateDict]:
+        if (
+            literal_type.blob is not None
+            and literal_type.blob.dimensionality == _core_types.BlobType.BlobDimensionality.SINGLE
+            and literal_type.blob.format == self.STATE_DICT_FORMAT
+        ):
+            return StateDict
+
+        raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
+
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.STATE_DICT_FORMAT)]
+
+
+TypeEngine.register(StateDictTransformer())
@@ -1,5 +1,5 @@
 import pathlib
-from typing import Generic, Type, TypeVar
+from typing import Generic, List, Optional, Tuple, Type, TypeVar
 
 import joblib
 import sklearn
@@ -68,6 +68,9 @@ class SklearnTypeTransformer(TypeTransformer, Generic[T]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.SKLEARN_FORMAT)]
+
 
 class SklearnEstimatorTransformer(SklearnTypeTransformer[sklearn.base.BaseEstimator]):
     SKLEARN_FORMAT = "SklearnEstimator"
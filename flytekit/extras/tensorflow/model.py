@@ -1,5 +1,5 @@
 import pathlib
-from typing import Type
+from typing import List, Optional, Tuple, Type
 
 import tensorflow as tf
 
@@ -72,5 +72,8 @@ class TensorFlowModelTransformer(TypeTransformer[tf.keras.Model]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.MULTIPART, self.TENSORFLOW_FORMAT)]
+
 
 TypeEngine.register(TensorFlowModelTransformer())
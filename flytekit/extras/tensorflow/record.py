@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass
-from typing import Optional, Tuple, Type, Union
+from typing import List, Optional, Tuple, Type, Union
 
 import tensorflow as tf
 from dataclasses_json import dataclass_json
@@ -114,6 +114,9 @@ class TensorFlowRecordFileTransformer(TypeTransformer[TFRecordFile]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.TENSORFLOW_FORMAT)]
+
 
 class TensorFlowRecordsDirTransformer(TypeTransformer[TFRecordsDirectory]):
     """
@@ -182,6 +185,9 @@ class TensorFlowRecordsDirTransformer(TypeTransformer[TFRecordsDirectory]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.MULTIPART, self.TENSORFLOW_FORMAT)]
+
 
 TypeEngine.register(TensorFlowRecordsDirTransformer())
 TypeEngine.register(TensorFlowRecordFileTransformer())
@@ -357,8 +357,9 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
             if remote_directory is None:
-                remote_directory = ctx.file_access.get_random_remote_directory()
-            ctx.file_access.put_data(source_path, remote_directory, is_multipart=True)
+                remote_directory = ctx.file_access.put_raw_data(source_path, is_multipart=True)
+            else:
+                ctx.file_access.put_data(source_path, remote_directory, is_multipart=True)
             return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_directory)))
 
         # If not uploading, then we can only take the original source path as the uri.
@@ -397,5 +398,8 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
             return FlyteDirectory.__class_getitem__(literal_type.blob.format)
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.MULTIPART)]
+
 
 TypeEngine.register(FlyteDirToMultipartBlobTransformer())
@@ -10,6 +10,7 @@ from dataclasses_json import config, dataclass_json
 from marshmallow import fields
 from typing_extensions import Annotated, get_args, get_origin
 
+from flytekit.core import compression as _compression
 from flytekit.core.context_manager import FlyteContext, FlyteContextManager
 from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
 from flytekit.loggers import logger
@@ -202,6 +203,7 @@ class FlyteFile(os.PathLike, typing.Generic[T]):
         self._downloaded = False
         self._remote_path = remote_path
         self._remote_source = None
+        self._compression: typing.Optional[_compression.Compression] = None
 
     def __fspath__(self):
         # This is where a delayed downloading of the file will happen
@@ -239,15 +241,52 @@ class FlyteFile(os.PathLike, typing.Generic[T]):
     def download(self) -> str:
         return self.__fspath__()
 
+    def _read_location(self) -> str:
+        if self._compression is not None:
+            # Byte offsets refer to the decompressed content
+            return self.download()
+        if self.remote_source and not self._downloaded:
+            return self.remote_source
+        return str(self.path)
+
+    def read_range(self, start: int, length: typing.Optional[int] = None) -> bytes:
+        """
+        Reads a slice of the file without downloading all of it. For remote inputs this issues a range request, so
+        reading a parquet footer or the tail of a log only transfers the requested bytes.
+
+        .. code-block:: python
+
+            @task
+            def footer_length(ff: FlyteFile) -> int:
+                return int.from_bytes(ff.read_range(-8, 4), "little")
+
+        :param start: int Offset of the first byte, a negative offset counts from the end of the file
+        :param length: optional int Number of bytes to read, reads until the end of the file if not given
+        """
+        ctx = FlyteContextManager.current_context()
+        return ctx.file_access.read_range(self._read_location(), start, length)
+
+    def download_range(self, start: int, length: typing.Optional[int] = None) -> str:
+        """
+        Downloads only a slice of the file to a new local file and returns its path. The FlyteFile itself is not
+        marked as downloaded. See :py:meth:`read_range` for the meaning of the arguments.
+        """
+        ctx = FlyteContextManager.current_context()
+        local_path = ctx.file_access.get_random_local_path(self._read_location())
+        ctx.file_access.get_data_range(self._read_location(), local_path, start, length)
+        return local_path
+
     @contextmanager
     def open(
         self,
         mode: str,
         cache_type: typing.Optional[str] = None,
         cache_options: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        streaming: bool = True,
+        block_size: typing.Optional[int] = None,
     ):
         """
-        Returns a streaming File handle
+        Returns a streaming File handle. Reads start immediately and never spill the whole object to local disk.
 
         .. code-block:: python
 
@@ -278,15 +317,24 @@ class FlyteFile(os.PathLike, typing.Generic[T]):
                              especially useful for large file reads
         :param cache_options: optional Dict[str, Any] Refer to fsspec caching options. This is strongly coupled to the
                         cache_protocol
+        :param streaming: bool If False and the file is opened for reading, the whole file is downloaded first and the
+                        local copy is opened instead. Useful for heavy random access patterns.
+        :param block_size: optional int Size of the blocks fetched from the remote store, defaults to
+                        ``DataConfig.stream_block_size``
         """
         ctx = FlyteContextManager.current_context()
+        if (not streaming or self._compression is not None) and "r" in mode:
+            with open(self.download(), mode) as f:
+                yield f
+            return
         final_path = self.path
         if self.remote_source:
             final_path = self.remote_source
         elif self.remote_path:
             final_path = self.remote_path
-        fs = ctx.file_access.get_filesystem_for_path(final_path)
-        f = fs.open(final_path, mode, cache_type=cache_type, cache_options=cache_options)
+        f = ctx.file_access.open(
+            str(final_path), mode, block_size=block_size, cache_type=cache_type, cache_options=cache_options
+        )
         yield f
         f.close()
 
@@ -336,6 +384,8 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         if python_val is None:
             raise TypeTransformerFailedError("None value cannot be converted to a file.")
 
+        compression = _compression.resolve(python_type, ctx.file_access.data_config)
+
         # Correctly handle `Annotated[FlyteFile, ...]` by extracting the origin type
         if get_origin(python_type) is Annotated:
             python_type = get_args(python_type)[0]
@@ -352,6 +402,8 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
             # If the object has a remote source, then we just convert it back. This means that if someone is just
             # going back and forth between a FlyteFile Python value and a Blob Flyte IDL value, we don't do anything.
             if python_val._remote_source is not None:
+                if python_val._compression is not None:
+                    meta = BlobMetadata(type=self._blob_type(format=python_val._compression.format(meta.type.format)))
                 return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=python_val._remote_source)))
 
             # If the user specified the remote_path to be False, that means no matter what, do not upload. Also if the
@@ -393,10 +445,19 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
 
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
-            if remote_path is None:
-                remote_path = ctx.file_access.get_random_remote_path(source_path)
-            ctx.file_access.put_data(source_path, remote_path, is_multipart=False)
-            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+            if remote_path is not None:
+                ctx.file_access.put_data(source_path, str(remote_path), is_multipart=False)
+                return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=str(remote_path))))
+            # Only the raw data paths flytekit picks itself are compressed, an explicit destination is kept as is
+            if compression is not None:
+                local_dir = ctx.file_access.get_random_local_directory()
+                pathlib.Path(local_dir).mkdir(parents=True, exist_ok=True)
+                source_path = compression.compress(
+                    str(source_path), os.path.join(local_dir, os.path.basename(source_path) + compression.extension)
+                )
+                meta = BlobMetadata(type=self._blob_type(format=compression.format(meta.type.format)))
+            uri = ctx.file_access.put_raw_data(source_path, is_multipart=False)
+            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=uri)))
         # If not uploading, then we can only take the original source path as the uri.
         else:
             return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=source_path)))
@@ -408,6 +469,12 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
             uri = lv.scalar.blob.uri
         except AttributeError:
             raise TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
+
+        # Only blobs flytekit compressed itself record a codec in their format, whatever the reader asked for
+        _, compression = _compression.from_format(lv.scalar.blob.metadata.type.format)
+        if get_origin(expected_python_type) is Annotated:
+            expected_python_type = get_args(expected_python_type)[0]
+
         # In this condition, we still return a FlyteFile instance, but it's a simple one that has no downloading tricks
         # Using is instead of issubclass because FlyteFile does actually subclass it
         if expected_python_type is os.PathLike:
@@ -418,19 +485,33 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
             raise TypeError(f"Neither os.PathLike nor FlyteFile specified {expected_python_type}")
 
         # This is a local file path, like /usr/local/my_file, don't mess with it. Certainly, downloading it doesn't
-        # make any sense.
-        if not ctx.file_access.is_remote(uri):
+        # make any sense. Compressed files still need to be decompressed though.
+        if compression is None and not ctx.file_access.is_remote(uri):
             return expected_python_type(uri)  # type: ignore
 
         # For the remote case, return an FlyteFile object that can download
-        local_path = ctx.file_access.get_random_local_path(uri)
+        if compression is None:
+            local_path = ctx.file_access.get_random_local_path(uri)
+
+            def _downloader():
+                return ctx.file_access.get_data(uri, local_path, is_multipart=False)
+
+        else:
+            codec = compression
+            local_path = ctx.file_access.get_random_local_path(
+                uri[: -len(codec.extension)] if uri.endswith(codec.extension) else uri
+            )
 
-        def _downloader():
-            return ctx.file_access.get_data(uri, local_path, is_multipart=False)
+            def _downloader():
+                compressed_path = local_path + codec.extension
+                ctx.file_access.get_data(uri, compressed_path, is_multipart=False)
+                codec.decompress(compressed_path, local_path)
+                os.remove(compressed_path)
 
         expected_format = FlyteFilePathTransformer.get_format(expected_python_type)
         ff = FlyteFile.__class_getitem__(expected_format)(local_path, _downloader)
         ff._remote_source = uri
+        ff._compression = compression
 
         return ff
 
@@ -444,5 +525,8 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("blob", BlobType.BlobDimensionality.SINGLE)]
+
 
 TypeEngine.register(FlyteFilePathTransformer(), additional_types=[os.PathLike])
@@ -1 +1,2 @@
+from .chunked import ChunkedArray, ChunkedArrayTransformer
 from .ndarray import NumpyArrayTransformer
@@ -0,0 +1,277 @@
+import io
+import itertools
+import json
+import math
+import os
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Type
+
+import numpy as np
+
+from flytekit.core.context_manager import FlyteContext, FlyteContextManager
+from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
+from flytekit.models.core import types as _core_types
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+from flytekit.models.types import LiteralType
+from flytekit.types.numpy.ndarray import extract_metadata
+
+# Name of the file describing the array in the directory of a chunked array
+METADATA_FILE = "array.json"
+# Target size of the chunks of arrays written without explicit chunks
+DEFAULT_CHUNK_BYTES = 16 * 2**20
+
+
+def default_chunks(shape: typing.Tuple[int, ...], dtype: np.dtype) -> typing.Tuple[int, ...]:
+    """
+    Returns chunks of about ``DEFAULT_CHUNK_BYTES`` that split an array along its first axis only.
+    """
+    if not shape:
+        return ()
+    row_bytes = dtype.itemsize * math.prod(shape[1:])
+    rows = max(1, DEFAULT_CHUNK_BYTES // max(1, row_bytes))
+    return (min(max(shape[0], 1), rows), *(max(n, 1) for n in shape[1:]))
+
+
+def _chunk_name(index: typing.Tuple[int, ...]) -> str:
+    return (".".join(str(i) for i in index) or "0") + ".npy"
+
+
+def _join(uri: str, name: str) -> str:
+    return uri.rstrip("/") + "/" + name
+
+
+class ChunkedArray(object):
+    """
+    A NumPy array stored as a directory of chunks, each of them a ``.npy`` file, next to a JSON file describing the
+    array, similar to the layout of Zarr. Indexing a chunked array with integers and slices only reads the chunks
+    the selection overlaps, so tasks can work on parts of arrays that are too large to download whole:
+
+    .. code-block:: python
+
+        @task
+        def produce() -> Annotated[ChunkedArray, kwtypes(chunks=(1000, 1000))]:
+            return np.zeros((100_000, 1000))
+
+        @task
+        def consume(a: ChunkedArray) -> float:
+            return a[:10, 5].sum()
+
+    Chunks are read concurrently, on up to ``DataConfig.transfer_concurrency`` threads, and always whole: a selection
+    transfers every chunk it overlaps in full, so pick chunks that match how the array is read, e.g. chunks of whole
+    rows for an array that is read row by row. Any other kind of index reads the whole array first.
+    """
+
+    def __init__(self, uri: str):
+        self._uri = uri
+        self._metadata: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @property
+    def metadata(self) -> typing.Dict[str, typing.Any]:
+        if self._metadata is None:
+            ctx = FlyteContextManager.current_context()
+            self._metadata = json.loads(ctx.file_access.read_range(_join(self._uri, METADATA_FILE), 0))
+        return self._metadata
+
+    @property
+    def shape(self) -> typing.Tuple[int, ...]:
+        return tuple(self.metadata["shape"])
+
+    @property
+    def chunks(self) -> typing.Tuple[int, ...]:
+        return tuple(self.metadata["chunks"])
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.lib.format.descr_to_dtype(self.metadata["dtype"])
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def __len__(self) -> int:
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"ChunkedArray(uri={self._uri})"
+
+    def read(self) -> np.ndarray:
+        """
+        Reads the whole array.
+        """
+        return self[...]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.read() if dtype is None else self.read().astype(dtype, copy=False)
+
+    def __getitem__(self, key) -> np.ndarray:
+        key = key if isinstance(key, tuple) else (key,)
+        if any(k is not Ellipsis and not isinstance(k, (slice, int, np.integer)) for k in key):
+            return self.read()[key]
+        if key.count(Ellipsis) > 1:
+            raise IndexError("an index can only have a single ellipsis ('...')")
+        if Ellipsis in key:
+            i = key.index(Ellipsis)
+            key = key[:i] + (slice(None),) * (self.ndim - len(key) + 1) + key[i + 1 :]
+        if len(key) > self.ndim:
+            raise IndexError(f"too many indices for array: array is {self.ndim}-dimensional, but {len(key)} indexed")
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        # Read the block of the array that contains the selection, then select from it
+        bounds: typing.List[typing.Tuple[int, int]] = []
+        selection: typing.List[typing.Union[slice, int]] = []
+        for k, n in zip(key, self.shape):
+            if isinstance(k, slice):
+                start, stop, step = k.indices(n)
+                indices = range(start, stop, step)
+                if len(indices) == 0:
+                    bounds.append((0, 0))
+                    selection.append(slice(0, 0))
+                    continue
+                lo, hi = min(indices[0], indices[-1]), max(indices[0], indices[-1]) + 1
+                bounds.append((lo, hi))
+                stop = indices[-1] - lo + step
+                selection.append(slice(indices[0] - lo, stop if stop >= 0 else None, step))
+            else:
+                i = int(k) + n if k < 0 else int(k)
+                if not 0 <= i < n:
+                    raise IndexError(f"index {k} is out of bounds for axis with size {n}")
+                bounds.append((i, i + 1))
+                selection.append(0)
+        return self._read_block(bounds)[tuple(selection)]
+
+    def _read_block(self, bounds: typing.List[typing.Tuple[int, int]]) -> np.ndarray:
+        block = np.empty(tuple(hi - lo for lo, hi in bounds), dtype=self.dtype)
+        if block.size == 0:
+            return block
+
+        chunks = self.chunks
+        ranges = [range(lo // c, (hi - 1) // c + 1) for (lo, hi), c in zip(bounds, chunks)]
+
+        def _copy(index: typing.Tuple[int, ...]):
+            # The whole chunk is read even when only part of it is selected
+            chunk = np.load(io.BytesIO(file_access.read_range(_join(self._uri, _chunk_name(index)), 0)))
+            src, dst = [], []
+            for i, c, (lo, hi) in zip(index, chunks, bounds):
+                start, stop = max(lo, i * c), min(hi, (i + 1) * c)
+                src.append(slice(start - i * c, stop - i * c))
+                dst.append(slice(start - lo, stop - lo))
+            block[tuple(dst)] = chunk[tuple(src)]
+
+        file_access = FlyteContextManager.current_context().file_access
+        indices = list(itertools.product(*ranges))
+        workers = min(file_access.data_config.transfer_concurrency, len(indices))
+        if workers <= 1:
+            for index in indices:
+                _copy(index)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flytekit-chunks") as executor:
+                for _ in executor.map(_copy, indices):
+                    pass
+        return block
+
+
+def write_chunks(
+    python_val: np.ndarray, local_dir: str, chunks: typing.Optional[typing.Sequence[int]] = None
+) -> typing.Tuple[int, ...]:
+    """
+    Writes an array to a local directory in the :py:class:`ChunkedArray` layout and returns the chunks used.
+    """
+    if python_val.dtype.hasobject:
+        raise TypeError("Arrays of python objects cannot be chunked")
+    chunks = tuple(chunks) if chunks is not None else default_chunks(python_val.shape, python_val.dtype)
+    if len(chunks) != python_val.ndim or any(c < 1 for c in chunks):
+        raise ValueError(f"Chunks {chunks} do not match an array of shape {python_val.shape}")
+
+    os.makedirs(local_dir, exist_ok=True)
+    for index in itertools.product(*(range(math.ceil(n / c)) for n, c in zip(python_val.shape, chunks))):
+        chunk = python_val[tuple(slice(i * c, (i + 1) * c) for i, c in zip(index, chunks))]
+        np.save(os.path.join(local_dir, _chunk_name(index)), chunk, allow_pickle=False)
+    with open(os.path.join(local_dir, METADATA_FILE), "w") as f:
+        json.dump(
+            {
+                "shape": list(python_val.shape),
+                "chunks": list(chunks),
+                "dtype": np.lib.format.dtype_to_descr(python_val.dtype),
+            },
+            f,
+        )
+    return chunks
+
+
+class ChunkedArrayTransformer(TypeTransformer[ChunkedArray]):
+    """
+    TypeTransformer that stores NumPy arrays as a :py:class:`ChunkedArray`. The chunks can be set through the
+    metadata of the type, ``Annotated[ChunkedArray, kwtypes(chunks=(1000, 1000))]``.
+    """
+
+    CHUNKED_ARRAY_FORMAT = "NumpyChunkedArray"
+
+    def __init__(self):
+        super().__init__(name="Chunked Numpy Array", t=ChunkedArray)
+
+    def get_literal_type(self, t: Type[ChunkedArray]) -> LiteralType:
+        return LiteralType(
+            blob=_core_types.BlobType(
+                format=self.CHUNKED_ARRAY_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.MULTIPART
+            )
+        )
+
+    def assert_type(self, t: Type[ChunkedArray], v: typing.Any):
+        if not isinstance(v, (ChunkedArray, np.ndarray)):
+            raise TypeTransformerFailedError(f"Expected a ChunkedArray or a NumPy array, got {type(v)}")
+
+    def to_literal(
+        self,
+        ctx: FlyteContext,
+        python_val: typing.Union[ChunkedArray, np.ndarray],
+        python_type: Type[ChunkedArray],
+        expected: LiteralType,
+    ) -> Literal:
+        self.assert_type(python_type, python_val)
+        meta = BlobMetadata(type=self.get_literal_type(python_type).blob)
+        if isinstance(python_val, ChunkedArray):
+            # Chunked arrays that were read from, or written to, the blob store are passed along as is
+            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=python_val.uri)))
+
+        _, metadata = extract_metadata(python_type)
+        local_dir = ctx.file_access.get_random_local_directory()
+        try:
+            write_chunks(python_val, local_dir, metadata.get("chunks"))
+        except (TypeError, ValueError) as e:
+            raise TypeTransformerFailedError(str(e)) from e
+        remote_path = ctx.file_access.put_raw_data(local_dir, is_multipart=True)
+        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[ChunkedArray]) -> ChunkedArray:
+        try:
+            uri = lv.scalar.blob.uri
+        except AttributeError:
+            raise TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
+        return ChunkedArray(uri)
+
+    def guess_python_type(self, literal_type: LiteralType) -> typing.Type[ChunkedArray]:
+        if (
+            literal_type.blob is not None
+            and literal_type.blob.dimensionality == _core_types.BlobType.BlobDimensionality.MULTIPART
+            and literal_type.blob.format == self.CHUNKED_ARRAY_FORMAT
+        ):
+            return ChunkedArray
+
+        raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
+
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.MULTIPART, self.CHUNKED_ARRAY_FORMAT)]
+
+
+TypeEngine.register(ChunkedArrayTransformer())
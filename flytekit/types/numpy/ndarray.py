@@ -1,3 +1,4 @@
+import os
 import pathlib
 import typing
 from collections import OrderedDict
@@ -6,14 +7,18 @@ from typing import Dict, Tuple, Type
 import numpy as np
 from typing_extensions import Annotated, get_args, get_origin
 
+from flytekit.core import compression as _compression
 from flytekit.core.context_manager import FlyteContext
+from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
 from flytekit.models.core import types as _core_types
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
 
+T = typing.TypeVar("T")
 
-def extract_metadata(t: Type[np.ndarray]) -> Tuple[Type[np.ndarray], Dict[str, bool]]:
+
+def extract_metadata(t: Type[T]) -> Tuple[Type[T], Dict[str, typing.Any]]:
     metadata = {}
     if get_origin(t) is Annotated:
         base_type, metadata = get_args(t)
@@ -26,7 +31,10 @@ def extract_metadata(t: Type[np.ndarray]) -> Tuple[Type[np.ndarray], Dict[str, b
 
 class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
     """
-    TypeTransformer that supports np.ndarray as a native type.
+    TypeTransformer that supports np.ndarray as a native type. Arrays are stored as ``.npy`` files. With
+    ``Annotated[np.ndarray, kwtypes(stream=True)]`` they are written to, and read from, the blob store directly instead
+    of through a local file. Arrays stored on the local file system are loaded in place, and memory mapped from the
+    stored file for the read only and copy on write ``mmap_mode`` values.
     """
 
     NUMPY_ARRAY_FORMAT = "NumpyArray"
@@ -44,6 +52,7 @@ class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
     def to_literal(
         self, ctx: FlyteContext, python_val: np.ndarray, python_type: Type[np.ndarray], expected: LiteralType
     ) -> Literal:
+        compression = _compression.resolve(python_type, ctx.file_access.data_config)
         python_type, metadata = extract_metadata(python_type)
 
         meta = BlobMetadata(
@@ -52,14 +61,25 @@ class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
             )
         )
 
+        # Compressed and content addressed outputs are computed from a local file, so they cannot be streamed
+        stream = metadata.get("stream", False) and not ctx.file_access.data_config.content_addressed_outputs
+        if stream and compression is None:
+            remote_path = ctx.file_access.get_random_remote_path("array.npy")
+            if not ctx.file_access.is_remote(remote_path):
+                os.makedirs(os.path.dirname(FileAccessProvider.strip_file_header(remote_path)), exist_ok=True)
+            with ctx.file_access.open(remote_path, "wb") as f:
+                np.save(file=f, arr=python_val, allow_pickle=metadata.get("allow_pickle", False))
+            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+
         local_path = ctx.file_access.get_random_local_path() + ".npy"
         pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
 
         # save numpy array to file
         np.save(file=local_path, arr=python_val, allow_pickle=metadata.get("allow_pickle", False))
+        if compression is not None:
+            local_path = compression.compress(local_path, local_path + compression.extension)
 
-        remote_path = ctx.file_access.get_random_remote_path(local_path)
-        ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+        remote_path = ctx.file_access.put_raw_data(local_path, is_multipart=False, preserve_name=False)
         return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[np.ndarray]) -> np.ndarray:
@@ -69,15 +89,31 @@ class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
             raise TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
 
         expected_python_type, metadata = extract_metadata(expected_python_type)
+        allow_pickle = metadata.get("allow_pickle", False)
+        mmap_mode = metadata.get("mmap_mode")
+
+        if not ctx.file_access.is_remote(uri):
+            # Arrays on the local file system are loaded without copying the file first. Writable mappings would
+            # change the stored array, so those are made on a copy.
+            path = FileAccessProvider.strip_file_header(uri)
+            if mmap_mode in (None, "r", "c") and _compression.from_header(path) is None:
+                return np.load(file=path, allow_pickle=allow_pickle, mmap_mode=mmap_mode)  # type: ignore
+        elif metadata.get("stream", False) and mmap_mode is None:
+            with ctx.file_access.open(uri, "rb") as f:
+                # Compressed arrays are downloaded and decompressed below
+                if f.read(len(np.lib.format.MAGIC_PREFIX)) == np.lib.format.MAGIC_PREFIX:
+                    f.seek(0)
+                    return np.load(file=f, allow_pickle=allow_pickle)
 
         local_path = ctx.file_access.get_random_local_path()
         ctx.file_access.get_data(uri, local_path, is_multipart=False)
+        _compression.decompress_in_place(local_path)
 
         # load numpy array from a file
         return np.load(
             file=local_path,
-            allow_pickle=metadata.get("allow_pickle", False),
-            mmap_mode=metadata.get("mmap_mode"),  # type: ignore
+            allow_pickle=allow_pickle,
+            mmap_mode=mmap_mode,  # type: ignore
         )
 
     def guess_python_type(self, literal_type: LiteralType) -> typing.Type[np.ndarray]:
@@ -90,5 +126,8 @@ class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.NUMPY_ARRAY_FORMAT)]
+
 
 TypeEngine.register(NumpyArrayTransformer())
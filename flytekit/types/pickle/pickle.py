@@ -1,9 +1,12 @@
+import mmap
 import os
+import struct
 import typing
 from typing import Type
 
 import cloudpickle
 
+from flytekit.core import compression as _compression
 from flytekit.core.context_manager import FlyteContext
 from flytekit.core.type_engine import TypeEngine, TypeTransformer
 from flytekit.models.core import types as _core_types
@@ -12,6 +15,68 @@ from flytekit.models.types import LiteralType
 
 T = typing.TypeVar("T")
 
+PICKLE_PROTOCOL = 5
+# Pickles written with out-of-band buffers start with these bytes, which a regular pickle stream never starts with
+OUT_OF_BAND_MAGIC = b"FLYTEPKL\x01"
+# Out-of-band buffers are aligned so that the arrays memory mapped from them are aligned too
+OUT_OF_BAND_ALIGNMENT = 64
+
+
+def _dump(python_val: typing.Any, path: str, out_of_band: bool):
+    """
+    Pickles a value to a local file. With out_of_band, the contiguous buffers the value exposes through pickle protocol
+    5, such as the data of NumPy arrays and Arrow tables, are written after the pickle stream instead of inside it:
+
+        magic | pickle size | buffer count | buffer sizes | pickle stream | aligned buffers
+    """
+    with open(path, "wb") as f:
+        if not out_of_band:
+            cloudpickle.dump(python_val, f, protocol=PICKLE_PROTOCOL)
+            return
+
+        buffers: typing.List[memoryview] = []
+
+        def _collect(buffer) -> bool:
+            try:
+                buffers.append(buffer.raw())
+                return False
+            except BufferError:
+                # Non contiguous buffers are stored in the pickle stream
+                return True
+
+        data = cloudpickle.dumps(python_val, protocol=PICKLE_PROTOCOL, buffer_callback=_collect)
+        f.write(OUT_OF_BAND_MAGIC)
+        f.write(struct.pack("<QQ", len(data), len(buffers)))
+        f.write(struct.pack(f"<{len(buffers)}Q", *(b.nbytes for b in buffers)))
+        f.write(data)
+        for b in buffers:
+            f.write(b"\0" * (-f.tell() % OUT_OF_BAND_ALIGNMENT))
+            f.write(b)
+
+
+def _load(path: str) -> typing.Any:
+    """
+    Unpickles a value from a local file written by :py:func:`_dump`. Out-of-band buffers are memory mapped copy on
+    write, so they are not read until they are used and can be modified without changing the file.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(OUT_OF_BAND_MAGIC)) != OUT_OF_BAND_MAGIC:
+            f.seek(0)
+            return cloudpickle.load(f)
+
+        size, count = struct.unpack("<QQ", f.read(16))
+        sizes = struct.unpack(f"<{count}Q", f.read(8 * count))
+        data = f.read(size)
+        buffers = []
+        if count:
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+            offset = f.tell()
+            for n in sizes:
+                offset += -offset % OUT_OF_BAND_ALIGNMENT
+                buffers.append(view[offset : offset + n])
+                offset += n
+    return cloudpickle.loads(data, buffers=buffers)
+
 
 class BatchSize:
     """
@@ -68,10 +133,12 @@ class FlytePickleTransformer(TypeTransformer[FlytePickle]):
         if ctx.file_access.is_remote(uri):
             local_path = ctx.file_access.get_random_local_path()
             ctx.file_access.get_data(uri, local_path, False)
-            uri = local_path
-        with open(uri, "rb") as infile:
-            data = cloudpickle.load(infile)
-        return data
+            uri = _compression.decompress_in_place(local_path)
+        else:
+            compression = _compression.from_header(uri)
+            if compression is not None:
+                uri = compression.decompress(uri, ctx.file_access.get_random_local_path())
+        return _load(uri)
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         meta = BlobMetadata(
@@ -84,11 +151,12 @@ class FlytePickleTransformer(TypeTransformer[FlytePickle]):
         os.makedirs(local_dir, exist_ok=True)
         local_path = ctx.file_access.get_random_local_path()
         uri = os.path.join(local_dir, local_path)
-        with open(uri, "w+b") as outfile:
-            cloudpickle.dump(python_val, outfile)
+        _dump(python_val, uri, ctx.file_access.data_config.pickle_out_of_band)
+        compression = _compression.resolve(python_type, ctx.file_access.data_config)
+        if compression is not None:
+            uri = compression.compress(uri, uri + compression.extension)
 
-        remote_path = ctx.file_access.get_random_remote_path(uri)
-        ctx.file_access.put_data(uri, remote_path, is_multipart=False)
+        remote_path = ctx.file_access.put_raw_data(uri, is_multipart=False, preserve_name=False)
         return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
 
     def guess_python_type(self, literal_type: LiteralType) -> typing.Type[FlytePickle[typing.Any]]:
@@ -101,6 +169,9 @@ class FlytePickleTransformer(TypeTransformer[FlytePickle]):
 
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("blob", _core_types.BlobType.BlobDimensionality.SINGLE, self.PYTHON_PICKLE_FORMAT)]
+
     def get_literal_type(self, t: Type[T]) -> LiteralType:
         return LiteralType(
             blob=_core_types.BlobType(
@@ -434,5 +434,8 @@ class FlyteSchemaTransformer(TypeTransformer[FlyteSchema]):
                 raise ValueError(f"Unknown schema column type {literal_column}")
         return FlyteSchema.__class_getitem__(columns)
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("schema",)]
+
 
 TypeEngine.register(FlyteSchemaTransformer())
@@ -75,15 +75,20 @@ class ParquetToPandasDecodingHandler(StructuredDatasetDecoder):
     ) -> pd.DataFrame:
         uri = flyte_value.uri
         columns = None
-        kwargs = get_storage_options(ctx.file_access.data_config, uri)
+        anonymous = ctx.file_access.access_modes.is_anonymous(uri)
+        kwargs = get_storage_options(ctx.file_access.data_config, uri, anon=anonymous)
         if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
             columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
         try:
             return pd.read_parquet(uri, columns=columns, storage_options=kwargs)
         except NoCredentialsError:
+            if anonymous:
+                raise
             logger.debug("S3 source detected, attempting anonymous S3 access")
             kwargs = get_storage_options(ctx.file_access.data_config, uri, anon=True)
-            return pd.read_parquet(uri, columns=columns, storage_options=kwargs)
+            df = pd.read_parquet(uri, columns=columns, storage_options=kwargs)
+            ctx.file_access.access_modes.mark_anonymous(uri)
+            return df
 
 
 class ArrowToParquetEncodingHandler(StructuredDatasetEncoder):
@@ -123,14 +128,17 @@ class ParquetToArrowDecodingHandler(StructuredDatasetDecoder):
         columns = None
         if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
             columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
+        anonymous = ctx.file_access.access_modes.is_anonymous(uri)
         try:
-            fs = ctx.file_access.get_filesystem_for_path(uri)
+            fs = ctx.file_access.get_filesystem_for_path(uri, anonymous=anonymous)
             return pq.read_table(path, filesystem=fs, columns=columns)
         except NoCredentialsError as e:
-            logger.debug("S3 source detected, attempting anonymous S3 access")
-            fs = ctx.file_access.get_filesystem_for_path(uri, anonymous=True)
+            fs = None if anonymous else ctx.file_access.get_filesystem_for_path(uri, anonymous=True)
             if fs is not None:
-                return pq.read_table(path, filesystem=fs, columns=columns)
+                logger.debug("S3 source detected, attempting anonymous S3 access")
+                table = pq.read_table(path, filesystem=fs, columns=columns)
+                ctx.file_access.access_modes.mark_anonymous(uri)
+                return table
             raise e
 
 
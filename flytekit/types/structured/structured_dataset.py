@@ -849,6 +849,9 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
             return StructuredDataset
         raise ValueError(f"StructuredDatasetTransformerEngine cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> typing.Optional[typing.List[typing.Tuple]]:
+        return [("structured_dataset",)]
+
 
 flyte_dataset_transformer = StructuredDatasetTransformerEngine()
 TypeEngine.register(flyte_dataset_transformer)
@@ -139,5 +139,8 @@ class PyTorch2ONNXTransformer(TypeTransformer[PyTorch2ONNX]):
 
         raise TypeTransformerFailedError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", BlobType.BlobDimensionality.SINGLE, self.ONNX_FORMAT)]
+
 
 TypeEngine.register(PyTorch2ONNXTransformer())
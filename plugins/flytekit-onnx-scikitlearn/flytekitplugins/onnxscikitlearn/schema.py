@@ -157,5 +157,8 @@ class ScikitLearn2ONNXTransformer(TypeTransformer[ScikitLearn2ONNX]):
 
         raise TypeTransformerFailedError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", BlobType.BlobDimensionality.SINGLE, self.ONNX_FORMAT)]
+
 
 TypeEngine.register(ScikitLearn2ONNXTransformer())
@@ -128,5 +128,8 @@ class TensorFlow2ONNXTransformer(TypeTransformer[TensorFlow2ONNX]):
 
         raise TypeTransformerFailedError(f"Transformer {self} cannot reverse {literal_type}")
 
+    def reversible_literal_types(self) -> Optional[List[Tuple]]:
+        return [("blob", BlobType.BlobDimensionality.SINGLE, self.ONNX_FORMAT)]
+
 
 TypeEngine.register(TensorFlow2ONNXTransformer())
@@ -59,7 +59,7 @@ setup(
         "sortedcontainers>=1.5.9,<3.0.0",
         "statsd>=3.0.0,<4.0.0",
         "urllib3>=1.22,<2.0.0",
-        "wrapt>=1.0.0,<2.0.0",
+        "wrapt>=1.16.0,<2.0.0",
         "dataclasses-json>=0.5.2",
         "marshmallow-jsonschema>=0.12.0",
         "natsort>=7.0.1",
@@ -0,0 +1,83 @@
+"""
+Cost of checking that the types bound in a 5,000 node workflow are castable, with the castability checks memoized by
+type fingerprint and with the memo cleared before every check. Compilation itself is timed for reference. Run with
+``make benchmark`` (or ``pytest -s``) to see the table.
+"""
+import time
+import timeit
+import typing
+from dataclasses import dataclass
+
+from dataclasses_json import dataclass_json
+
+from flytekit import task, workflow
+from flytekit.core.type_engine import _are_fingerprints_castable, _are_types_castable
+from flytekit.models.types import OutputReference
+
+NODES = 5000
+
+
+@dataclass_json
+@dataclass
+class Stats(object):
+    count: int
+    mean: float
+    labels: typing.List[str]
+
+
+@task
+def step(
+    stats: Stats, history: typing.Optional[typing.List[typing.Dict[str, float]]], label: typing.Union[int, str]
+) -> typing.Tuple[Stats, typing.Optional[typing.List[typing.Dict[str, float]]], typing.Union[int, str]]:
+    return stats, history, label
+
+
+def _build():
+    @workflow
+    def wf(
+        stats: Stats, history: typing.Optional[typing.List[typing.Dict[str, float]]], label: typing.Union[int, str]
+    ) -> Stats:
+        for _ in range(NODES):
+            stats, history, label = step(stats=stats, history=history, label=label)
+        return stats
+
+    return wf
+
+
+def _bound_types(wf) -> typing.List[typing.Tuple]:
+    """
+    Returns the (upstream, downstream) literal types of every binding between two nodes.
+    """
+    nodes = {n.id: n for n in wf.nodes}
+    pairs = []
+    for n in wf.nodes:
+        for b in n.bindings:
+            promise = b.binding.promise
+            if isinstance(promise, OutputReference) and promise.node_id in nodes:
+                upstream = nodes[promise.node_id].flyte_entity.interface.outputs[promise.var].type
+                pairs.append((upstream, n.flyte_entity.interface.inputs[b.var].type))
+    return pairs
+
+
+def _check(pairs, memoized: bool) -> typing.List[bool]:
+    results = []
+    for upstream, downstream in pairs:
+        if not memoized:
+            _are_fingerprints_castable.cache_clear()
+        results.append(_are_types_castable(upstream, downstream))
+    return results
+
+
+def test_workflow_castability():
+    start = time.perf_counter()
+    wf = _build()
+    wf.compile()
+    compilation = time.perf_counter() - start
+    pairs = _bound_types(wf)
+    assert len(pairs) == 3 * (NODES - 1)
+    assert _check(pairs, memoized=True) == _check(pairs, memoized=False)
+
+    uncached = min(timeit.repeat(lambda: _check(pairs, memoized=False), number=1, repeat=3))
+    cached = min(timeit.repeat(lambda: _check(pairs, memoized=True), number=1, repeat=3))
+    print(f"\n{'nodes':>6} {'bindings':>9} {'compile (ms)':>13} {'uncached (ms)':>14} {'memoized (ms)':>14}")
+    print(f"{NODES:>6} {len(pairs):>9} {compilation * 1e3:>13.1f} {uncached * 1e3:>14.1f} {cached * 1e3:>14.1f}")
@@ -0,0 +1,72 @@
+"""
+Cost of converting nested dataclasses and lists of dataclasses to and from literals, with the compiled per-dataclass
+plans of the ``DataclassTransformer`` and with plans that visit every field, which is what the transformer used to do.
+Run with ``make benchmark`` (or ``pytest -s``) to see the table.
+"""
+import dataclasses
+import timeit
+import typing
+from dataclasses import dataclass
+
+import mock
+from dataclasses_json import dataclass_json
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import DataclassTransformer, TypeEngine, _DataclassPlan
+
+
+@dataclass_json
+@dataclass
+class Leaf(object):
+    name: str
+    score: float
+    tags: typing.List[str]
+    count: int
+
+
+@dataclass_json
+@dataclass
+class Branch(object):
+    label: str
+    leaves: typing.List[Leaf]
+    weights: typing.Dict[str, float]
+
+
+@dataclass_json
+@dataclass
+class Tree(object):
+    branches: typing.List[Branch]
+    description: typing.Optional[str] = None
+
+
+def _leaf(i: int) -> Leaf:
+    return Leaf(name=f"leaf-{i}", score=i / 3, tags=["a", "b", "c"], count=i)
+
+
+TREE = Tree(branches=[Branch(f"b{i}", [_leaf(j) for j in range(20)], {"w": 0.5}) for i in range(20)])
+CASES = {
+    "nested dataclass": (Tree, TREE),
+    "List[dataclass] x 500": (typing.List[Leaf], [_leaf(i) for i in range(500)]),
+}
+
+
+def _full_plan(self, dc_type):
+    fields = tuple((f.name, f.type) for f in dataclasses.fields(dc_type))
+    return _DataclassPlan(flyte_fields=fields, int_fields=fields, sd_fields=fields)
+
+
+def _round_trip(python_type, value):
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(python_type)
+    return lambda: TypeEngine.to_python_value(ctx, TypeEngine.to_literal(ctx, value, python_type, lt), python_type)
+
+
+def test_dataclass_round_trip():
+    print(f"\n{'case':>24} {'every field (ms)':>17} {'planned (ms)':>13}")
+    for name, (python_type, value) in CASES.items():
+        round_trip = _round_trip(python_type, value)
+        assert round_trip() == value
+        planned = min(timeit.repeat(round_trip, number=1, repeat=5))
+        with mock.patch.object(DataclassTransformer, "_plan", _full_plan):
+            full = min(timeit.repeat(round_trip, number=1, repeat=5))
+        print(f"{name:>24} {full * 1e3:>17.1f} {planned * 1e3:>13.1f}")
@@ -0,0 +1,47 @@
+"""
+Throughput of single-file uploads through ``FileAccessProvider.put`` against a local fake object store, for a range of
+multipart part sizes and part concurrencies. Run with ``make benchmark`` (or ``pytest -s``) to see the table.
+"""
+import os
+import time
+
+import mock
+import pytest
+
+from flytekit.configuration import DataConfig
+from flytekit.core.data_persistence import FileAccessProvider
+from tests.flytekit.common.fake_object_store import FakeS3FileSystem
+
+FILE_SIZE = 64 * 2**20
+# Per request latency and per connection bandwidth of the fake object store
+LATENCY = 0.02
+BANDWIDTH = 64 * 2**20
+
+
+@pytest.fixture(scope="module")
+def big_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("multipart") / "big.bin"
+    path.write_bytes(os.urandom(FILE_SIZE))
+    return str(path)
+
+
+def _upload_throughput(big_file: str, sandbox: str, part_size: int, concurrency: int) -> float:
+    dc = DataConfig(multipart_chunk_size=part_size, multipart_concurrency=concurrency)
+    fp = FileAccessProvider(sandbox, "s3://my-bucket", data_config=dc)
+    fs = FakeS3FileSystem(latency=LATENCY, bandwidth=BANDWIDTH)
+    with mock.patch.object(fp, "get_filesystem_for_path", return_value=fs), mock.patch.object(
+        fs, "isdir", return_value=False
+    ):
+        start = time.perf_counter()
+        fp.put(big_file, "s3://my-bucket/big.bin")
+        duration = time.perf_counter() - start
+    assert len(fs.objects[("my-bucket", "big.bin")]) == FILE_SIZE
+    return FILE_SIZE / duration / 2**20
+
+
+def test_multipart_upload_throughput(big_file, tmp_path):
+    print(f"\n{'part size (MiB)':>16} {'concurrency':>12} {'throughput (MiB/s)':>20}")
+    for part_size in (5 * 2**20, 8 * 2**20, 16 * 2**20, 32 * 2**20):
+        for concurrency in (1, 4, 8):
+            throughput = _upload_throughput(big_file, str(tmp_path), part_size, concurrency)
+            print(f"{part_size // 2**20:>16} {concurrency:>12} {throughput:>20.1f}")
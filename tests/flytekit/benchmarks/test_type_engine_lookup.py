@@ -0,0 +1,71 @@
+"""
+Cost of resolving type transformers through ``TypeEngine.get_transformer``, with and without the resolution cache, for
+types that hit the different lookup steps, for converting a deep list of dataclasses and for translating a wide
+interface with and without the literal type cache. Run with ``make benchmark`` (or ``pytest -s``) to see the table.
+"""
+import timeit
+import typing
+from dataclasses import dataclass
+
+import mock
+from dataclasses_json import dataclass_json
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine
+from flytekit.types.file import FlyteFile
+
+LOOKUPS = 20000
+
+
+@dataclass_json
+@dataclass
+class Point(object):
+    x: int
+    y: int
+
+
+class MyFile(FlyteFile):
+    ...
+
+
+TYPES = {
+    "int (exact)": int,
+    "List[int] (generic)": typing.List[int],
+    "FlyteFile subclass (mro)": MyFile,
+    "dataclass (full scan)": Point,
+}
+
+
+def _uncached(python_type):
+    return TypeEngine._resolve_transformer(python_type)[1]
+
+
+def test_get_transformer_lookup():
+    print(f"\n{'type':>26} {'uncached (us)':>14} {'cached (us)':>12}")
+    for name, python_type in TYPES.items():
+        uncached = timeit.timeit(lambda: _uncached(python_type), number=LOOKUPS) / LOOKUPS * 1e6
+        cached = timeit.timeit(lambda: TypeEngine.get_transformer(python_type), number=LOOKUPS) / LOOKUPS * 1e6
+        print(f"{name:>26} {uncached:>14.2f} {cached:>12.2f}")
+
+
+def test_deep_list_conversion():
+    ctx = FlyteContextManager.current_context()
+    python_type = typing.List[typing.List[Point]]
+    value = [[Point(x=i, y=j) for j in range(50)] for i in range(50)]
+    lt = TypeEngine.to_literal_type(python_type)
+
+    cached = min(timeit.repeat(lambda: TypeEngine.to_literal(ctx, value, python_type, lt), number=1, repeat=3))
+    with mock.patch.object(TypeEngine, "get_transformer", side_effect=_uncached):
+        uncached = min(timeit.repeat(lambda: TypeEngine.to_literal(ctx, value, python_type, lt), number=1, repeat=3))
+    print(f"\nList[List[dataclass]] with 2500 elements: uncached {uncached * 1e3:.1f}ms, cached {cached * 1e3:.1f}ms")
+
+
+def test_wide_interface_translation():
+    from flytekit.core.interface import transform_variable_map
+
+    variables = {f"in_{i}": typing.Dict[str, typing.List[Point]] for i in range(200)}
+
+    cached = min(timeit.repeat(lambda: transform_variable_map(variables), number=1, repeat=3))
+    with mock.patch.object(TypeEngine, "to_literal_type", side_effect=lambda t: TypeEngine._to_literal_type(t)[1]):
+        uncached = min(timeit.repeat(lambda: transform_variable_map(variables), number=1, repeat=3))
+    print(f"\nInterface with 200 inputs: uncached {uncached * 1e3:.1f}ms, cached {cached * 1e3:.1f}ms")
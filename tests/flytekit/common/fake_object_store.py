@@ -0,0 +1,57 @@
+import asyncio
+import collections
+import hashlib
+import typing
+
+from s3fs import S3FileSystem
+
+
+class FakeS3FileSystem(S3FileSystem):
+    """
+    An S3FileSystem whose S3 API calls are served from memory instead of the network. Every request sleeps for
+    ``latency`` seconds plus the time it takes to send its body at ``bandwidth`` bytes per second, which roughly models
+    a single connection to a remote object store.
+    """
+
+    # Every instance is its own object store
+    cachable = False
+
+    def __init__(self, latency: float = 0.0, bandwidth: typing.Optional[float] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.objects: typing.Dict[typing.Tuple[str, str], bytes] = {}
+        self.uploads: typing.Dict[str, typing.Dict[int, bytes]] = {}
+        self.calls: typing.Counter[str] = collections.Counter()
+
+    async def _call_s3(self, method, *akwarglist, **kwargs):
+        self.calls[method] += 1
+        body = kwargs.get("Body")
+        if hasattr(body, "read"):
+            body = body.read()
+        delay = self.latency
+        if body is not None and self.bandwidth:
+            delay += len(body) / self.bandwidth
+        if delay:
+            await asyncio.sleep(delay)
+
+        key = (kwargs.get("Bucket"), kwargs.get("Key"))
+        if method == "put_object":
+            self.objects[key] = bytes(body)
+            return {"ETag": hashlib.md5(body).hexdigest()}
+        if method == "create_multipart_upload":
+            upload_id = f"upload-{len(self.uploads)}"
+            self.uploads[upload_id] = {}
+            return {"UploadId": upload_id}
+        if method == "upload_part":
+            self.uploads[kwargs["UploadId"]][kwargs["PartNumber"]] = bytes(body)
+            return {"ETag": hashlib.md5(body).hexdigest()}
+        if method == "complete_multipart_upload":
+            parts = self.uploads.pop(kwargs["UploadId"])
+            numbers = [p["PartNumber"] for p in kwargs["MultipartUpload"]["Parts"]]
+            self.objects[key] = b"".join(parts[n] for n in numbers)
+            return {}
+        if method == "abort_multipart_upload":
+            self.uploads.pop(kwargs["UploadId"], None)
+            return {}
+        raise NotImplementedError(f"{method} is not supported by the fake object store")
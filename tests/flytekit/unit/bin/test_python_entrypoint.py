@@ -1,3 +1,4 @@
+import json
 import os
 import typing
 from collections import OrderedDict
@@ -151,7 +152,7 @@ def get_output_collector(results: OrderedDict):
 
 @mock.patch("flytekit.core.utils.load_proto_from_file")
 @mock.patch("flytekit.core.data_persistence.FileAccessProvider.get_data")
-@mock.patch("flytekit.core.data_persistence.FileAccessProvider.put_data")
+@mock.patch("flytekit.core.data_persistence.FileAccessProvider.put")
 @mock.patch("flytekit.core.utils.write_proto_to_file")
 def test_dispatch_execute_normal(mock_write_to_file, mock_upload_dir, mock_get_data, mock_load_proto):
     # Just leave these here, mock them out so nothing happens
@@ -174,7 +175,8 @@ def test_dispatch_execute_normal(mock_write_to_file, mock_upload_dir, mock_get_d
         files = OrderedDict()
         mock_write_to_file.side_effect = get_output_collector(files)
         # See comment in test_dispatch_execute_ignore for why we need to decorate
-        system_entry_point(_dispatch_execute)(ctx, t1, "inputs path", "outputs prefix")
+        with ctx.file_access.transfer_metrics.scope():
+            system_entry_point(_dispatch_execute)(ctx, t1, "inputs path", "outputs prefix")
         assert len(files) == 1
 
         # A successful run should've written an outputs file.
@@ -185,6 +187,18 @@ def test_dispatch_execute_normal(mock_write_to_file, mock_upload_dir, mock_get_d
         lm = _literal_models.LiteralMap.from_flyte_idl(v)
         assert lm.literals["o0"].scalar.primitive.string_value == "string is: 5"
 
+        # The transfer metrics summary covers the upload of the outputs, and is uploaded next to them
+        engine_dir = ctx.execution_state.engine_dir
+        summary_path = os.path.join(engine_dir, "transfer_metrics.json")
+        with open(summary_path) as f:
+            summary = json.load(f)
+        assert [(r["source"], r["destination"]) for r in summary["records"] if r["direction"] == "put"] == [
+            (engine_dir, "outputs prefix")
+        ]
+        mock_upload_dir.assert_called_with(
+            summary_path, os.path.join("outputs prefix", "transfer_metrics.json"), recursive=False
+        )
+
 
 @mock.patch("flytekit.core.utils.load_proto_from_file")
 @mock.patch("flytekit.core.data_persistence.FileAccessProvider.get_data")
@@ -2,7 +2,7 @@ import os
 
 import mock
 
-from flytekit.configuration import PlatformConfig, get_config_file, read_file_if_exists
+from flytekit.configuration import DataConfig, PlatformConfig, get_config_file, read_file_if_exists
 from flytekit.configuration.internal import AWS, Credentials, Images
 
 
@@ -83,3 +83,12 @@ def test_default_platform_config_endpoint_insecure():
     platform_config = PlatformConfig()
     assert platform_config.endpoint == "localhost:30080"
     assert platform_config.insecure is False
+
+
+@mock.patch("flytekit.configuration.file.os")
+def test_data_config_transfer_settings(mocked):
+    ee = {"FLYTE_DATA_TRANSFER_CONCURRENCY": "32", "FLYTE_DATA_TRANSFER_RETRIES": "5"}
+    mocked.environ.get.side_effect = lambda x, y: ee.get(x)
+    dc = DataConfig.auto()
+    assert dc.transfer_concurrency == 32
+    assert dc.transfer_retries == 5
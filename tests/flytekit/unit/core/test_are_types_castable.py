@@ -1,4 +1,4 @@
-from flytekit.core.type_engine import _are_types_castable
+from flytekit.core.type_engine import _are_fingerprints_castable, _are_types_castable, _type_fingerprint
 from flytekit.models.annotation import TypeAnnotation
 from flytekit.models.core.types import EnumType
 from flytekit.models.types import LiteralType, SimpleType, StructuredDatasetType, TypeStructure, UnionType
@@ -136,3 +136,17 @@ def test_collection_union():
     # not the other way around
     assert not _are_types_castable(LiteralType(collection_type=str_or_int), LiteralType(collection_type=str_type))
     assert not _are_types_castable(LiteralType(collection_type=str_or_int), LiteralType(collection_type=int_type))
+
+
+def test_memoized_by_fingerprint():
+    tagged_str = LiteralType(simple=SimpleType.STRING, structure=TypeStructure(tag="str"))
+    annotated_str = LiteralType(simple=SimpleType.STRING, annotation=TypeAnnotation({"foo": "bar"}))
+    # Tags and annotations never change castability and are not part of the fingerprint
+    assert _type_fingerprint(tagged_str) == _type_fingerprint(annotated_str) == _type_fingerprint(str_type)
+    assert _type_fingerprint(str_or_int) != _type_fingerprint(int_or_str)
+
+    _are_fingerprints_castable.cache_clear()
+    assert _are_types_castable(tagged_str, optional_str)
+    misses = _are_fingerprints_castable.cache_info().misses
+    assert _are_types_castable(annotated_str, optional_str)
+    assert _are_fingerprints_castable.cache_info().misses == misses
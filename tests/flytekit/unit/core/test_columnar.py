@@ -0,0 +1,99 @@
+import typing
+
+import numpy as np
+import pytest
+from typing_extensions import Annotated
+
+from flytekit import task, workflow
+from flytekit.core import columnar
+from flytekit.core.columnar import Columnar
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine, TypeTransformerFailedError
+
+
+@pytest.mark.parametrize(
+    "element_type,values",
+    [
+        (int, [1, -2, 3]),
+        (float, [1.5, 2.0, -0.25]),
+        (bool, [True, False, True]),
+        (str, ["a", "", "flyte"]),
+        (int, []),
+    ],
+)
+def test_round_trip(element_type, values):
+    ctx = FlyteContextManager.current_context()
+    t = Annotated[typing.List[element_type], Columnar()]
+    lt = TypeEngine.to_literal_type(t)
+    # The literal type is a blob of the column format, so only columnar lists can consume it
+    assert lt == columnar.literal_type(element_type)
+    assert lt.blob.format.startswith("ArrowColumn:")
+    assert TypeEngine.guess_python_type(lt) == t
+
+    lv = TypeEngine.to_literal(ctx, values, t, lt)
+    assert lv.scalar.blob.metadata.type == lt.blob
+    assert ctx.file_access.exists(lv.scalar.blob.uri)
+    assert columnar.is_columnar(lv)
+    res = TypeEngine.to_python_value(ctx, lv, t)
+    assert res == values
+    assert all(type(v) is element_type for v in res)
+
+    arr = TypeEngine.to_python_value(ctx, lv, Annotated[typing.List[element_type], Columnar(as_array=True)])
+    assert isinstance(arr, np.ndarray)
+    assert arr.tolist() == values
+
+
+def test_numpy_input():
+    ctx = FlyteContextManager.current_context()
+    t = Annotated[typing.List[int], Columnar()]
+    lv = TypeEngine.to_literal(ctx, np.arange(100), t, TypeEngine.to_literal_type(t))
+    assert TypeEngine.to_python_value(ctx, lv, t) == list(range(100))
+
+
+def test_invalid_values():
+    ctx = FlyteContextManager.current_context()
+    t = Annotated[typing.List[int], Columnar()]
+    lt = TypeEngine.to_literal_type(t)
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_literal(ctx, [1, "a"], t, lt)
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_literal(ctx, [1, None], t, lt)
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_literal(ctx, (1, 2), t, lt)
+
+    with pytest.raises(ValueError):
+        TypeEngine.to_literal_type(Annotated[typing.List[typing.List[int]], Columnar()])
+
+    # A plain list literal is not a column
+    lv = TypeEngine.to_literal(ctx, [1, 2], typing.List[int], TypeEngine.to_literal_type(typing.List[int]))
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_python_value(ctx, lv, t)
+
+
+def test_plain_literals_are_not_columnar():
+    ctx = FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(ctx, [1, 2], typing.List[int], TypeEngine.to_literal_type(typing.List[int]))
+    assert not columnar.is_columnar(lv)
+    assert not columnar.is_columnar(lv.collection.literals[0])
+
+
+def test_in_workflow():
+    @task
+    def produce(n: int) -> Annotated[typing.List[float], Columnar()]:
+        return [i / 2 for i in range(n)]
+
+    @task
+    def consume(a: Annotated[typing.List[float], Columnar()]) -> float:
+        return sum(a)
+
+    @task
+    def consume_array(a: Annotated[typing.List[float], Columnar(as_array=True)]) -> float:
+        assert isinstance(a, np.ndarray)
+        return float(a.sum())
+
+    @workflow
+    def wf(n: int) -> typing.Tuple[float, float]:
+        a = produce(n=n)
+        return consume(a=a), consume_array(a=a)
+
+    assert wf(n=10) == (22.5, 22.5)
@@ -0,0 +1,77 @@
+import os
+import time
+from collections import OrderedDict
+
+import pytest
+from typing_extensions import Annotated
+
+from flytekit.configuration import DataConfig
+from flytekit.core import compression
+from flytekit.core.compression import Compression
+from flytekit.core.data_persistence import FileAccessProvider
+from flytekit.types.file import FlyteFile
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd", "lz4"])
+def test_round_trip(tmp_path, codec):
+    if codec != "gzip":
+        pytest.importorskip({"zstd": "zstandard", "lz4": "lz4"}[codec])
+    c = Compression(codec)
+    src = tmp_path / "data.bin"
+    src.write_bytes(b"flyte" * 1000)
+    compressed = c.compress(str(src), str(src) + c.extension)
+    assert os.path.getsize(compressed) < os.path.getsize(src)
+    assert compression.from_header(compressed) == c
+    assert compression.from_format(c.format("csv")) == ("csv", c)
+    assert open(c.decompress(compressed, str(tmp_path / "out")), "rb").read() == b"flyte" * 1000
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd", "lz4"])
+def test_compression_is_deterministic(tmp_path, codec):
+    if codec != "gzip":
+        pytest.importorskip({"zstd": "zstandard", "lz4": "lz4"}[codec])
+    c = Compression(codec)
+    fa = FileAccessProvider(local_sandbox_dir=str(tmp_path / "sandbox"), raw_output_prefix=str(tmp_path / "raw"))
+    remote_paths = set()
+    for name in ("a.bin", "b.bin"):
+        src = tmp_path / name
+        src.write_bytes(b"flyte" * 1000)
+        compressed = c.compress(str(src), str(src) + c.extension)
+        remote_paths.add(fa.get_content_addressed_remote_path(compressed, preserve_name=False))
+        # The modification time does not end up in the compressed bytes either
+        time.sleep(1)
+    assert len(remote_paths) == 1
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        Compression("snappy")
+
+
+def test_resolve():
+    assert compression.resolve(FlyteFile) is None
+    assert compression.resolve(Annotated[FlyteFile, Compression("gzip", 1)]) == Compression("gzip", 1)
+    assert compression.resolve(Annotated[FlyteFile, OrderedDict(compression="gzip")]) == Compression("gzip")
+    assert compression.resolve(FlyteFile, DataConfig(compression_codec="lz4")) == Compression("lz4")
+    assert compression.resolve(Annotated[FlyteFile, Compression("gzip")], DataConfig(compression_codec="lz4")) == (
+        Compression("gzip")
+    )
+
+
+def test_from_format():
+    assert compression.from_format("csv") == ("csv", None)
+    assert compression.from_format("+gzip") == ("", Compression("gzip"))
+    assert compression.from_format("a+b") == ("a+b", None)
+
+
+def test_decompress_in_place(tmp_path):
+    src = tmp_path / "data.bin"
+    src.write_bytes(b"plain")
+    assert compression.decompress_in_place(str(src)) == str(src)
+    assert src.read_bytes() == b"plain"
+
+    c = Compression("gzip")
+    c.compress(str(src), str(tmp_path / "c"))
+    compression.decompress_in_place(str(tmp_path / "c"))
+    assert (tmp_path / "c").read_bytes() == b"plain"
+    assert sorted(os.listdir(tmp_path)) == ["c", "data.bin"]
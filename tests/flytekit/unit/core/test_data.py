@@ -8,9 +8,15 @@ import fsspec
 import mock
 import pytest
 
-from flytekit.configuration import Config, S3Config
+from flytekit.configuration import Config, DataConfig, S3Config
 from flytekit.core.context_manager import FlyteContextManager
-from flytekit.core.data_persistence import FileAccessProvider, default_local_file_access_provider, s3_setup_args
+from flytekit.core.data_persistence import (
+    FileAccessProvider,
+    _local_copy,
+    default_local_file_access_provider,
+    s3_setup_args,
+)
+from flytekit.exceptions.user import FlyteAssertion
 from flytekit.types.directory.types import FlyteDirectory
 
 local = fsspec.filesystem("file")
@@ -140,6 +146,65 @@ def test_local_provider(source_folder):
         assert len(files) == 2
 
 
+def test_local_provider_directory_round_trip():
+    dc = DataConfig(transfer_concurrency=4)
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dest_tmpdir:
+        for i in range(20):
+            sub = os.path.join(src, f"part-{i % 3}")
+            os.makedirs(sub, exist_ok=True)
+            with open(os.path.join(sub, f"{i}.txt"), "w") as fh:
+                fh.write(str(i))
+        provider = FileAccessProvider(local_sandbox_dir="/tmp/unittest", raw_output_prefix=dest_tmpdir, data_config=dc)
+        remote = provider.get_random_remote_directory()
+        provider.put_data(src, remote, is_multipart=True)
+        assert len(provider._default_remote.find(remote)) == 20
+
+        downloaded = provider.get_random_local_directory()
+        provider.get_data(remote, downloaded, is_multipart=True)
+        with open(os.path.join(downloaded, "part-1", "7.txt")) as fh:
+            assert fh.read() == "7"
+        assert len(local.find(downloaded)) == 20
+
+
+def test_local_provider_directory_retries(source_folder):
+    with tempfile.TemporaryDirectory() as dest_tmpdir:
+        provider = FileAccessProvider(
+            local_sandbox_dir="/tmp/unittest",
+            raw_output_prefix=dest_tmpdir,
+            data_config=DataConfig(transfer_retries=1),
+        )
+        remote = provider.get_random_remote_directory()
+        fs = provider.get_filesystem_for_path(remote)
+        failed = []
+
+        def flaky_copy(lpath, rpath, **kwargs):
+            if lpath not in failed:
+                failed.append(lpath)
+                raise ConnectionError("transient")
+            return _local_copy(lpath, rpath, **kwargs)
+
+        with mock.patch("flytekit.core.data_persistence._local_copy", side_effect=flaky_copy):
+            provider.put_data(source_folder, remote, is_multipart=True)
+        assert len(failed) == 2
+        assert len(fs.find(remote)) == 2
+
+        with mock.patch("flytekit.core.data_persistence._local_copy", side_effect=ConnectionError("permanent")):
+            with pytest.raises(FlyteAssertion, match="permanent"):
+                provider.put_data(source_folder, provider.get_random_remote_directory(), is_multipart=True)
+
+
+def test_local_provider_file_uri_destination(source_folder, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    provider = FileAccessProvider(local_sandbox_dir=str(tmp_path / "sandbox"), raw_output_prefix=str(tmp_path / "raw"))
+    dest = tmp_path / "out" / "nested" / "a"
+    provider.get_data(os.path.join(source_folder, "original.txt"), f"file://{dest}")
+    provider.get_data_range(os.path.join(source_folder, "original.txt"), f"file://{dest}.range", 0, 2)
+    assert dest.exists()
+    assert (tmp_path / "out" / "nested" / "a.range").read_bytes() == b"he"
+    # file:// destinations are not mistaken for paths relative to the working directory
+    assert not (tmp_path / "file:").exists()
+
+
 @pytest.mark.sandbox_test
 def test_s3_provider(source_folder):
     # Running mkdir on s3 filesystem doesn't do anything so leaving out for now
@@ -1,4 +1,13 @@
-from flytekit.core.data_persistence import FileAccessProvider
+import asyncio
+import json
+import os
+
+import mock
+import pytest
+
+from flytekit.configuration import DataConfig
+from flytekit.core.data_persistence import DownloadCache, FileAccessProvider, _local_copy
+from tests.flytekit.common.fake_object_store import FakeS3FileSystem
 
 
 def test_get_random_remote_path():
@@ -14,3 +23,416 @@ def test_is_remote():
     assert fp.is_remote("/tmp/foo/bar") is False
     assert fp.is_remote("file://foo/bar") is False
     assert fp.is_remote("s3://my-bucket/foo/bar") is True
+
+
+def test_filesystem_pool():
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    pool = fp.filesystem_pool
+    misses = pool.misses
+    fs = fp.get_filesystem("file")
+    assert fp.get_filesystem("file") is fs
+    assert pool.misses == misses + 1
+    assert pool.hits >= 1
+
+    # Different kwargs and the anonymous flag get their own instance
+    assert fp.get_filesystem("s3", anonymous=True) is not fp.get_filesystem("s3")
+    assert fp.get_filesystem("ftp", anonymous=True) is None
+
+
+def test_filesystem_pool_invalidate():
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    fp.get_filesystem("file")
+    fp.get_filesystem("s3", anonymous=True)
+    n = len(fp.filesystem_pool)
+    fp.invalidate_filesystems("file")
+    assert len(fp.filesystem_pool) == n - 1
+    fp.invalidate_filesystems()
+    # The default remote is rebuilt right away
+    assert len(fp.filesystem_pool) == 1
+    assert fp.get_filesystem() is fp.get_filesystem("s3")
+
+
+def test_many_local(tmp_path):
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"))
+    sources = []
+    for i in range(10):
+        f = tmp_path / f"{i}.txt"
+        f.write_text(str(i))
+        sources.append(str(f))
+
+    remotes = [fp.get_random_remote_path(s) for s in sources]
+    fp.put_many(list(zip(sources, remotes)))
+    assert fp.exists_many(remotes + [str(tmp_path / "nope")]) == [True] * 10 + [False]
+
+    locals_ = [fp.get_random_local_path(r) for r in remotes]
+    fp.get_many(list(zip(remotes, locals_)))
+    for i, local in enumerate(locals_):
+        with open(local) as fh:
+            assert fh.read() == str(i)
+
+
+def test_async_get_put(tmp_path):
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"))
+    src = tmp_path / "hello.txt"
+    src.write_text("hello")
+    remote = fp.get_random_remote_path(str(src))
+    local = fp.get_random_local_path(str(src))
+
+    async def run():
+        await fp.async_put(str(src), remote)
+        assert await fp.async_exists(remote)
+        await fp.async_get(remote, local)
+
+    asyncio.run(run())
+    with open(local) as fh:
+        assert fh.read() == "hello"
+
+
+def test_many_async_filesystem():
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    fs = mock.MagicMock(async_impl=True)
+    fs._exists = mock.AsyncMock(side_effect=lambda p: p.endswith("a"))
+    fs._get = mock.AsyncMock()
+    with mock.patch.object(fp, "get_filesystem_for_path", return_value=fs):
+        assert fp.exists_many(["s3://my-bucket/a", "s3://my-bucket/b"]) == [True, False]
+        fp.get_many([("s3://my-bucket/a", "/tmp/a"), ("s3://my-bucket/b", "/tmp/b")])
+    fs._get.assert_has_awaits([mock.call("s3://my-bucket/a", "/tmp/a"), mock.call("s3://my-bucket/b", "/tmp/b")])
+
+
+def test_download_cache(tmp_path):
+    dc = DataConfig(download_cache_dir=str(tmp_path / "cache"))
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"), data_config=dc)
+    assert fp.download_cache is not None
+    mem = fp.get_filesystem("memory")
+    mem.pipe("memory://bucket/data.bin", b"0123456789")
+    etag = {"ETag": "v1"}
+    real_info = mem.info
+
+    def info(path, **kwargs):
+        return {**real_info(path, **kwargs), **etag}
+
+    with mock.patch.object(mem, "info", side_effect=info), mock.patch.object(mem, "get", wraps=mem.get) as get:
+        for i in range(3):
+            local = str(tmp_path / f"local{i}.bin")
+            fp.get_data("memory://bucket/data.bin", local)
+            with open(local, "rb") as fh:
+                assert fh.read() == b"0123456789"
+        assert get.call_count == 1
+
+        # A new version of the object is downloaded again
+        mem.pipe("memory://bucket/data.bin", b"abc")
+        etag["ETag"] = "v2"
+        fp.get_data("memory://bucket/data.bin", str(tmp_path / "local_v2.bin"))
+        assert get.call_count == 2
+        with open(tmp_path / "local_v2.bin", "rb") as fh:
+            assert fh.read() == b"abc"
+    mem.rm("memory://bucket/data.bin")
+
+
+def test_download_cache_links_hits(tmp_path):
+    dc = DataConfig(download_cache_dir=str(tmp_path / "cache"), local_hardlinks=True)
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"), data_config=dc)
+    mem = fp.get_filesystem("memory")
+    mem.pipe("memory://bucket/linked.bin", b"0123456789")
+    real_info = mem.info
+
+    def info(path, **kwargs):
+        return {**real_info(path, **kwargs), "ETag": "v1"}
+
+    with mock.patch.object(mem, "info", side_effect=info), mock.patch.object(
+        fp, "_with_access_fallback", wraps=fp._with_access_fallback
+    ) as fallback:
+        for i in range(3):
+            fp.get_data("memory://bucket/linked.bin", str(tmp_path / f"local{i}.bin"))
+        # The version lookup goes through the anonymous access fallback
+        assert [c.args[2] for c in fallback.call_args_list].count("info") == 3
+    # Hits are links to the cached file, not copies of it
+    assert os.path.samefile(tmp_path / "local1.bin", tmp_path / "local2.bin")
+    assert (tmp_path / "local2.bin").read_bytes() == b"0123456789"
+    mem.rm("memory://bucket/linked.bin")
+
+
+def test_download_cache_key():
+    assert DownloadCache.key("s3://a/b", {"ETag": '"abc"'}) == 's3://a/b@"abc"'
+    assert DownloadCache.key("gs://a/b", {"generation": 123}) == "gs://a/b@123"
+    assert DownloadCache.key("s3://a/b", {"size": 1}) is None
+
+
+def test_open_streaming(tmp_path):
+    dc = DataConfig(stream_block_size=4)
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"), data_config=dc)
+    mem = fp.get_filesystem("memory")
+    with mock.patch.object(mem, "open", wraps=mem.open) as mem_open:
+        with fp.open("memory://bucket/stream.bin", "wb") as w:
+            w.write(b"0123456789")
+        mem_open.assert_called_with("memory://bucket/stream.bin", "wb", block_size=4)
+        with fp.open("memory://bucket/stream.bin", "rb") as r:
+            assert r.read(3) == b"012"
+        mem_open.assert_called_with("memory://bucket/stream.bin", "rb", block_size=4, cache_type="readahead")
+        with fp.open("memory://bucket/stream.bin", "rb", block_size=8, cache_type="bytes") as r:
+            assert r.read() == b"0123456789"
+        mem_open.assert_called_with("memory://bucket/stream.bin", "rb", block_size=8, cache_type="bytes")
+    mem.rm("memory://bucket/stream.bin")
+
+    local = tmp_path / "local.txt"
+    local.write_text("hello")
+    with fp.open(f"file://{local}", "r") as r:
+        assert r.read() == "hello"
+
+
+def test_put_multipart_concurrent(tmp_path):
+    dc = DataConfig(multipart_chunk_size=5 * 2**20, multipart_concurrency=3)
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), "s3://my-bucket", data_config=dc)
+    fs = FakeS3FileSystem()
+    data = os.urandom(12 * 2**20)
+    src = tmp_path / "big.bin"
+    src.write_bytes(data)
+    with mock.patch.object(fp, "get_filesystem_for_path", return_value=fs), mock.patch.object(
+        fs, "isdir", return_value=False
+    ):
+        fp.put(str(src), "s3://my-bucket/big.bin")
+    assert fs.calls["upload_part"] == 3
+    assert fs.objects[("my-bucket", "big.bin")] == data
+
+    small = tmp_path / "small.bin"
+    small.write_bytes(b"small")
+    with mock.patch.object(fp, "get_filesystem_for_path", return_value=fs), mock.patch.object(
+        fs, "isdir", return_value=True
+    ):
+        fp.put(str(small), "s3://my-bucket/dir")
+    assert fs.objects[("my-bucket", "dir/small.bin")] == b"small"
+
+
+def test_put_multipart_abort(tmp_path):
+    dc = DataConfig(multipart_chunk_size=5 * 2**20, multipart_concurrency=2)
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), "s3://my-bucket", data_config=dc)
+    fs = FakeS3FileSystem()
+    src = tmp_path / "big.bin"
+    src.write_bytes(os.urandom(11 * 2**20))
+    call_s3 = fs._call_s3
+
+    async def failing_call_s3(method, *args, **kwargs):
+        if method == "upload_part" and kwargs["PartNumber"] == 2:
+            raise OSError("part failed")
+        return await call_s3(method, *args, **kwargs)
+
+    with mock.patch.object(fp, "get_filesystem_for_path", return_value=fs), mock.patch.object(
+        fs, "isdir", return_value=False
+    ), mock.patch.object(fs, "_call_s3", side_effect=failing_call_s3):
+        with pytest.raises(OSError, match="part failed"):
+            fp.put(str(src), "s3://my-bucket/big.bin")
+    assert fs.uploads == {}
+    assert ("my-bucket", "big.bin") not in fs.objects
+
+
+def test_transfer_metrics(tmp_path):
+    fp = FileAccessProvider(
+        str(tmp_path / "sandbox"), str(tmp_path / "raw"), data_config=DataConfig(transfer_retries=2)
+    )
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.txt").write_text("hello")
+    (src / "b.txt").write_text("world!")
+    remote_dir = fp.get_random_remote_directory()
+    fp.put_data(str(src / "a.txt"), fp.get_random_remote_path("a.txt"))
+
+    failed = []
+
+    def flaky_copy(lpath, rpath, **kwargs):
+        if not failed:
+            failed.append(lpath)
+            raise ConnectionError("transient")
+        return _local_copy(lpath, rpath, **kwargs)
+
+    with mock.patch("flytekit.core.data_persistence._local_copy", side_effect=flaky_copy):
+        fp.put_data(str(src), remote_dir, is_multipart=True)
+    fp.get_data(remote_dir, str(tmp_path / "dest"), is_multipart=True)
+    with pytest.raises(Exception):
+        fp.get_data(str(tmp_path / "does-not-exist"), str(tmp_path / "nope"))
+
+    records = fp.transfer_metrics.records
+    assert [(r.direction, r.files, r.bytes, r.retries, r.succeeded) for r in records] == [
+        ("put", 1, 5, 0, True),
+        ("put", 2, 11, 1, True),
+        ("get", 2, 11, 0, True),
+        ("get", 0, 0, 0, False),
+    ]
+    assert all(r.protocol == "file" for r in records)
+
+    fp.transfer_metrics.write_summary(str(tmp_path / "metrics.json"))
+    with open(tmp_path / "metrics.json") as fh:
+        summary = json.load(fh)
+    assert summary["transfers"] == 4
+    assert summary["failed"] == 1
+    assert summary["bytes"] == 27
+    assert summary["retries"] == 1
+    assert summary["by_direction"]["put"]["files"] == 3
+    assert summary["by_protocol"]["file"]["transfers"] == 4
+    assert len(summary["records"]) == 4
+    assert "<table>" in fp.transfer_metrics.to_html()
+
+
+def test_transfer_metrics_scope(tmp_path):
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"))
+    src = tmp_path / "a.txt"
+    src.write_text("hello")
+    metrics = fp.transfer_metrics
+
+    fp.put_data(str(src), fp.get_random_remote_path("before.txt"))
+    with metrics.scope():
+        fp.put_data(str(src), fp.get_random_remote_path("outer.txt"))
+        with metrics.scope():
+            fp.put_data(str(src), fp.get_random_remote_path("inner.txt"))
+            assert [r.destination.split("/")[-1] for r in metrics.records] == ["inner.txt"]
+        # Nested scopes hand their records to the enclosing one
+        assert [r.destination.split("/")[-1] for r in metrics.records] == ["outer.txt", "inner.txt"]
+    # The records of the last scope are kept, the earlier ones are dropped
+    assert len(metrics.records) == 2
+    with metrics.scope():
+        fp.put_data(str(src), fp.get_random_remote_path("next.txt"))
+    assert [r.destination.split("/")[-1] for r in metrics.records] == ["next.txt"]
+
+
+def test_put_raw_data_content_addressed(tmp_path):
+    raw = tmp_path / "raw"
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(raw), data_config=DataConfig(content_addressed_outputs=True))
+    a = tmp_path / "a.txt"
+    a.write_text("hello")
+    first = fp.put_raw_data(str(a))
+    assert first.startswith(str(raw)) and "/cas/" in first and first.endswith("/a.txt")
+
+    with mock.patch.object(FileAccessProvider, "put_data") as put_data:
+        assert fp.put_raw_data(str(a)) == first
+        put_data.assert_not_called()
+
+    a.write_text("world")
+    assert fp.put_raw_data(str(a)) != first
+    assert not fp.put_raw_data(str(a), preserve_name=False).endswith("a.txt")
+
+
+def test_put_raw_data_content_addressed_directory(tmp_path):
+    fp = FileAccessProvider(
+        str(tmp_path / "sandbox"), str(tmp_path / "raw"), data_config=DataConfig(content_addressed_outputs=True)
+    )
+    d = tmp_path / "d"
+    (d / "nested").mkdir(parents=True)
+    (d / "x").write_text("x")
+    (d / "nested" / "y").write_text("y")
+    remote = fp.put_raw_data(str(d), is_multipart=True)
+    assert sorted(os.listdir(remote)) == ["nested", "x"]
+
+    with mock.patch.object(FileAccessProvider, "put_data") as put_data:
+        assert fp.put_raw_data(str(d), is_multipart=True) == remote
+        put_data.assert_not_called()
+
+    # A partially uploaded directory is uploaded again
+    os.remove(os.path.join(remote, "nested", "y"))
+    assert fp.put_raw_data(str(d), is_multipart=True) == remote
+    assert os.path.exists(os.path.join(remote, "nested", "y"))
+
+
+def test_put_raw_data_random(tmp_path):
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"))
+    a = tmp_path / "a.txt"
+    a.write_text("hello")
+    assert fp.put_raw_data(str(a)) != fp.put_raw_data(str(a))
+
+
+def test_read_range(tmp_path):
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"))
+    f = tmp_path / "data.bin"
+    f.write_bytes(b"0123456789")
+    assert fp.read_range(str(f), 2, 3) == b"234"
+    assert fp.read_range("file://" + str(f), 7) == b"789"
+    assert fp.read_range(str(f), -4, 2) == b"67"
+    assert fp.read_range(str(f), -4, 4) == b"6789"
+
+    fs = fp.get_filesystem("memory")
+    fs.pipe("/range/data.bin", b"0123456789")
+    fp.get_data_range("memory://range/data.bin", str(tmp_path / "part"), 5, 2)
+    assert (tmp_path / "part").read_bytes() == b"56"
+    assert fp.transfer_metrics.records[-1].bytes == 2
+
+
+def test_anonymous_access_is_memoized(tmp_path):
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"))
+    auth_fs = mock.MagicMock()
+    auth_fs.exists.side_effect = PermissionError("no credentials")
+    anon_fs = mock.MagicMock()
+    anon_fs.exists.return_value = True
+
+    def get_filesystem(protocol=None, anonymous=False, **kwargs):
+        return anon_fs if anonymous else auth_fs
+
+    with mock.patch.object(fp, "get_filesystem", side_effect=get_filesystem):
+        assert fp.exists("s3://public-bucket/a")
+        assert fp.exists("s3://public-bucket/b")
+        assert fp.exists("s3://public-bucket/c")
+        assert auth_fs.exists.call_count == 1
+        assert anon_fs.exists.call_count == 3
+        assert fp.access_modes.is_anonymous("s3://public-bucket/x")
+        assert not fp.access_modes.is_anonymous("s3://private-bucket/x")
+
+        # Objects that are not public fall back to credentials and reset the memo
+        anon_fs.exists.side_effect = PermissionError("not public")
+        auth_fs.exists.side_effect = None
+        auth_fs.exists.return_value = True
+        assert fp.exists("s3://public-bucket/d")
+        assert not fp.access_modes.is_anonymous("s3://public-bucket/x")
+
+        # Writes go to the authenticated filesystem only, and do not change the memo
+        fp.access_modes.mark_anonymous("s3://public-bucket/x")
+        auth_fs.open.side_effect = PermissionError("read only")
+        with pytest.raises(PermissionError):
+            fp.open("s3://public-bucket/out", "wb")
+        anon_fs.open.assert_not_called()
+        assert fp.access_modes.is_anonymous("s3://public-bucket/x")
+        fp.open("s3://public-bucket/in", "rb")
+        anon_fs.open.assert_called_once()
+
+    fp.access_modes.mark_anonymous("gs://bucket/x")
+    fp.invalidate_filesystems("gs")
+    assert not fp.access_modes.is_anonymous("gs://bucket/x")
+    fp.access_modes.mark_anonymous("/local/path")
+    assert not fp.access_modes.is_anonymous("/local/path")
+
+
+def test_local_copy(tmp_path):
+    src = tmp_path / "src"
+    src.write_bytes(b"flyte" * 1000)
+    assert _local_copy(str(src), str(src)) == "noop"
+
+    method = _local_copy(str(src), str(tmp_path / "copy"))
+    assert method in ("reflink", "copy_file_range", "copy")
+    assert (tmp_path / "copy").read_bytes() == src.read_bytes()
+    assert not os.path.samefile(src, tmp_path / "copy")
+
+    assert _local_copy(str(src), str(tmp_path / "link"), hardlink=True) == "hardlink"
+    assert os.path.samefile(src, tmp_path / "link")
+
+    os.remove(tmp_path / "link")
+    with mock.patch("flytekit.core.data_persistence.os.link", side_effect=OSError("cross-device")):
+        assert _local_copy(str(src), str(tmp_path / "link"), hardlink=True) != "hardlink"
+    assert not os.path.samefile(src, tmp_path / "link")
+    assert (tmp_path / "link").read_bytes() == src.read_bytes()
+
+
+def test_local_transfers_use_hardlinks(tmp_path):
+    fp = FileAccessProvider(
+        str(tmp_path / "sandbox"), str(tmp_path / "raw"), data_config=DataConfig(local_hardlinks=True)
+    )
+    src = tmp_path / "dir"
+    (src / "nested").mkdir(parents=True)
+    (src / "a").write_text("a")
+    (src / "nested" / "b").write_text("b")
+
+    fp.put_data(str(src / "a"), str(tmp_path / "raw" / "a"))
+    assert os.path.samefile(src / "a", tmp_path / "raw" / "a")
+    fp.put_data(str(src), str(tmp_path / "raw" / "dir"), is_multipart=True)
+    assert os.path.samefile(src / "nested" / "b", tmp_path / "raw" / "dir" / "nested" / "b")
+
+    fp.get_data(str(tmp_path / "raw" / "dir"), str(tmp_path / "out"), is_multipart=True)
+    assert os.path.samefile(src / "nested" / "b", tmp_path / "out" / "nested" / "b")
+    (tmp_path / "single").mkdir()
+    fp.get_data("file://" + str(tmp_path / "raw" / "a"), str(tmp_path / "single") + os.sep)
+    assert os.path.samefile(src / "a", tmp_path / "single" / "a")
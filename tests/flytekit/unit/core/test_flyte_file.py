@@ -9,6 +9,7 @@ from typing_extensions import Annotated
 
 import flytekit.configuration
 from flytekit.configuration import Config, Image, ImageConfig
+from flytekit.core.compression import Compression
 from flytekit.core.context_manager import ExecutionState, FlyteContextManager
 from flytekit.core.data_persistence import FileAccessProvider, flyte_tmp_dir
 from flytekit.core.dynamic_workflow_task import dynamic
@@ -489,3 +490,91 @@ def test_file_open_things():
             # print_file uses traditional download semantics so now a file should have been created
             files = local.find(new_sandbox)
             assert len(files) == 1
+
+
+def test_file_open_streaming(local_dummy_file):
+    ff = FlyteFile(path=local_dummy_file)
+    with ff.open("r") as r:
+        assert r.read() == "Hello world"
+    with ff.open("r", streaming=False) as r:
+        assert r.read() == "Hello world"
+
+
+def test_file_content_addressed_upload(local_dummy_file):
+    random_dir = FlyteContextManager.current_context().file_access.get_random_local_directory()
+    fs = FileAccessProvider(
+        local_sandbox_dir=random_dir,
+        raw_output_prefix=os.path.join(random_dir, "mock_remote"),
+        data_config=flytekit.configuration.DataConfig(content_addressed_outputs=True),
+    )
+    ctx = FlyteContextManager.current_context()
+    with FlyteContextManager.with_context(ctx.with_file_access(fs)) as ctx:
+        lt = TypeEngine.to_literal_type(FlyteFile)
+        first = TypeEngine.to_literal(ctx, FlyteFile(local_dummy_file), FlyteFile, lt)
+        second = TypeEngine.to_literal(ctx, local_dummy_file, FlyteFile, lt)
+        assert first.scalar.blob.uri == second.scalar.blob.uri
+        assert first.scalar.blob.uri.endswith(os.path.basename(local_dummy_file))
+
+
+def test_file_read_range():
+    ctx = FlyteContextManager.current_context()
+    ctx.file_access.get_filesystem("memory").pipe("/read_range/f.txt", b"Hello world")
+    lv = TypeEngine.to_literal(ctx, "memory://read_range/f.txt", FlyteFile, TypeEngine.to_literal_type(FlyteFile))
+    ff = TypeEngine.to_python_value(ctx, lv, FlyteFile)
+    assert ff.read_range(6) == b"world"
+    assert ff.read_range(0, 5) == b"Hello"
+    with open(ff.download_range(-5, 3), "rb") as r:
+        assert r.read() == b"wor"
+    assert not ff.downloaded
+
+
+def test_file_compressed(local_dummy_file):
+    @task
+    def t1() -> Annotated[FlyteFile, Compression("gzip")]:
+        return FlyteFile(local_dummy_file)
+
+    @task
+    def t2(f: Annotated[FlyteFile, Compression("gzip")]) -> str:
+        assert f.remote_source.endswith(".gz")
+        assert f.read_range(6) == b"world"
+        with open(f, "r") as r:
+            return r.read()
+
+    @workflow
+    def wf() -> str:
+        return t2(f=t1())
+
+    assert wf() == "Hello world"
+
+
+def test_file_compressed_only_by_flytekit(local_dummy_file, tmp_path):
+    ctx = FlyteContextManager.current_context()
+    compressed = Annotated[FlyteFile, Compression("gzip")]
+    lt = TypeEngine.to_literal_type(compressed)
+
+    # The declared type is unchanged and the codec is recorded in the blob, so readers that did not ask for
+    # compression still read the original content
+    assert lt == TypeEngine.to_literal_type(FlyteFile)
+    lv = TypeEngine.to_literal(ctx, FlyteFile(local_dummy_file), compressed, lt)
+    assert lv.scalar.blob.metadata.type.format == "+gzip"
+    ff = TypeEngine.to_python_value(ctx, lv, FlyteFile)
+    with open(ff, "r") as r:
+        assert r.read() == "Hello world"
+    # Passing the value on keeps the codec
+    assert TypeEngine.to_literal(ctx, ff, FlyteFile, lt).scalar.blob.metadata.type.format == "+gzip"
+
+    # An explicit destination is written as is
+    remote_path = str(tmp_path / "explicit.txt")
+    lv = TypeEngine.to_literal(ctx, FlyteFile(local_dummy_file, remote_path=remote_path), compressed, lt)
+    assert lv.scalar.blob.uri == remote_path
+    assert lv.scalar.blob.metadata.type.format == ""
+    with open(remote_path, "r") as r:
+        assert r.read() == "Hello world"
+
+    # A gzip file of the user is not decompressed
+    user_gz = tmp_path / "logs.gz"
+    Compression("gzip").compress(local_dummy_file, str(user_gz))
+    lv = TypeEngine.to_literal(ctx, str(user_gz), compressed, lt)
+    ff = TypeEngine.to_python_value(ctx, lv, compressed)
+    with open(ff, "rb") as r:
+        assert r.read() == user_gz.read_bytes()
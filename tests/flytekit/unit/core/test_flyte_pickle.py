@@ -1,20 +1,26 @@
+import threading
 from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Dict, List, Union
 
+import mock
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from typing_extensions import Annotated
 
 import flytekit.configuration
-from flytekit.configuration import Image, ImageConfig
+from flytekit.configuration import DataConfig, Image, ImageConfig
 from flytekit.core import context_manager
+from flytekit.core.compression import Compression
+from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import BlobMetadata
 from flytekit.models.types import LiteralType
 from flytekit.tools.translator import get_serializable
-from flytekit.types.pickle.pickle import BatchSize, FlytePickle, FlytePickleTransformer
+from flytekit.types.pickle.pickle import OUT_OF_BAND_MAGIC, BatchSize, FlytePickle, FlytePickleTransformer
 
 default_img = Image(name="default", fqn="test", tag="tag")
 serialization_settings = flytekit.configuration.SerializationSettings(
@@ -102,3 +108,76 @@ def test_union():
     assert variants[0].blob.format == "NumpyArray"
     assert variants[1].structured_dataset_type.format == ""
     assert variants[2].blob.format == FlytePickleTransformer.PYTHON_PICKLE_FORMAT
+
+
+def test_to_python_value_and_literal_compressed():
+    ctx = context_manager.FlyteContext.current_context()
+    tf = FlytePickleTransformer()
+    python_val = "fake_output" * 100
+    lt = tf.get_literal_type(FlytePickle)
+
+    lv = tf.to_literal(ctx, python_val, Annotated[str, Compression("gzip")], lt)
+    with open(lv.scalar.blob.uri, "rb") as f:
+        assert f.read(2) == b"\x1f\x8b"
+    assert tf.to_python_value(ctx, lv, str) == python_val
+
+
+def _provider(tmp_path, **kwargs) -> FileAccessProvider:
+    return FileAccessProvider(
+        local_sandbox_dir=str(tmp_path / "sandbox"),
+        raw_output_prefix=str(tmp_path / "raw"),
+        data_config=DataConfig(**kwargs),
+    )
+
+
+def test_out_of_band_buffers(tmp_path):
+    ctx = context_manager.FlyteContext.current_context().with_file_access(_provider(tmp_path, pickle_out_of_band=True))
+    tf = FlytePickleTransformer()
+    lt = tf.get_literal_type(FlytePickle)
+    python_val = {
+        "array": np.arange(1000, dtype=np.float64),
+        "fortran": np.asfortranarray(np.ones((20, 30))),
+        "strided": np.arange(100)[::2],
+        "table": pa.table({"a": list(range(100))}),
+        "other": "value",
+    }
+
+    for python_type in [dict, Annotated[dict, Compression("gzip")]]:
+        lv = tf.to_literal(ctx, python_val, python_type, lt)
+        if python_type is dict:
+            with open(lv.scalar.blob.uri, "rb") as f:
+                assert f.read(len(OUT_OF_BAND_MAGIC)) == OUT_OF_BAND_MAGIC
+        output = tf.to_python_value(ctx, lv, dict)
+        assert output.keys() == python_val.keys()
+        for k in ["array", "fortran", "strided"]:
+            np.testing.assert_array_equal(output[k], python_val[k])
+        assert output["table"] == python_val["table"]
+        assert output["other"] == "value"
+        # Arrays are mapped copy on write
+        assert not output["array"].flags.owndata
+        output["array"][0] = 42
+        assert tf.to_python_value(ctx, lv, dict)["array"][0] == 0
+
+
+def test_batches_are_converted_concurrently(tmp_path):
+    ctx = context_manager.FlyteContext.current_context().with_file_access(_provider(tmp_path, transfer_concurrency=4))
+    python_type = Annotated[List[FlytePickle], BatchSize(2)]
+    python_val = [np.arange(i) for i in range(10)]
+    lt = TypeEngine.to_literal_type(python_type)
+
+    threads = set()
+    to_literal = FlytePickleTransformer.to_literal
+
+    def _to_literal(*args, **kwargs):
+        threads.add(threading.get_ident())
+        return to_literal(*args, **kwargs)
+
+    with mock.patch.object(FlytePickleTransformer, "to_literal", autospec=True, side_effect=_to_literal):
+        lv = TypeEngine.to_literal(ctx, python_val, python_type, lt)
+    assert len(lv.collection.literals) == 5
+    assert threading.get_ident() not in threads
+
+    output = TypeEngine.to_python_value(ctx, lv, python_type)
+    assert len(output) == 10
+    for a, b in zip(output, python_val):
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,92 @@
+import copy
+import os
+import pickle
+import typing
+
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+from typing_extensions import Annotated
+
+from flytekit import Lazy, task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.lazy import LazyInput, is_materialized, materialize
+from flytekit.core.type_engine import TypeEngine, TypeTransformerFailedError
+from flytekit.models.literals import LiteralMap
+
+
+def _literal_map(values: typing.Dict[str, typing.Any], types: typing.Dict[str, type]) -> LiteralMap:
+    return TypeEngine.dict_to_literal_map(FlyteContextManager.current_context(), values, types)
+
+
+def test_proxy():
+    load = mock.Mock(return_value=[3, 1, 2])
+    v = LazyInput("a", load)
+    assert repr(v) == "<lazy input 'a'>"
+    assert not is_materialized(v)
+    load.assert_not_called()
+
+    assert isinstance(v, list)
+    assert is_materialized(v)
+    assert len(v) == 3 and v[0] == 3 and 1 in v and list(v) == [3, 1, 2]
+    assert v == [3, 1, 2] and v + [4] == [3, 1, 2, 4] and [0] + v == [0, 3, 1, 2]
+    v.sort()
+    assert materialize(v) == [1, 2, 3]
+    assert repr(v) == "[1, 2, 3]"
+    assert pickle.loads(pickle.dumps(v)) == [1, 2, 3]
+    assert copy.deepcopy(v) == [1, 2, 3]
+    load.assert_called_once()
+
+    n = LazyInput("n", lambda: 5)
+    assert n * 2 == 10 and 2**n == 32 and n > 4 and -n == -5 and f"{n:03d}" == "005" and hash(n) == hash(5)
+    assert np.asarray(LazyInput("arr", lambda: [1, 2])).tolist() == [1, 2]
+    arr = np.arange(3)
+    lazy_arr = LazyInput("arr", lambda: arr)
+    assert np.shares_memory(np.asarray(lazy_arr), arr)
+    assert not np.shares_memory(lazy_arr.__array__(copy=True), arr)
+    assert os.fspath(LazyInput("p", lambda: "/tmp")) == "/tmp"
+    assert materialize(7) == 7 and is_materialized(7)
+
+
+def test_literal_map_to_kwargs():
+    ctx = FlyteContextManager.current_context()
+    types = {"a": int, "b": typing.List[int], "c": Annotated[typing.List[int], Lazy()]}
+    lm = _literal_map({"a": 1, "b": [1, 2], "c": [3]}, types)
+
+    kwargs = TypeEngine.literal_map_to_kwargs(ctx, lm, types)
+    assert type(kwargs["a"]) is int and type(kwargs["b"]) is list
+    assert type(kwargs["c"]) is LazyInput and kwargs["c"] == [3]
+
+    kwargs = TypeEngine.literal_map_to_kwargs(ctx, lm, types, lazy=True)
+    # Primitives are cheap to convert and are never made lazy
+    assert type(kwargs["a"]) is int
+    assert type(kwargs["b"]) is LazyInput and kwargs["b"] == [1, 2]
+
+    kwargs = TypeEngine.literal_map_to_kwargs(ctx, lm, {**types, "c": Annotated[typing.List[str], Lazy()]})
+    with pytest.raises(TypeTransformerFailedError, match="Error converting input 'c' at position 2"):
+        materialize(kwargs["c"])
+
+
+def test_lazy_task():
+    @task(lazy_inputs=True)
+    def pick(use_a: bool, a: pd.DataFrame, b: pd.DataFrame) -> pd.DataFrame:
+        return a if use_a else b
+
+    @task
+    def total(df: Annotated[pd.DataFrame, Lazy()]) -> int:
+        assert isinstance(df, pd.DataFrame)
+        return int(df["x"].sum())
+
+    @workflow
+    def wf(use_a: bool) -> int:
+        a = pd.DataFrame({"x": [1, 2]})
+        return total(df=pick(use_a=use_a, a=a, b=pd.DataFrame({"x": [3, 4]})))
+
+    with mock.patch.object(TypeEngine, "to_python_value", wraps=TypeEngine.to_python_value) as to_python_value:
+        assert wf(use_a=True) == 3
+        converted = [c.args[2] for c in to_python_value.call_args_list]
+        # The unused input of pick was never converted
+        assert converted.count(pd.DataFrame) == 1
+        assert Annotated[pd.DataFrame, Lazy()] in converted
+    assert wf(use_a=False) == 7
@@ -1,12 +1,15 @@
 from collections import OrderedDict
 
+import mock
 import numpy as np
 from numpy.testing import assert_array_equal
+from typing_extensions import Annotated
 
 import flytekit
-from flytekit import task
-from flytekit.configuration import Image, ImageConfig
+from flytekit import kwtypes, task
+from flytekit.configuration import DataConfig, Image, ImageConfig
 from flytekit.core import context_manager
+from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import BlobMetadata
 from flytekit.models.types import LiteralType
@@ -59,3 +62,56 @@ def test_example():
 
     task_spec = get_serializable(OrderedDict(), serialization_settings, t1)
     assert task_spec.template.interface.outputs["o0"].type.blob.format is NumpyArrayTransformer.NUMPY_ARRAY_FORMAT
+
+
+def _memory_ctx(tmp_path, **kwargs):
+    provider = FileAccessProvider(
+        local_sandbox_dir=str(tmp_path / "sandbox"),
+        raw_output_prefix="memory://flyte/raw/",
+        data_config=DataConfig(**kwargs),
+    )
+    return context_manager.FlyteContext.current_context().with_file_access(provider)
+
+
+def test_streaming(tmp_path):
+    memory_ctx = _memory_ctx(tmp_path)
+    tf = NumpyArrayTransformer()
+    python_val = np.arange(100).reshape(10, 10)
+    python_type = Annotated[np.ndarray, kwtypes(stream=True)]
+    lt = tf.get_literal_type(np.ndarray)
+
+    with mock.patch.object(FileAccessProvider, "put_raw_data") as put_raw_data, mock.patch.object(
+        FileAccessProvider, "get_data"
+    ) as get_data:
+        lv = tf.to_literal(memory_ctx, python_val, python_type, lt)
+        assert lv.scalar.blob.uri.startswith("memory://")
+        assert_array_equal(tf.to_python_value(memory_ctx, lv, python_type), python_val)
+        put_raw_data.assert_not_called()
+        get_data.assert_not_called()
+
+    # Streamed arrays can be read by any consumer, and compressed arrays by streaming consumers
+    assert_array_equal(tf.to_python_value(memory_ctx, lv, np.ndarray), python_val)
+    compressed_ctx = _memory_ctx(tmp_path, compression_codec="gzip")
+    lv = tf.to_literal(compressed_ctx, python_val, python_type, lt)
+    assert lv.scalar.blob.uri.endswith(".gz")
+    assert_array_equal(tf.to_python_value(compressed_ctx, lv, python_type), python_val)
+
+
+def test_local_arrays_are_loaded_in_place():
+    ctx = context_manager.FlyteContext.current_context()
+    tf = NumpyArrayTransformer()
+    python_val = np.arange(10)
+    lt = tf.get_literal_type(np.ndarray)
+    lv = tf.to_literal(ctx, python_val, np.ndarray, lt)
+
+    with mock.patch.object(FileAccessProvider, "get_data") as get_data:
+        assert_array_equal(tf.to_python_value(ctx, lv, np.ndarray), python_val)
+        mapped = tf.to_python_value(ctx, lv, Annotated[np.ndarray, kwtypes(mmap_mode="c")])
+        get_data.assert_not_called()
+    assert isinstance(mapped, np.memmap) and mapped.filename == lv.scalar.blob.uri
+    mapped[0] = 42
+    assert tf.to_python_value(ctx, lv, np.ndarray)[0] == 0
+
+    # Writable mappings are made on a copy of the stored array
+    writable = tf.to_python_value(ctx, lv, Annotated[np.ndarray, kwtypes(mmap_mode="r+")])
+    assert writable.filename != lv.scalar.blob.uri
@@ -0,0 +1,98 @@
+import typing
+
+import mock
+import pytest
+from typing_extensions import Annotated
+
+from flytekit import conditional, map_task, task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.offloading import OFFLOADED_FORMAT, Offload, is_offloaded, load_offloaded, offload_literal
+from flytekit.core.type_engine import TypeEngine, TypeTransformerFailedError
+from flytekit.models.core.types import BlobType
+
+Big = Annotated[typing.Dict[str, str], Offload()]
+
+
+def test_offload_literal():
+    ctx = FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(ctx, list(range(100)), typing.List[int], TypeEngine.to_literal_type(typing.List[int]))
+
+    ref = offload_literal(ctx, lv)
+    assert is_offloaded(ref)
+    assert not is_offloaded(lv)
+    assert ref.scalar.blob.metadata.type.format == OFFLOADED_FORMAT
+    assert load_offloaded(ctx, ref) == lv
+
+
+def test_offloaded_type():
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(Big)
+    # The declared type is the type of the reference, and remembers the type of the offloaded value
+    assert lt.blob == BlobType(format=OFFLOADED_FORMAT, dimensionality=BlobType.BlobDimensionality.SINGLE)
+    assert TypeEngine.guess_python_type(lt) == Big
+
+    lv = TypeEngine.to_literal(ctx, {"a": "b"}, Big, lt)
+    assert is_offloaded(lv)
+    assert TypeEngine.to_python_value(ctx, lv, Big) == {"a": "b"}
+
+    # Plain values are not references
+    plain = TypeEngine.to_literal(ctx, {"a": "b"}, typing.Dict[str, str], TypeEngine.to_literal_type(Big.__origin__))
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_python_value(ctx, plain, Big)
+
+
+def test_offloaded_outputs():
+    @task
+    def produce(n: int) -> Big:
+        return {str(i): "x" * 100 for i in range(n)}
+
+    @task
+    def consume(d: Big) -> int:
+        return len(d)
+
+    @workflow
+    def wf(n: int) -> int:
+        return consume(d=produce(n=n))
+
+    with mock.patch("flytekit.core.offloading.load_offloaded", wraps=load_offloaded) as load:
+        assert wf(n=100) == 100
+        load.assert_called_once()
+
+
+def test_offloaded_map_task():
+    @task
+    def produce(n: int) -> typing.List[Big]:
+        return [{str(j): "x" for j in range(i)} for i in range(n)]
+
+    @task
+    def size(d: Big) -> int:
+        return len(d)
+
+    @workflow
+    def wf(n: int) -> typing.List[int]:
+        return map_task(size)(d=produce(n=n))
+
+    assert TypeEngine.to_literal_type(typing.List[Big]).collection_type == TypeEngine.to_literal_type(Big)
+    assert wf(n=4) == [0, 1, 2, 3]
+
+
+def test_offloaded_conditional():
+    @task
+    def produce(n: int) -> Big:
+        return {str(i): "x" for i in range(n)}
+
+    @task
+    def size(d: Big) -> int:
+        return len(d)
+
+    @task
+    def empty(d: Big) -> int:
+        return -1
+
+    @workflow
+    def wf(n: int) -> int:
+        d = produce(n=n)
+        return conditional("nonempty").if_(n > 0).then(size(d=d)).else_().then(empty(d=d))
+
+    assert wf(n=3) == 3
+    assert wf(n=0) == -1
@@ -1,11 +1,14 @@
 import typing
 
+import mock
 import pandas as pd
 import pyarrow as pa
 import pytest
+from botocore.exceptions import NoCredentialsError
 
 from flytekit.core import context_manager
 from flytekit.core.base_task import kwtypes
+from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
 from flytekit.models.types import StructuredDatasetType
 from flytekit.types.structured import basic_dfs
@@ -52,3 +55,26 @@ def test_arrow():
     assert encoder.python_type is decoder.python_type
     d = StructuredDatasetTransformerEngine.DECODERS[encoder.python_type]["fsspec"]["parquet"]
     assert d is not None
+
+
+def test_pandas_anonymous_access_is_memoized():
+    df = pd.DataFrame({"Name": ["Tom", "Joseph"], "Age": [20, 22]})
+    decoder = basic_dfs.ParquetToPandasDecodingHandler()
+    ctx = context_manager.FlyteContextManager.current_context()
+    sd_type = StructuredDatasetType(format="parquet")
+    sd_lit = literals.StructuredDataset(uri="s3://public-bucket/df", metadata=StructuredDatasetMetadata(sd_type))
+
+    def read_parquet(uri, columns=None, storage_options=None):
+        if not storage_options or not storage_options.get("anon"):
+            raise NoCredentialsError()
+        return df
+
+    try:
+        with mock.patch("flytekit.types.structured.basic_dfs.pd.read_parquet", side_effect=read_parquet) as read:
+            assert decoder.decode(ctx, sd_lit, StructuredDatasetMetadata(sd_type)).equals(df)
+            assert read.call_count == 2
+            assert ctx.file_access.access_modes.is_anonymous("s3://public-bucket/other")
+            decoder.decode(ctx, sd_lit, StructuredDatasetMetadata(sd_type))
+            assert read.call_count == 3
+    finally:
+        ctx.file_access.access_modes.clear()
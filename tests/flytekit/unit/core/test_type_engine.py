@@ -1,6 +1,7 @@
 import datetime
 import os
 import tempfile
+import threading
 import typing
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
@@ -39,11 +40,12 @@ from flytekit.core.type_engine import (
     UnionTransformer,
     convert_json_schema_to_python_class,
     dataclass_from_dict,
+    literal_type_shapes,
 )
 from flytekit.exceptions import user as user_exceptions
 from flytekit.models import types as model_types
 from flytekit.models.annotation import TypeAnnotation
-from flytekit.models.core.types import BlobType
+from flytekit.models.core.types import BlobType, EnumType
 from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralCollection, LiteralMap, Primitive, Scalar, Void
 from flytekit.models.types import LiteralType, SimpleType, TypeStructure, UnionType
 from flytekit.types.directory import TensorboardLogs
@@ -94,6 +96,184 @@ def test_type_resolution():
         TypeEngine.get_transformer(typing.Any)
 
 
+def test_get_transformer_cache():
+    class Base:
+        ...
+
+    class Child(Base):
+        ...
+
+    class GrandChild(Child):
+        ...
+
+    base_transformer = SimpleTransformer(
+        "base", Base, LiteralType(simple=SimpleType.INTEGER), lambda x: None, lambda x: None
+    )
+    child_transformer = SimpleTransformer(
+        "child", Child, LiteralType(simple=SimpleType.INTEGER), lambda x: None, lambda x: None
+    )
+    TypeEngine.register(base_transformer)
+    try:
+        assert TypeEngine.get_transformer(GrandChild) is base_transformer
+        assert TypeEngine._TRANSFORMER_CACHE[GrandChild] == (Base, base_transformer)
+        assert TypeEngine.get_transformer(GrandChild) is base_transformer
+
+        # Registering clears the cache, and the most specific base class wins regardless of registration order
+        TypeEngine.register(child_transformer)
+        assert GrandChild not in TypeEngine._TRANSFORMER_CACHE
+        assert TypeEngine.get_transformer(GrandChild) is child_transformer
+        assert TypeEngine.get_transformer(Annotated[GrandChild, kwtypes(a=int)]) is child_transformer
+    finally:
+        del TypeEngine._REGISTRY[Child]
+    # Cached entries whose registration is gone are resolved again
+    assert TypeEngine.get_transformer(GrandChild) is base_transformer
+    del TypeEngine._REGISTRY[Base]
+    with pytest.raises(ValueError):
+        TypeEngine.get_transformer(GrandChild)
+
+
+def test_to_literal_type_cache():
+    class Base:
+        ...
+
+    lt = TypeEngine.to_literal_type(typing.List[int])
+    assert TypeEngine.to_literal_type(typing.List[int]) is lt
+    # Unhashable annotations are converted every time
+    kw = Annotated[int, kwtypes(a=int)]
+    assert TypeEngine.to_literal_type(kw) is not TypeEngine.to_literal_type(kw)
+    assert TypeEngine.to_literal_type(kw) == LiteralType(simple=SimpleType.INTEGER)
+
+    # Tagging union variants does not modify the shared literal types
+    TypeEngine.to_literal_type(typing.Union[typing.List[int], str])
+    assert TypeEngine.to_literal_type(typing.List[int]).structure is None
+    # Unions that only differ in the order of their variants compare equal, but have different literal types
+    assert TypeEngine.to_literal_type(typing.Union[str, int]).union_type.variants[0].simple == SimpleType.STRING
+    assert TypeEngine.to_literal_type(typing.Union[int, str]).union_type.variants[0].simple == SimpleType.INTEGER
+
+    transformer = SimpleTransformer(
+        "base", Base, LiteralType(simple=SimpleType.INTEGER), lambda x: None, lambda x: None
+    )
+    TypeEngine.register(transformer)
+    assert TypeEngine.to_literal_type(Base) == LiteralType(simple=SimpleType.INTEGER)
+    del TypeEngine._REGISTRY[Base]
+    with pytest.raises(ValueError):
+        TypeEngine.to_literal_type(Base)
+
+
+def test_guess_python_type_index():
+    class Declared:
+        ...
+
+    class Undeclared:
+        ...
+
+    class DeclaredTransformer(TypeTransformer[Declared]):
+        def __init__(self, name=None, t=Declared):
+            super().__init__(name or "declared", t)
+            self.calls = 0
+
+        def get_literal_type(self, t):
+            return LiteralType(enum_type=EnumType(values=["a"]))
+
+        def to_literal(self, ctx, python_val, python_type, expected):
+            ...
+
+        def to_python_value(self, ctx, lv, expected_python_type):
+            ...
+
+        def guess_python_type(self, literal_type):
+            self.calls += 1
+            if literal_type.enum_type is not None:
+                return self.python_type
+            raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
+
+        def reversible_literal_types(self):
+            return [("enum",)]
+
+    class UndeclaredTransformer(DeclaredTransformer):
+        def guess_python_type(self, literal_type):
+            self.calls += 1
+            raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
+
+        def reversible_literal_types(self):
+            return None
+
+    blob = LiteralType(blob=BlobType(format="csv", dimensionality=BlobType.BlobDimensionality.SINGLE))
+    assert literal_type_shapes(blob) == [
+        ("blob", BlobType.BlobDimensionality.SINGLE, "csv"),
+        ("blob", BlobType.BlobDimensionality.SINGLE),
+    ]
+    assert literal_type_shapes(LiteralType(simple=SimpleType.INTEGER)) == [("simple", SimpleType.INTEGER)]
+
+    lt = LiteralType(enum_type=EnumType(values=["a"]))
+    with pytest.raises(ValueError):
+        TypeEngine.guess_python_type(lt)
+
+    declared, undeclared = DeclaredTransformer(), UndeclaredTransformer("undeclared", Undeclared)
+    TypeEngine.register(undeclared)
+    TypeEngine.register(declared)
+    try:
+        assert TypeEngine.guess_python_type(lt) is Declared
+        assert TypeEngine.guess_python_type(LiteralType(simple=SimpleType.INTEGER)) is int
+        assert TypeEngine.guess_python_type(TypeEngine.to_literal_type(typing.List[str])) == typing.List[str]
+        assert TypeEngine.guess_python_type(blob).extension() == "csv"
+        # Transformers are only tried for the shapes they declared
+        assert declared.calls == 1
+        # Transformers that did not declare their shapes are tried for every literal type, in registration order
+        assert undeclared.calls == 1
+    finally:
+        del TypeEngine._REGISTRY[Declared]
+        del TypeEngine._REGISTRY[Undeclared]
+    with pytest.raises(ValueError):
+        TypeEngine.guess_python_type(lt)
+
+
+def test_collections_of_blobs_are_converted_concurrently(tmp_path):
+    ctx = FlyteContextManager.current_context()
+    paths = []
+    for i in range(10):
+        paths.append(str(tmp_path / f"{i}.txt"))
+        with open(paths[-1], "w") as f:
+            f.write(str(i))
+
+    threads = set()
+    to_literal = FlyteFilePathTransformer.to_literal
+
+    def record(self, *args, **kwargs):
+        threads.add(threading.current_thread().name)
+        # The context of the caller is available in the worker threads
+        assert FlyteContextManager.current_context().file_access is ctx.file_access
+        return to_literal(self, *args, **kwargs)
+
+    with mock.patch.object(FlyteFilePathTransformer, "to_literal", record):
+        lt = TypeEngine.to_literal_type(typing.List[FlyteFile])
+        lv = TypeEngine.to_literal(ctx, paths, typing.List[FlyteFile], lt)
+        assert threads and all(t.startswith("flytekit-convert") for t in threads)
+        files = TypeEngine.to_python_value(ctx, lv, typing.List[FlyteFile])
+        assert [open(f).read() for f in files] == [str(i) for i in range(10)]
+
+        threads.clear()
+        lt = TypeEngine.to_literal_type(typing.Dict[str, FlyteFile])
+        lv = TypeEngine.to_literal(ctx, {p: p for p in paths}, typing.Dict[str, FlyteFile], lt)
+        assert list(lv.map.literals.keys()) == paths
+        assert all(t.startswith("flytekit-convert") for t in threads)
+
+        # Nested collections only convert their outermost level concurrently
+        threads.clear()
+        lt = TypeEngine.to_literal_type(typing.List[typing.List[FlyteFile]])
+        TypeEngine.to_literal(ctx, [paths[:5], paths[5:]], typing.List[typing.List[FlyteFile]], lt)
+        assert len(threads) <= 2
+
+    # Collections of values that do not reference blobs are converted in the calling thread
+    with mock.patch("flytekit.core.type_engine.ThreadPoolExecutor") as executor:
+        TypeEngine.to_literal(ctx, list(range(10)), typing.List[int], TypeEngine.to_literal_type(typing.List[int]))
+        executor.assert_not_called()
+
+    lt = TypeEngine.to_literal_type(typing.List[FlyteFile])
+    with pytest.raises(TypeTransformerFailedError, match="missing.txt"):
+        TypeEngine.to_literal(ctx, paths + [str(tmp_path / "missing.txt")], typing.List[FlyteFile], lt)
+
+
 def test_file_formats_getting_literal_type():
     transformer = TypeEngine.get_transformer(FlyteFile)
 
@@ -570,6 +750,28 @@ def test_dataclass_int_preserving():
     assert ot == o
 
 
+def test_dataclass_plan():
+    @dataclass_json
+    @dataclass
+    class WithFiles(object):
+        name: str
+        files: typing.List[typing.Optional[FlyteFile]]
+        inner: InnerStruct
+        sd: typing.Dict[str, StructuredDataset]
+
+    tf = DataclassTransformer()
+    plan = tf._plan(TestStructB)
+    assert plan.flyte_fields == ()
+    assert plan.sd_fields == ()
+    assert [name for name, _ in plan.int_fields] == ["s", "m", "n", "o"]
+    assert tf._plan(TestStructB) is plan
+
+    plan = tf._plan(WithFiles)
+    assert [name for name, _ in plan.flyte_fields] == ["files", "sd"]
+    assert [name for name, _ in plan.int_fields] == ["inner"]
+    assert [name for name, _ in plan.sd_fields] == ["sd"]
+
+
 @mock.patch("flytekit.core.data_persistence.FileAccessProvider.put_data")
 def test_optional_flytefile_in_dataclass(mock_upload_dir):
     mock_upload_dir.return_value = True
@@ -1181,6 +1383,50 @@ def test_union_of_lists():
     assert v == [1, 3]
 
 
+def test_union_variant_cache():
+    pt = typing.Union[int, timedelta, typing.List[str]]
+    lt = TypeEngine.to_literal_type(pt)
+    ctx = FlyteContextManager.current_context()
+    union_transformer = TypeEngine.get_transformer(pt)
+    int_transformer = TypeEngine.get_transformer(int)
+
+    with mock.patch.object(int_transformer, "to_literal", wraps=int_transformer.to_literal) as to_int:
+        TypeEngine.to_literal(ctx, timedelta(seconds=1), pt, lt)
+        assert to_int.call_count == 1
+        # The variant that converted the first timedelta is tried first for the next ones
+        assert TypeEngine.to_literal(ctx, timedelta(seconds=2), pt, lt).scalar.union.value.scalar.primitive
+        assert to_int.call_count == 1
+        assert union_transformer._variants[(pt, timedelta)][0] == timedelta
+        # The variant of a container depends on its elements, so containers always try every variant
+        lv = TypeEngine.to_literal(ctx, ["a"], pt, lt)
+        TypeEngine.to_literal(ctx, ["b"], pt, lt)
+        assert to_int.call_count == 3
+        assert (pt, list) not in union_transformer._variants
+
+    assert lv.scalar.union.stored_type.structure.tag == "Typed List"
+    assert union_transformer._tagged_variants(pt) == {
+        "int": [int],
+        "timedelta": [timedelta],
+        "Typed List": [typing.List[str]],
+    }
+    assert TypeEngine.to_python_value(ctx, lv, pt) == ["a"]
+    lv = TypeEngine.to_literal(ctx, timedelta(seconds=1), pt, lt)
+    assert TypeEngine.to_python_value(ctx, lv, pt) == timedelta(seconds=1)
+    lv = TypeEngine.to_literal(ctx, 3, pt, lt)
+    assert TypeEngine.to_python_value(ctx, lv, pt) == 3
+
+
+def test_union_variant_cache_ambiguous_values():
+    pt = typing.Union[typing.List[int], typing.List[str]]
+    lt = TypeEngine.to_literal_type(pt)
+    ctx = FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(ctx, [1], pt, lt)
+    assert lv.scalar.union.value.collection.literals[0].scalar.primitive.integer == 1
+    # An empty list matches both variants, even after a list of ints was converted
+    with pytest.raises(TypeError, match="Ambiguous"):
+        TypeEngine.to_literal(ctx, [], pt, lt)
+
+
 def test_list_of_unions():
     pt = typing.List[typing.Union[str, int]]
     lt = TypeEngine.to_literal_type(pt)
@@ -4,8 +4,11 @@ from mock import mock
 
 import flytekit
 from flytekit import Deck, FlyteContextManager, task
+from flytekit.configuration import DataConfig
+from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.deck import TopFrameRenderer
 from flytekit.deck.deck import _output_deck
+from flytekit.types.file import FlyteFile
 
 
 def test_deck():
@@ -91,3 +94,24 @@ def test_deck_in_jupyter(mock_ipython_check):
         t1(a=3)
         deck = ctx.get_deck()
         assert deck is not None
+
+
+def test_deck_transfer_metrics(tmp_path):
+    provider = FileAccessProvider(
+        str(tmp_path / "sandbox"), str(tmp_path / "raw"), data_config=DataConfig(transfer_metrics_deck=True)
+    )
+    ctx = FlyteContextManager.current_context()
+
+    @task(disable_deck=False)
+    def t1() -> FlyteFile:
+        path = tmp_path / "out.txt"
+        path.write_text("hello")
+        return FlyteFile(str(path))
+
+    with FlyteContextManager.with_context(ctx.with_file_access(provider)):
+        t1()
+        # input, output and transfer decks
+        assert len(FlyteContextManager.current_context().user_space_params.decks) == 3
+        t1()
+    # Only the transfers of the last execution are kept
+    assert [r.direction for r in provider.transfer_metrics.records] == ["put"]
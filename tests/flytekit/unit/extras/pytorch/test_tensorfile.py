@@ -0,0 +1,138 @@
+import mock
+import pytest
+import torch
+from typing_extensions import Annotated
+
+from flytekit import kwtypes, task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine
+from flytekit.extras.pytorch import StateDict
+from flytekit.extras.pytorch.tensorfile import is_tensor_file, load, load_tensors, write_module, write_tensors
+
+
+class TiedModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.embed = torch.nn.Embedding(10, 4)
+        self.head = torch.nn.Linear(4, 10, bias=False)
+        self.head.weight = self.embed.weight
+        self.norm = torch.nn.BatchNorm1d(4)
+
+    def forward(self, x):
+        return self.head(self.norm(self.embed(x)))
+
+
+def test_tensor_file(tmp_path):
+    path = str(tmp_path / "weights.safetensors")
+    tensors = {
+        "a": torch.arange(6, dtype=torch.float32).reshape(2, 3),
+        "b": torch.tensor([True, False]),
+        "c": torch.ones(3, dtype=torch.bfloat16),
+        "d": torch.tensor(7, dtype=torch.int64),
+        "e": torch.empty(0, 5),
+        "f": torch.arange(12).reshape(3, 4).t(),
+    }
+    write_tensors(tensors, path, {"format": "pt"})
+    with open(path, "rb") as f:
+        assert is_tensor_file(f.read(9))
+
+    loaded, metadata = load_tensors(path)
+    assert metadata == {"format": "pt"}
+    assert set(loaded) == set(tensors)
+    for name, t in tensors.items():
+        assert loaded[name].dtype == t.dtype and torch.equal(loaded[name], t)
+
+    # The mapping is copy on write
+    loaded["a"][0, 0] = 100
+    assert load_tensors(path)[0]["a"][0, 0] == 0
+
+    with pytest.raises(TypeError, match="cannot be written"):
+        write_tensors({"q": torch.quantize_per_tensor(torch.zeros(2), 1.0, 0, torch.quint8)}, path)
+
+
+def test_module(tmp_path):
+    path = str(tmp_path / "model.safetensors")
+    model = TiedModel()
+    write_module(model, path)
+    loaded = load(path)
+    assert isinstance(loaded, TiedModel)
+    assert loaded.head.weight is loaded.embed.weight
+    assert isinstance(loaded.embed.weight, torch.nn.Parameter) and loaded.embed.weight.requires_grad
+    for name, t in model.state_dict().items():
+        assert torch.equal(loaded.state_dict()[name], t)
+    # Only one copy of the tied weights is stored
+    assert len(load_tensors(path)[0]) == len(model.state_dict()) - 1
+
+
+def test_safetensors_annotation():
+    @task
+    def produce() -> Annotated[torch.nn.Module, kwtypes(safetensors=True)]:
+        return TiedModel()
+
+    @task
+    def tensor(model: torch.nn.Module) -> Annotated[torch.Tensor, kwtypes(safetensors=True)]:
+        return model.embed.weight * 2
+
+    @task
+    def total(t: torch.Tensor) -> float:
+        return float(t.sum())
+
+    @workflow
+    def wf() -> float:
+        return total(t=tensor(model=produce()))
+
+    with mock.patch("torch.load") as torch_load:
+        wf()
+        torch_load.assert_not_called()
+
+    # torch.save files are read as before
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(torch.Tensor)
+    lv = TypeEngine.to_literal(ctx, torch.ones(3), torch.Tensor, lt)
+    assert torch.equal(TypeEngine.to_python_value(ctx, lv, torch.Tensor), torch.ones(3))
+
+
+def test_state_dict():
+    model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+
+    @task
+    def produce() -> StateDict:
+        return model.state_dict()
+
+    @task
+    def first_bias(weights: StateDict) -> torch.Tensor:
+        assert isinstance(weights, StateDict)
+        assert set(weights) == set(model.state_dict())
+        return weights["0.bias"]
+
+    @task
+    def restore(weights: StateDict) -> torch.nn.Module:
+        m = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+        m.load_state_dict(weights)
+        return m
+
+    @workflow
+    def wf() -> torch.Tensor:
+        return first_bias(weights=produce())
+
+    @workflow
+    def wf_restore() -> torch.nn.Module:
+        return restore(weights=produce())
+
+    assert torch.equal(wf(), model.state_dict()["0.bias"])
+    assert torch.equal(wf_restore()[2].weight, model[2].weight)
+
+
+def test_state_dict_partial_reads(tmp_path):
+    ctx = FlyteContextManager.current_context()
+    weights = {"a": torch.zeros(1000), "b": torch.ones(10)}
+    path = str(tmp_path / "weights.safetensors")
+    write_tensors(weights, path)
+
+    with mock.patch.object(ctx.file_access, "is_remote", return_value=True):
+        with mock.patch.object(ctx.file_access, "read_range", wraps=ctx.file_access.read_range) as read_range:
+            sd = StateDict(path)
+            assert torch.equal(sd["b"], weights["b"])
+            # The header is read, then the 40 bytes of b only
+            assert read_range.call_count == 3
+            assert read_range.call_args.args[2] == 40
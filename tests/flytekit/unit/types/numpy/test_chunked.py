@@ -0,0 +1,95 @@
+import typing
+
+import mock
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from typing_extensions import Annotated
+
+from flytekit import kwtypes, task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine, TypeTransformerFailedError
+from flytekit.types.numpy import ChunkedArray
+from flytekit.types.numpy.chunked import default_chunks
+
+
+def _chunked(python_val: np.ndarray, chunks: typing.Optional[typing.Tuple[int, ...]]) -> ChunkedArray:
+    ctx = FlyteContextManager.current_context()
+    python_type = Annotated[ChunkedArray, kwtypes(chunks=chunks)] if chunks else ChunkedArray
+    lv = TypeEngine.to_literal(ctx, python_val, python_type, TypeEngine.to_literal_type(python_type))
+    return TypeEngine.to_python_value(ctx, lv, ChunkedArray)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        (slice(None),),
+        (3,),
+        (-1, slice(2, 9)),
+        (slice(1, 10, 3), 4),
+        (slice(None, None, -2),),
+        (slice(9, 2, -3), slice(None, None, -1)),
+        (Ellipsis, 5),
+        (slice(5, 5),),
+        ([1, 3],),
+        (np.int64(2), Ellipsis),
+    ],
+)
+def test_slicing(key):
+    python_val = np.arange(12 * 8, dtype=np.float32).reshape(12, 8)
+    a = _chunked(python_val, (5, 3))
+    assert a.shape == (12, 8) and a.chunks == (5, 3) and a.dtype == np.float32 and len(a) == 12
+    assert_array_equal(a[key], python_val[key])
+
+
+def test_only_overlapping_chunks_are_read():
+    python_val = np.arange(100).reshape(10, 10)
+    a = _chunked(python_val, (2, 5))
+    assert a.shape == (10, 10)
+
+    file_access = FlyteContextManager.current_context().file_access
+    with mock.patch.object(file_access, "read_range", wraps=file_access.read_range) as read_range:
+        assert_array_equal(a[3, 6:], python_val[3, 6:])
+        assert [c.args[0].rsplit("/", 1)[1] for c in read_range.call_args_list] == ["1.1.npy"]
+    assert_array_equal(a.read(), python_val)
+    assert_array_equal(np.asarray(a), python_val)
+
+
+def test_layout():
+    assert default_chunks((), np.dtype("float64")) == ()
+    assert default_chunks((10**9,), np.dtype("float64")) == (2 * 2**20,)
+    assert default_chunks((3, 0), np.dtype("float64")) == (3, 1)
+
+    scalar = _chunked(np.array(3.5), None)
+    assert scalar.shape == () and scalar[()] == 3.5
+    empty = _chunked(np.zeros((0, 4)), None)
+    assert empty.shape == (0, 4) and empty.read().shape == (0, 4)
+
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(ChunkedArray)
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_literal(ctx, np.array([object()]), ChunkedArray, lt)
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_literal(ctx, np.zeros(4), Annotated[ChunkedArray, kwtypes(chunks=(2, 2))], lt)
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_literal(ctx, [1, 2], ChunkedArray, lt)
+
+
+def test_in_workflow():
+    @task
+    def produce(n: int) -> Annotated[ChunkedArray, kwtypes(chunks=(10, 10))]:
+        return np.arange(n * n).reshape(n, n)
+
+    @task
+    def forward(a: ChunkedArray) -> ChunkedArray:
+        return a
+
+    @task
+    def consume(a: ChunkedArray) -> int:
+        return int(a[:5, 3].sum())
+
+    @workflow
+    def wf(n: int) -> int:
+        return consume(a=forward(a=produce(n=n)))
+
+    assert wf(n=50) == sum(i * 50 + 3 for i in range(5))
@@ -81,3 +81,16 @@ def wf():
 @workflow
 def test_wf():
     wf()
+
+
+@task
+def generate_numpy_compressed() -> Annotated[np.ndarray, kwtypes(compression="gzip")]:
+    return np.zeros(1000)
+
+
+def test_compressed():
+    @workflow
+    def wf() -> float:
+        return t4(array=generate_numpy_compressed())
+
+    assert wf() == 1000